@@ -0,0 +1,112 @@
+"""Throughput and peak memory of BulkImporter vs loading a whole file at once.
+
+Writes a synthetic NDJSON file of ``UserCreateModel`` rows (1% invalid) and
+imports it. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_bulk_import.py --sizes 100000 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from pydantic import ValidationError
+
+from sverse_generic_models.bulk_import import BulkImporter, read_ndjson
+from userverse_models import UserCreateModel
+
+
+def write_file(path: str, size: int) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        for i in range(size):
+            phone = "not-a-phone" if i % 100 == 99 else f"+1202555{i % 10000:04d}"
+            row = {"first_name": f"First{i}", "last_name": f"Last{i}"}
+            row["phone_number"] = phone
+            handle.write(json.dumps(row) + "\n")
+
+
+def load_all(path: str) -> Tuple[int, int]:
+    """Baseline: parse every line, then validate every row into one list."""
+    with open(path, "rb") as handle:
+        rows = [json.loads(line) for line in handle]
+    records, errors = [], []
+    for number, row in enumerate(rows, 1):
+        try:
+            records.append(UserCreateModel.model_validate(row))
+        except ValidationError as exc:
+            errors.append((number, str(exc)))
+    return len(records), len(errors)
+
+
+def pipeline(path: str, chunk_size: int, max_pending: int) -> Tuple[int, int]:
+    """Stream the file through BulkImporter, keeping no chunk after use."""
+
+    async def run() -> Tuple[int, int]:
+        importer = BulkImporter(
+            UserCreateModel, chunk_size=chunk_size, max_pending=max_pending
+        )
+        async for _ in importer.chunks(read_ndjson(path)):
+            pass
+        stats = importer.stats()
+        return stats.valid, stats.invalid
+
+    return asyncio.run(run())
+
+
+def profile(func: Callable[[], Tuple[int, int]], memory: bool) -> tuple:
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    counts = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if memory else 0
+    if memory:
+        tracemalloc.stop()
+    return counts, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    parser.add_argument("--max-pending", type=int, default=4)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc, which slows both modes down",
+    )
+    args = parser.parse_args()
+    memory = not args.no_memory
+
+    print(
+        f"{'mode':<14} {'rows':>9} {'valid':>9} {'invalid':>8} "
+        f"{'seconds':>8} {'rows/s':>9} {'peak MiB':>9}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            path = os.path.join(directory, f"users-{size}.ndjson")
+            write_file(path, size)
+            cases = (
+                ("load_all", lambda path=path: load_all(path)),
+                (
+                    "BulkImporter",
+                    lambda path=path: pipeline(path, args.chunk_size, args.max_pending),
+                ),
+            )
+            for label, func in cases:
+                (valid, invalid), elapsed, peak = profile(func, memory)
+                peak_text = f"{peak / 2**20:>9.1f}" if memory else f"{'-':>9}"
+                print(
+                    f"{label:<14} {size:>9} {valid:>9} {invalid:>8} "
+                    f"{elapsed:>8.2f} {size / elapsed:>9.0f} {peak_text}"
+                )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
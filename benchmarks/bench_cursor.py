@@ -0,0 +1,29 @@
+"""Cursor encode/decode cost compared with building an offset page's params.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_cursor.py
+"""
+
+import harness
+
+from sverse_generic_models import CursorCodec, PaginationParams
+
+CODEC = CursorCodec(b"benchmark-secret")
+SINGLE = CODEC.encode([123456], scope="users:id")
+COMPOSITE = CODEC.encode(["2025-01-01T00:00:00+00:00", 123456], scope="users:ts,id")
+
+CASES = {
+    "encode single key": lambda: CODEC.encode([123456], scope="users:id"),
+    "decode single key": lambda: CODEC.decode(SINGLE, "users:id"),
+    "encode composite key": lambda: CODEC.encode(
+        ["2025-01-01T00:00:00+00:00", 123456], scope="users:ts,id"
+    ),
+    "decode composite key": lambda: CODEC.decode(COMPOSITE, "users:ts,id"),
+    "PaginationParams + offset() (reference)": lambda: PaginationParams(
+        limit=20, page=5
+    ).offset(),
+}
+
+if __name__ == "__main__":
+    harness.main(CASES, __doc__.splitlines()[0])
@@ -0,0 +1,69 @@
+"""Per-row ``model_validate`` loop vs cached-TypeAdapter bulk decoding.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_decoding.py --sizes 100 10000 100000 --repeat 1
+"""
+
+import argparse
+import sys
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+import harness
+from payloads import ROW_FACTORIES
+
+from sverse_generic_models import PaginatedResponse, PaginationMeta, PaginationParams
+from sverse_generic_models.decoding import decode_paginated, decode_records
+
+
+def as_attribute_rows(rows: List[dict]) -> List[SimpleNamespace]:
+    """Mimic ORM rows: plain objects exposing columns as attributes."""
+    converted = []
+    for row in rows:
+        fields = {
+            key: SimpleNamespace(**value) if isinstance(value, dict) else value
+            for key, value in row.items()
+        }
+        converted.append(SimpleNamespace(**fields))
+    return converted
+
+
+def build_cases(sizes: List[int]) -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    for model, factory in ROW_FACTORIES.items():
+        for size in sizes:
+            # Past the API's limit cap, so each page holds all ``size`` rows.
+            params = PaginationParams.model_construct(limit=size, page=1)
+            rows = as_attribute_rows([factory(i) for i in range(size)])
+            name = f"{model.__name__} x{size}"
+
+            def loop(model=model, rows=rows, size=size, params=params):
+                records = [model.model_validate(r, from_attributes=True) for r in rows]
+                return PaginatedResponse[model](
+                    records=records,
+                    pagination=PaginationMeta.from_params(params, size),
+                )
+
+            cases[f"{name} per-row loop"] = loop
+            cases[f"{name} decode_records"] = (
+                lambda model=model, rows=rows: decode_records(model, rows)
+            )
+            cases[f"{name} decode_paginated"] = (
+                lambda model=model, rows=rows, size=size, params=params: (
+                    decode_paginated(model, rows, params, size)
+                )
+            )
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000])
+    args = parser.parse_args()
+    sys.exit(harness.run(build_cases(args.sizes), args))
+
+
+if __name__ == "__main__":
+    main()
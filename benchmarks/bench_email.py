@@ -0,0 +1,72 @@
+"""Email validation: pydantic.EmailStr vs the memoized EmailStr and batch API.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_email.py --sizes 100 1000
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, List
+
+import harness
+from pydantic import BaseModel
+from pydantic import EmailStr as PydanticEmailStr
+
+from sverse_validators.batch import validate_emails
+from sverse_validators.email_address import email_cache
+from userverse_models import UserLoginModel
+
+
+class PydanticLoginModel(BaseModel):
+    """UserLoginModel as it was declared with ``pydantic.EmailStr``."""
+
+    email: PydanticEmailStr
+    password: str
+
+
+def build_cases(sizes: List[int]) -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    for size in sizes:
+        # A login flood: the same accounts retry, with some invalid input.
+        logins = [
+            {
+                "email": f"user.{i}@example.com" if i % 10 else "bad-email",
+                "password": "x",
+            }
+            for i in range(size)
+        ]
+        emails = [login["email"] for login in logins]
+
+        def validate_all(model, rows=logins) -> None:
+            for row in rows:
+                try:
+                    model.model_validate(row)
+                except ValueError:
+                    pass
+
+        def cold(rows=logins) -> None:
+            email_cache.clear()
+            validate_all(UserLoginModel, rows)
+
+        cases[f"x{size} logins pydantic.EmailStr"] = lambda v=validate_all: v(
+            PydanticLoginModel
+        )
+        cases[f"x{size} logins EmailStr cold cache"] = cold
+        cases[f"x{size} logins EmailStr warm cache"] = lambda v=validate_all: v(
+            UserLoginModel
+        )
+        cases[f"x{size} validate_emails"] = lambda e=emails: validate_emails(e)
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000])
+    args = parser.parse_args()
+    sys.exit(harness.run(build_cases(args.sizes), args))
+
+
+if __name__ == "__main__":
+    main()
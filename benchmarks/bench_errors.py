@@ -0,0 +1,54 @@
+"""Error response bodies: building AppErrorResponseModel vs the error catalog.
+
+Times producing the JSON body of a static error (invalid credentials) and a
+parametrized one (role not found), per call as a handler would. Errors per
+second is ``1e6 / us``. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_errors.py
+"""
+
+from typing import Callable, Dict
+
+import harness
+
+from sverse_generic_models.app_error import (
+    AppErrorResponseModel,
+    DetailModel,
+    error_catalog,
+)
+from userverse_models.errors import INVALID_CREDENTIALS, ROLE_NOT_FOUND
+
+
+def build_static() -> bytes:
+    detail = DetailModel(
+        message="Invalid email or password.", error="invalid_credentials"
+    )
+    return AppErrorResponseModel(detail=detail).model_dump_json().encode()
+
+
+def build_role_not_found(role_name: str) -> bytes:
+    detail = DetailModel(
+        message=f"Role '{role_name}' was not found.", error="role_not_found"
+    )
+    return AppErrorResponseModel(detail=detail).model_dump_json().encode()
+
+
+def build_cases() -> Dict[str, Callable[[], object]]:
+    assert build_static() == INVALID_CREDENTIALS.render()
+    assert build_role_not_found("Ops") == ROLE_NOT_FOUND.render(role_name="Ops")
+    return {
+        "static model + model_dump_json": build_static,
+        "static CatalogError.render": INVALID_CREDENTIALS.render,
+        "static error_catalog.render(code)": lambda: error_catalog.render(
+            "invalid_credentials"
+        ),
+        "template model + model_dump_json": lambda: build_role_not_found("Ops"),
+        "template CatalogError.render": lambda: ROLE_NOT_FOUND.render(role_name="Ops"),
+        "template error_catalog.render(code)": lambda: error_catalog.render(
+            "role_not_found", role_name="Ops"
+        ),
+    }
+
+
+if __name__ == "__main__":
+    harness.main(build_cases(), __doc__.splitlines()[0])
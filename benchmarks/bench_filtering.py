@@ -0,0 +1,69 @@
+"""Hand-written filtering vs compiled filter plans over Read models.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_filtering.py --sizes 1000 10000
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, List
+
+import harness
+from payloads import company_user_read
+
+from sverse_generic_models.filtering import _cached_plan, compile_filter
+from userverse_models import CompanyUserReadModel, UserQueryParams
+
+
+def _hand_written(params: UserQueryParams, users: List[CompanyUserReadModel]):
+    """Filtering as services write it: re-inspect params for every record."""
+    result = []
+    for user in users:
+        keep = True
+        for name in ("role_name", "first_name", "last_name", "email"):
+            needle = getattr(params, name)
+            if needle is None:
+                continue
+            value = getattr(user, name, None)
+            if value is None or needle.lower() not in value.lower():
+                keep = False
+                break
+        if keep:
+            result.append(user)
+    return result
+
+
+def build_cases(sizes: List[int]) -> Dict[str, Callable[[], object]]:
+    params = UserQueryParams(first_name="first1", email="example.com", page=2)
+
+    def cold_compile() -> None:
+        _cached_plan.cache_clear()
+        compile_filter(params).where()
+
+    cases: Dict[str, Callable[[], object]] = {
+        "compile_filter cold": cold_compile,
+        "compile_filter cached": lambda: compile_filter(params).where(),
+    }
+    for size in sizes:
+        users = [
+            CompanyUserReadModel.model_validate(company_user_read(i))
+            for i in range(size)
+        ]
+        cases[f"x{size} hand-written loop"] = lambda u=users: _hand_written(params, u)
+        cases[f"x{size} compiled filter"] = lambda u=users: compile_filter(
+            params
+        ).filter(u)
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    args = parser.parse_args()
+    sys.exit(harness.run(build_cases(args.sizes), args))
+
+
+if __name__ == "__main__":
+    main()
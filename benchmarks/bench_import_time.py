@@ -0,0 +1,76 @@
+"""Measure cold import cost of the shared packages and fail on regressions.
+
+Each target is imported in a fresh interpreter with ``-X importtime``; the
+median cumulative time over several runs is compared with its budget.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_import_time.py
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+# Budgets in milliseconds of cumulative import time (including pydantic where
+# the module defines models). Package roots must stay cheap because their
+# exports are lazy; model modules must not pull in phonenumbers or
+# email_validator.
+BUDGETS_MS: Dict[str, float] = {
+    "sverse_generic_models": 40,
+    "sverse_validators": 40,
+    "userverse_models": 40,
+    "sverse_generic_models.app_error": 350,
+    "sverse_generic_models.generic_pagination": 350,
+    "sverse_validators.phone_number": 60,
+    "userverse_models.company.roles": 350,
+    "userverse_models.user.user": 400,
+    "userverse_models.company.company": 400,
+}
+
+
+def cumulative_import_us(module: str) -> int:
+    """Return the cumulative import time of ``module`` in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        _, _, rest = line.partition("import time:")
+        fields = [field.strip() for field in rest.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"no importtime entry for {module!r}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget, e.g. 2.0 on slow CI runners",
+    )
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'module':<42} {'median ms':>10} {'budget ms':>10}")
+    for module, budget in BUDGETS_MS.items():
+        samples = [cumulative_import_us(module) for _ in range(args.runs)]
+        median_ms = statistics.median(samples) / 1000
+        limit = budget * args.scale
+        status = "" if median_ms <= limit else "  REGRESSION"
+        failures += bool(status)
+        print(f"{module:<42} {median_ms:>10.1f} {limit:>10.1f}{status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
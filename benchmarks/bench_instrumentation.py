@@ -0,0 +1,101 @@
+"""Overhead of validation instrumentation when disabled and enabled.
+
+Times each case three ways:
+
+- ``baseline``: instrumentation disabled; validator cases call the
+  undecorated function (``__wrapped__``)
+- ``disabled``: after an enable/disable cycle, through the decorated
+  validators and the restored model methods
+- ``enabled``: recording into the default ``InMemorySink``
+
+The modes alternate for ``--rounds`` rounds and the best time per mode is
+kept, so drift on a busy machine does not land on one mode. It prints the
+per-call cost and the overhead against the baseline, followed by the sink's
+report. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_instrumentation.py
+"""
+
+import argparse
+from typing import Callable, Dict
+
+import harness
+from payloads import user_read
+
+from sverse_validators.email_address import validate_email_address
+from sverse_validators.instrumentation import (
+    disable_instrumentation,
+    enable_instrumentation,
+)
+from sverse_validators.phone_number import validate_phone_number_format
+from userverse_models import RoleDeleteModel, UserCreateModel, UserReadModel
+from userverse_models.schemas import shipped_models
+
+MODES = ("baseline", "disabled", "enabled")
+
+
+def build_cases(mode: str) -> Dict[str, Callable[[], object]]:
+    phone = validate_phone_number_format
+    email = validate_email_address
+    if mode == "baseline":
+        phone = phone.__wrapped__
+        email = email.__wrapped__
+    user = UserReadModel(**user_read(1))
+    create = {"first_name": "Ada", "phone_number": "+12025550123"}
+    delete = {"replacement_role_name": "Viewer", "role_name_to_delete": "Ops"}
+    return {
+        "validate_phone_number_format (cached)": lambda: phone("+12025550123"),
+        "validate_email_address (cached)": lambda: email("user.1@example.com"),
+        "RoleDeleteModel.model_validate": lambda: RoleDeleteModel.model_validate(
+            delete
+        ),
+        "UserCreateModel.model_validate": lambda: UserCreateModel.model_validate(
+            create
+        ),
+        "UserReadModel(**data)": lambda: UserReadModel(**user_read(1)),
+        "UserReadModel.model_dump_json": user.model_dump_json,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    sink = None
+    for _ in range(args.rounds):
+        for mode in MODES:
+            if mode == "disabled":
+                enable_instrumentation(models=shipped_models())
+                disable_instrumentation()
+            elif mode == "enabled":
+                sink = enable_instrumentation(models=shipped_models())
+            for name, func in build_cases(mode).items():
+                if args.filter and args.filter not in name:
+                    continue
+                func()  # warm caches
+                seconds = harness.measure(func, args.repeat, args.min_time)
+                best = results.setdefault(name, {}).get(mode, seconds)
+                results[name][mode] = min(best, seconds)
+            disable_instrumentation()
+
+    print(
+        f"{'case':<42} {'baseline us':>12} {'disabled us':>12} {'overhead':>9} "
+        f"{'enabled us':>11} {'overhead':>9}"
+    )
+    for name, timings in results.items():
+        base = timings["baseline"]
+        print(
+            f"{name:<42} {base * 1e6:>12.3f} {timings['disabled'] * 1e6:>12.3f} "
+            f"{timings['disabled'] / base - 1:>9.1%} "
+            f"{timings['enabled'] * 1e6:>11.3f} {timings['enabled'] / base - 1:>9.1%}"
+        )
+    if sink is not None:
+        print()
+        print(sink.report())
+
+
+if __name__ == "__main__":
+    main()
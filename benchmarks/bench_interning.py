@@ -0,0 +1,67 @@
+"""Retained memory and decode time of Read models and their interned variants.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_interning.py --sizes 10000 100000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from payloads import company_read, company_user_read
+
+from sverse_generic_models.decoding import records_adapter
+from sverse_validators.interning import InternTable, interned_model
+from userverse_models import CompanyReadModel, CompanyUserReadModel
+
+
+def decode(model, rows, table=None):
+    if table is None:
+        return records_adapter(model).validate_python(rows)
+    context = {"intern_strings": table}
+    return records_adapter(interned_model(model)).validate_python(rows, context=context)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    args = parser.parse_args()
+
+    print(
+        f"{'model':<22} {'rows':>8} {'mode':<10} {'retained MiB':>13} "
+        f"{'seconds':>8} {'hit rate':>9}"
+    )
+    for model, factory in (
+        (CompanyUserReadModel, company_user_read),
+        (CompanyReadModel, company_read),
+    ):
+        for size in args.sizes:
+            payload = json.dumps([factory(i) for i in range(size)])
+            for mode in ("plain", "interned"):
+                table = InternTable() if mode == "interned" else None
+                gc.collect()
+                tracemalloc.start()
+                # Like rows from a database driver, every value is a separate
+                # string object. (validate_json already caches short strings.)
+                rows = json.loads(payload)
+                start = time.perf_counter()
+                records = decode(model, rows, table)
+                elapsed = time.perf_counter() - start
+                # Count what the models keep alive once the rows are gone.
+                del rows
+                gc.collect()
+                held = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+                rate = f"{table.info().hit_rate:>9.1%}" if table else f"{'-':>9}"
+                print(
+                    f"{model.__name__:<22} {size:>8} {mode:<10} "
+                    f"{held / 2**20:>13.2f} {elapsed:>8.2f} {rate}"
+                )
+                del records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Validation, serialization and JSON schema benchmarks for every shared model.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_models.py --save baseline.json
+    PYTHONPATH=src python benchmarks/bench_models.py --compare baseline.json
+"""
+
+from typing import Any, Callable, Dict, Type
+
+from pydantic import BaseModel
+
+import harness
+from payloads import MODEL_SAMPLES, paginated_samples
+
+
+def model_cases(
+    name: str, model: Type[BaseModel], payload: Dict[str, Any]
+) -> Dict[str, Callable[[], object]]:
+    """Build the validate/dump cases for one model and payload."""
+    instance = model.model_validate(payload)
+    raw_json = instance.model_dump_json()
+    return {
+        f"{name}.model_validate": lambda: model.model_validate(payload),
+        f"{name}.model_validate_json": lambda: model.model_validate_json(raw_json),
+        f"{name}.model_dump": instance.model_dump,
+        f"{name}.model_dump_json": instance.model_dump_json,
+    }
+
+
+def build_cases() -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    for name, (model, payload) in {**MODEL_SAMPLES, **paginated_samples()}.items():
+        cases.update(model_cases(name, model, payload))
+    for name, (model, _) in MODEL_SAMPLES.items():
+        cases[f"{name}.model_json_schema"] = model.model_json_schema
+    return cases
+
+
+if __name__ == "__main__":
+    harness.main(build_cases(), __doc__.splitlines()[0])
@@ -0,0 +1,101 @@
+"""Write amplification of whole-row and sent-field updates vs compute_changeset.
+
+Replays a realistic PATCH mix against stored companies:
+
+- 40% forms resubmitted unchanged
+- 30% forms resubmitted with one field changed
+- 20% sparse single-field updates
+- 10% updates moving the company to another city
+
+It reports rows and columns written, cache invalidations and the CPU time
+per update of each strategy. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_patch.py --updates 10000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from payloads import CITIES, company_read
+
+from sverse_generic_models.patch import compute_changeset
+from userverse_models import CompanyAddressModel, CompanyReadModel, CompanyUpdateModel
+
+FORM_FIELDS = ("name", "description", "industry", "phone_number", "address")
+
+
+def build_mix(count: int, seed: int = 7) -> List[Tuple[CompanyReadModel, Any]]:
+    rng = random.Random(seed)
+    pairs = []
+    for i in range(count):
+        current = CompanyReadModel(**company_read(i))
+        form = {name: getattr(current, name) for name in FORM_FIELDS}
+        roll = rng.random()
+        if roll < 0.4:
+            update = CompanyUpdateModel(**form)
+        elif roll < 0.7:
+            form["description"] = f"Updated description {i}"
+            update = CompanyUpdateModel(**form)
+        elif roll < 0.9:
+            update = CompanyUpdateModel(name=f"Renamed {i}")
+        else:
+            city = CITIES[(CITIES.index(current.address.city) + 1) % len(CITIES)]
+            update = CompanyUpdateModel(address=CompanyAddressModel(city=city))
+        pairs.append((current, update))
+    return pairs
+
+
+def whole_row(current: CompanyReadModel, update: CompanyUpdateModel) -> Dict:
+    """Baseline: merge the update and rewrite every column of the row."""
+    row = current.model_dump(exclude={"id"})
+    row.update(update.model_dump(exclude_unset=True))
+    return row
+
+
+def sent_fields(current: CompanyReadModel, update: CompanyUpdateModel) -> Dict:
+    """Write every field the client sent, changed or not."""
+    return update.model_dump(exclude_unset=True)
+
+
+def changeset(current: CompanyReadModel, update: CompanyUpdateModel) -> Dict:
+    return compute_changeset(current, update).columns()
+
+
+def count_columns(columns: Dict[str, Any]) -> int:
+    return sum(
+        len(value) if isinstance(value, dict) else 1 for value in columns.values()
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=10_000)
+    args = parser.parse_args()
+    pairs = build_mix(args.updates)
+
+    strategies: List[Tuple[str, Callable[..., Dict]]] = [
+        ("whole row", whole_row),
+        ("sent fields", sent_fields),
+        ("compute_changeset", changeset),
+    ]
+    print(
+        f"{'strategy':<20} {'updates':>8} {'rows':>8} {'columns':>9} "
+        f"{'invalidations':>14} {'us/update':>10}"
+    )
+    for label, strategy in strategies:
+        start = time.perf_counter()
+        results = [strategy(current, update) for current, update in pairs]
+        elapsed = time.perf_counter() - start
+        rows = sum(1 for columns in results if columns)
+        columns = sum(count_columns(columns) for columns in results)
+        # A cache entry is invalidated for every row that is written.
+        print(
+            f"{label:<20} {len(pairs):>8} {rows:>8} {columns:>9} {rows:>14} "
+            f"{elapsed / len(pairs) * 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
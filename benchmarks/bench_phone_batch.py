@@ -0,0 +1,74 @@
+"""Compare one-at-a-time phone validation with the bulk API.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_phone_batch.py --sizes 1000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import time
+
+from sverse_validators.batch import validate_phone_numbers
+from sverse_validators.phone_number import normalize_phone_number
+
+TEMPLATES = [
+    "+1 202-555-{:04d}",
+    "+12025550{:03d}",
+    "+44 20 7946 {:04d}",
+    "+27 21 555 {:04d}",
+    "+49 30 901820{:02d}",
+    "({:03d}) 555",
+]
+
+
+def make_inputs(size: int, duplicate_ratio: float, seed: int = 7) -> list:
+    """Build ``size`` raw numbers where roughly ``duplicate_ratio`` repeat."""
+    rng = random.Random(seed)
+    unique_count = max(1, int(size * (1 - duplicate_ratio)))
+    pool = [
+        rng.choice(TEMPLATES).format(rng.randrange(100)) + str(i)[-2:]
+        for i in range(unique_count)
+    ]
+    return [rng.choice(pool) for _ in range(size)]
+
+
+def one_at_a_time(phones: list) -> None:
+    for phone in phones:
+        try:
+            normalize_phone_number(phone)
+        except ValueError:
+            pass
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--duplicates", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'loop s':>9} {'batch s':>9} {'parallel s':>11} {'speedup':>8}")
+    for size in args.sizes:
+        phones = make_inputs(size, args.duplicates)
+        loop = timed(one_at_a_time, phones)
+        batch = timed(validate_phone_numbers, phones)
+        parallel = timed(
+            validate_phone_numbers, phones, workers=args.workers, parallel_threshold=1
+        )
+        best = min(batch, parallel)
+        print(
+            f"{size:>9} {loop:>9.3f} {batch:>9.3f} {parallel:>11.3f} "
+            f"{loop / best:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
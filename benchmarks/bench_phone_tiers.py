@@ -0,0 +1,62 @@
+"""Microbenchmarks for each tier of the uncached phone number validator.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_phone_tiers.py
+"""
+
+import argparse
+import timeit
+from typing import Optional
+
+import phonenumbers
+
+from sverse_validators.phone_number import normalize_phone_number
+
+CASES = [
+    ("lexical reject (no digits)", "not-a-number", None),
+    ("lexical reject (no plus)", "2025550123", None),
+    ("canonical E.164", "+12025550123", None),
+    ("canonical E.164 (invalid)", "+12025550000", None),
+    ("formatted international", "+1 202-555-0123", None),
+    ("local with region hint", "082 123 4567", "ZA"),
+]
+
+
+def parse_every_time(phone: str, region: Optional[str]) -> Optional[str]:
+    """The pre-tiering implementation, kept here as the baseline."""
+    try:
+        parsed = phonenumbers.parse(phone, region)
+        if not phonenumbers.is_valid_number(parsed):
+            raise ValueError("Invalid phone number.")
+    except phonenumbers.NumberParseException as exc:
+        raise ValueError("Invalid phone number format.") from exc
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
+def per_call_us(func, phone: str, region: Optional[str], number: int) -> float:
+    def call():
+        try:
+            func(phone, region)
+        except ValueError:
+            pass
+
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'tier':<28} {'baseline us':>12} {'tiered us':>10} {'speedup':>8}")
+    for label, phone, region in CASES:
+        baseline = per_call_us(parse_every_time, phone, region, args.number)
+        tiered = per_call_us(normalize_phone_number, phone, region, args.number)
+        print(
+            f"{label:<28} {baseline:>12.2f} {tiered:>10.2f} {baseline / tiered:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
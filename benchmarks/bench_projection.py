@@ -0,0 +1,123 @@
+"""Payload size and serialization time of sparse fieldsets vs full models.
+
+Compares the full ``model_dump_json``, ``model_dump_json(include=...)`` and
+the cached ``Projection`` (alone, and including parsing ``fields`` from the
+query params) for the fieldsets mobile clients ask for, on single records and
+on ``PaginatedResponse`` pages. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_projection.py --sizes 100 1000
+"""
+
+import argparse
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+import harness
+from payloads import company_read, pagination_meta, user_read
+
+from pydantic import BaseModel
+
+from sverse_generic_models.generic_pagination import PaginatedResponse
+from sverse_generic_models.projection import get_projection
+from userverse_models import (
+    CompanyQueryParamsModel,
+    UserQueryParams,
+    UserReadModel,
+)
+
+# (label, query params model, row factory, requested fields, the include spec
+# a handler would pass to model_dump_json without projections)
+FIELDSETS = [
+    (
+        "user id,first_name,email",
+        UserQueryParams,
+        user_read,
+        "id,first_name,email",
+        {"id", "first_name", "email"},
+    ),
+    (
+        "company id,name",
+        CompanyQueryParamsModel,
+        company_read,
+        "id,name",
+        {"id", "name"},
+    ),
+    (
+        "company id,name,address.city",
+        CompanyQueryParamsModel,
+        company_read,
+        "id,name,address.city",
+        {"id": True, "name": True, "address": {"city"}},
+    ),
+]
+
+Sample = Tuple[str, BaseModel, str, type, Any]
+
+
+def samples(sizes: List[int]) -> List[Sample]:
+    values: List[Sample] = []
+    for label, params_model, factory, fields, include in FIELDSETS:
+        model = params_model.projection_model
+        values.append((label, model(**factory(1)), fields, params_model, include))
+        page_include = {"records": {"__all__": include}, "pagination": True}
+        for size in sizes:
+            page = PaginatedResponse[model](
+                records=[factory(i) for i in range(size)],
+                pagination=pagination_meta(size, limit=size),
+            )
+            values.append(
+                (f"{label} page x{size}", page, fields, params_model, page_include)
+            )
+    return values
+
+
+def project(value: BaseModel, fields: str, params_model: type) -> bytes:
+    """Parse the query's fields and serialize, as a handler would per request."""
+    projection = params_model(fields=fields).projection()
+    if isinstance(value, PaginatedResponse):
+        return projection.dump_json_page(value)
+    return projection.dump_json(value)
+
+
+def build_cases(values: List[Sample]) -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    for label, value, fields, params_model, include in values:
+        projection = params_model(fields=fields).projection()
+        if isinstance(value, PaginatedResponse):
+            dump = projection.dump_json_page
+        else:
+            dump = projection.dump_json
+        cases[f"{label} full model_dump_json"] = value.model_dump_json
+        cases[f"{label} model_dump_json(include=...)"] = (
+            lambda value=value, include=include: value.model_dump_json(include=include)
+        )
+        cases[f"{label} cached Projection"] = lambda dump=dump, value=value: dump(value)
+        cases[f"{label} Projection incl. params"] = (
+            lambda value=value, fields=fields, params_model=params_model: project(
+                value, fields, params_model
+            )
+        )
+    cases["get_projection lookup"] = lambda: get_projection(
+        UserReadModel, ("id", "first_name", "email")
+    )
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+
+    values = samples(args.sizes)
+    print(f"{'payload':<46} {'full bytes':>11} {'sparse bytes':>13} {'ratio':>6}")
+    for label, value, fields, params_model, _ in values:
+        full = len(value.model_dump_json())
+        sparse = len(project(value, fields, params_model))
+        print(f"{label:<46} {full:>11} {sparse:>13} {sparse / full:>6.2f}")
+    print()
+    sys.exit(harness.run(build_cases(values), args))
+
+
+if __name__ == "__main__":
+    main()
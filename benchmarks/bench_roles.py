@@ -0,0 +1,64 @@
+"""Role lookups and permission checks: enum properties vs the role registry.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_roles.py
+"""
+
+from typing import Callable, Dict
+
+import harness
+
+from userverse_models.company.role_registry import Permission, RoleRegistry
+from userverse_models.company.roles import CompanyDefaultRoles
+from userverse_models.company.user import CompanyUserReadModel
+
+# Permission checks as services wrote them before the registry existed.
+_MANAGE_USER_ROLES = ("Administrator",)
+
+
+def _enum_lookup(name: str) -> CompanyDefaultRoles:
+    for role in CompanyDefaultRoles:
+        if role.value.split(":")[0].strip() == name:
+            return role
+    raise KeyError(name)
+
+
+def _string_can_manage(user: CompanyUserReadModel) -> bool:
+    return user.role_name in _MANAGE_USER_ROLES
+
+
+def build_cases() -> Dict[str, Callable[[], object]]:
+    registry = RoleRegistry()
+    registry.register("Manager", ["view_users", "manage_users"], company_id=7)
+    viewer = CompanyUserReadModel(id=1, email="v@example.com", role_name="Viewer")
+    manager = CompanyUserReadModel(id=2, email="m@example.com", role_name="Manager")
+    names = [role.value.split(":")[0].strip() for role in CompanyDefaultRoles]
+
+    def split_properties() -> None:
+        for role in CompanyDefaultRoles:
+            role.value.split(":")[0].strip()
+            role.value.split(":", 1)[1].strip()
+
+    def cached_properties() -> None:
+        for role in CompanyDefaultRoles:
+            role.name_value
+            role.description
+
+    return {
+        "name/description split per access": split_properties,
+        "name/description precomputed": cached_properties,
+        "default role by name enum scan": lambda: [_enum_lookup(n) for n in names],
+        "default role by name registry": lambda: [registry.get(n) for n in names],
+        "can manage users string compare": lambda: _string_can_manage(viewer),
+        "can manage users registry default": lambda: registry.can(
+            viewer, Permission.MANAGE_USERS
+        ),
+        "can manage users registry custom": lambda: registry.can(
+            manager, Permission.MANAGE_USERS, 7
+        ),
+    }
+
+
+if __name__ == "__main__":
+    harness.main(build_cases(), __doc__.splitlines()[0])
@@ -0,0 +1,61 @@
+"""Cold JSON schema generation vs the cached schema registry and artifacts.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_schema.py
+"""
+
+import os
+import tempfile
+from typing import Callable, Dict
+
+import harness
+
+from sverse_generic_models.schema_registry import MODES, SchemaRegistry
+from userverse_models.schemas import shipped_models
+
+
+def _registry() -> SchemaRegistry:
+    registry = SchemaRegistry()
+    registry.register(*shipped_models())
+    return registry
+
+
+def build_cases(artifact_path: str) -> Dict[str, Callable[[], object]]:
+    models = shipped_models()
+    warm = _registry()
+    warm.warm()
+    warm.write_artifact(artifact_path)
+
+    def cold() -> None:
+        for model in models:
+            for mode in MODES:
+                model.model_json_schema(mode=mode)
+
+    def cached() -> None:
+        for model in models:
+            for mode in MODES:
+                warm.schema(model, mode)
+
+    def from_artifact() -> None:
+        _registry().load_artifact(artifact_path)
+
+    return {
+        f"{len(models)} models model_json_schema": cold,
+        f"{len(models)} models SchemaRegistry warm": lambda: _registry().warm(),
+        f"{len(models)} models SchemaRegistry cached": cached,
+        f"{len(models)} models load_artifact": from_artifact,
+    }
+
+
+def main() -> None:
+    handle, path = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    try:
+        harness.main(build_cases(path), __doc__.splitlines()[0])
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
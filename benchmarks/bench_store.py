@@ -0,0 +1,77 @@
+"""IndexedStore lookups vs list scans over CompanyUserReadModel records.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_store.py --sizes 10000 1000000
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, List
+
+import harness
+from payloads import company_user_read
+
+from sverse_generic_models import FilterLogic, MatchType
+from sverse_generic_models.filtering import compile_filter
+from sverse_generic_models.store import IndexedStore
+from sverse_generic_models.trusted import construct_trusted
+from userverse_models import CompanyUserReadModel, UserQueryParams
+
+INDEXES = ("role_name", "first_name", "last_name", "email")
+
+
+def _scan(records, params, match_type, logic=FilterLogic.AND):
+    """Linear scan as edge services do today: filter everything, then slice."""
+    matched = compile_filter(params, match_type, logic).filter(records)
+    start = params.offset()
+    return matched[start : start + params.limit], len(matched)
+
+
+def build_cases(sizes: List[int]) -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    queries = {
+        "email exact": (
+            UserQueryParams(email="user.4242@example.com"),
+            MatchType.EXACT,
+        ),
+        "last_name prefix": (
+            UserQueryParams(last_name="last42"),
+            MatchType.STARTS_WITH,
+        ),
+        "role+first_name exact": (
+            UserQueryParams(role_name="viewer", first_name="first4243"),
+            MatchType.EXACT,
+        ),
+        "first_name partial": (UserQueryParams(first_name="st424"), MatchType.PARTIAL),
+    }
+    for size in sizes:
+        # Rows are trusted here: validating a million emails would dominate setup.
+        records = [
+            construct_trusted(CompanyUserReadModel, company_user_read(i))
+            for i in range(size)
+        ]
+        store = IndexedStore(CompanyUserReadModel, indexes=INDEXES)
+        store.upsert_many(records)
+        for name, (params, match_type) in queries.items():
+            cases[f"x{size} {name} list scan"] = (
+                lambda r=records, p=params, m=match_type: _scan(r, p, m)
+            )
+            cases[f"x{size} {name} IndexedStore"] = (
+                lambda s=store, p=params, m=match_type: s.query(p, m)
+            )
+        update = construct_trusted(CompanyUserReadModel, company_user_read(size // 2))
+        cases[f"x{size} upsert existing"] = lambda s=store, u=update: s.upsert(u)
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    args = parser.parse_args()
+    sys.exit(harness.run(build_cases(args.sizes), args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Peak memory and time of streamed vs fully built PaginatedResponse JSON.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_streaming.py --sizes 10000 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+from payloads import pagination_meta, user_read
+
+from sverse_generic_models import PaginatedResponse, PaginationMeta
+from sverse_generic_models.streaming import stream_ndjson, stream_paginated_json
+from userverse_models import UserReadModel
+
+
+def records(size: int) -> Iterator[UserReadModel]:
+    """Simulate rows fetched from a cursor, decoded one at a time."""
+    for i in range(size):
+        yield UserReadModel.model_construct(**user_read(i))
+
+
+def profile(func: Callable[[], int]) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    written = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return written, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'mode':<24} {'records':>9} {'bytes':>12} {'seconds':>8} {'peak MiB':>9}")
+    for size in args.sizes:
+        meta = PaginationMeta(**pagination_meta(size, limit=size))
+
+        def full() -> int:
+            response = PaginatedResponse[UserReadModel](
+                records=list(records(size)), pagination=meta
+            )
+            return len(response.model_dump_json())
+
+        def streamed() -> int:
+            return sum(
+                len(c)
+                for c in stream_paginated_json(UserReadModel, records(size), meta)
+            )
+
+        def ndjson() -> int:
+            return sum(
+                len(c) for c in stream_ndjson(UserReadModel, records(size), meta)
+            )
+
+        for label, func in (
+            ("model_dump_json", full),
+            ("stream_paginated_json", streamed),
+            ("stream_ndjson", ndjson),
+        ):
+            written, elapsed, peak = profile(func)
+            print(
+                f"{label:<24} {size:>9} {written:>12} {elapsed:>8.2f} "
+                f"{peak / 2**20:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Lax vs strict ``model_validate_json`` for single objects and large pages.
+
+Each payload is validated three ways: the shared (lax) model, the same model
+with ``strict=True`` passed per call, and its ``strict_model`` variant. Run
+from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_strict.py --sizes 100 1000
+"""
+
+import argparse
+import json
+import sys
+from typing import Callable, Dict, List
+
+import harness
+from payloads import company_read, paginated, user_read
+
+from sverse_generic_models import PaginatedResponse, strict_model
+from userverse_models import CompanyReadModel, UserReadModel
+
+FACTORIES = {UserReadModel: user_read, CompanyReadModel: company_read}
+
+
+def build_cases(sizes: List[int]) -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    payloads = []
+    for model, factory in FACTORIES.items():
+        payloads.append((model.__name__, model, json.dumps(factory(1))))
+        for size in sizes:
+            page = paginated([factory(i) for i in range(size)])
+            payloads.append(
+                (
+                    f"PaginatedResponse[{model.__name__}] x{size}",
+                    PaginatedResponse[model],
+                    json.dumps(page),
+                )
+            )
+    for name, model, body in payloads:
+        strict = strict_model(model)
+        cases[f"{name} lax"] = lambda model=model, body=body: (
+            model.model_validate_json(body)
+        )
+        cases[f"{name} strict=True"] = lambda model=model, body=body: (
+            model.model_validate_json(body, strict=True)
+        )
+        cases[f"{name} strict_model"] = lambda strict=strict, body=body: (
+            strict.model_validate_json(body)
+        )
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000])
+    args = parser.parse_args()
+    sys.exit(harness.run(build_cases(args.sizes), args))
+
+
+if __name__ == "__main__":
+    main()
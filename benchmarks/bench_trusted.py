@@ -0,0 +1,73 @@
+"""Trusted construction vs full validation for list endpoints.
+
+The validating cases clear the shared email cache before each call: every
+row of a listing normally carries a different address, and a cache kept
+warm by the timing loop would make validation look cheaper than it is. One
+warm-cache ``decode_records`` case is kept for reference. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_trusted.py --sizes 100 1000
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, List
+
+import harness
+from payloads import ROW_FACTORIES
+
+from sverse_generic_models.decoding import decode_records
+from sverse_generic_models.trusted import TrustedLoader, construct_trusted
+from sverse_validators.email_address import email_cache
+from userverse_models import CompanyReadModel, CompanyUserReadModel, UserReadModel
+
+
+def cold(func: Callable[[], object]) -> Callable[[], object]:
+    """Run ``func`` with an empty email cache."""
+
+    def call() -> object:
+        email_cache.clear()
+        return func()
+
+    return call
+
+
+def build_cases(sizes: List[int]) -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    for model in (UserReadModel, CompanyReadModel, CompanyUserReadModel):
+        factory = ROW_FACTORIES[model]
+        unsampled = TrustedLoader(model, sample_rate=0)
+        sampled = TrustedLoader(model, sample_rate=0.01)
+        for size in sizes:
+            rows = [factory(i) for i in range(size)]
+            name = f"{model.__name__} x{size}"
+            cases[f"{name} model_validate loop"] = cold(
+                lambda m=model, r=rows: [m.model_validate(row) for row in r]
+            )
+            cases[f"{name} decode_records"] = cold(
+                lambda m=model, r=rows: decode_records(m, r)
+            )
+            cases[f"{name} decode_records (warm email cache)"] = (
+                lambda m=model, r=rows: decode_records(m, r)
+            )
+            cases[f"{name} construct_trusted"] = lambda m=model, r=rows: [
+                construct_trusted(m, row) for row in r
+            ]
+            cases[f"{name} TrustedLoader 0%"] = lambda l=unsampled, r=rows: (
+                l.load_many(r)
+            )
+            cases[f"{name} TrustedLoader 1%"] = cold(
+                lambda l=sampled, r=rows: l.load_many(r)
+            )
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000])
+    args = parser.parse_args()
+    sys.exit(harness.run(build_cases(args.sizes), args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""First-request latency of generic responses with and without warm-up.
+
+Each run starts a fresh interpreter that imports the models and then serves
+one "request" per Read model and wrapper: build
+``GenericResponseModel[Model]`` / ``PaginatedResponse[Model]`` from plain
+data and call ``model_dump_json``. In ``warm`` runs
+``default_specializations().warm()`` is called at startup first. Both modes
+load the lazily imported phone and email libraries beforehand. The script
+prints the median first-call latency of both modes, the latency of a second
+call on different rows for reference, and what the warm-up itself cost. Run from the
+repository root:
+
+    PYTHONPATH=src python benchmarks/bench_warmup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+MODES = ("cold", "warm")
+
+
+def requests(offset: int) -> Dict[str, Callable[[], object]]:
+    from payloads import ROW_FACTORIES, pagination_meta
+
+    from sverse_generic_models import GenericResponseModel, PaginatedResponse
+
+    cases: Dict[str, Callable[[], object]] = {}
+    for model, factory in ROW_FACTORIES.items():
+        rows = [factory(i) for i in range(offset, offset + 20)]
+        cases[f"GenericResponseModel[{model.__name__}]"] = lambda model=model, row=rows[
+            0
+        ]: GenericResponseModel[model](message="ok", data=row).model_dump_json()
+        cases[
+            f"PaginatedResponse[{model.__name__}]"
+        ] = lambda model=model, rows=rows: PaginatedResponse[model](
+            records=rows, pagination=pagination_meta(len(rows), limit=20)
+        ).model_dump_json()
+    return cases
+
+
+def child(mode: str) -> None:
+    """Serve each request twice in this process and print timings as JSON."""
+    from sverse_validators import validate_email_address, validate_phone_number_format
+    from userverse_models.schemas import default_specializations
+
+    # The second call uses other rows so phone/email caches do not favour it.
+    calls = (requests(0), requests(20))
+    # Load phonenumbers/email_validator in both modes so the timings only
+    # differ by the specializations.
+    validate_phone_number_format("+12025550100")
+    validate_email_address("warm.up@example.com")
+    warm_up = 0.0
+    if mode == "warm":
+        start = time.perf_counter()
+        default_specializations().warm()
+        warm_up = time.perf_counter() - start
+    first: Dict[str, float] = {}
+    second: Dict[str, float] = {}
+    for name in calls[0]:
+        for timings, cases in zip((first, second), calls):
+            start = time.perf_counter()
+            cases[name]()
+            timings[name] = time.perf_counter() - start
+    json.dump({"warm_up": warm_up, "first": first, "second": second}, sys.stdout)
+
+
+def run_child(mode: str) -> Dict:
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child)
+        return
+
+    runs: Dict[str, List[Dict]] = {mode: [] for mode in MODES}
+    for _ in range(args.runs):
+        for mode in MODES:
+            runs[mode].append(run_child(mode))
+
+    def median_ms(mode: str, phase: str, name: str) -> float:
+        return statistics.median(run[phase][name] for run in runs[mode]) * 1e3
+
+    print(f"{'first request':<46} {'cold ms':>9} {'warm ms':>9} {'2nd call ms':>12}")
+    for name in runs["cold"][0]["first"]:
+        print(
+            f"{name:<46} {median_ms('cold', 'first', name):>9.3f} "
+            f"{median_ms('warm', 'first', name):>9.3f} "
+            f"{median_ms('cold', 'second', name):>12.3f}"
+        )
+    warm_up = statistics.median(run["warm_up"] for run in runs["warm"])
+    print(f"\nwarm-up at startup: {warm_up * 1e3:.1f} ms (median of {args.runs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Payload size and encode/decode time of WireCodec vs JSON.
+
+Prints the size of each payload, then times ``model_dump_json`` /
+``model_validate_json`` against ``WireCodec.encode`` / ``decode`` for the
+Read models alone, wrapped in ``GenericResponseModel`` and in
+``PaginatedResponse`` pages; pages are also decoded from keyed bodies. Run
+from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_wire_codec.py --sizes 100 1000
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, List, Tuple
+
+import harness
+from payloads import ROW_FACTORIES, pagination_meta
+
+from pydantic import BaseModel
+
+from sverse_generic_models import GenericResponseModel, PaginatedResponse
+from sverse_generic_models.wire_codec import get_wire_codec
+
+
+def samples(sizes: List[int]) -> List[Tuple[str, BaseModel]]:
+    values = []
+    for model, factory in ROW_FACTORIES.items():
+        values.append((model.__name__, model(**factory(1))))
+        wrapped = GenericResponseModel[model](message="ok", data=factory(1))
+        values.append((f"GenericResponseModel[{model.__name__}]", wrapped))
+        for size in sizes:
+            page = PaginatedResponse[model](
+                records=[factory(i) for i in range(size)],
+                pagination=pagination_meta(size, limit=size),
+            )
+            values.append((f"PaginatedResponse[{model.__name__}] x{size}", page))
+    return values
+
+
+def build_cases(values: List[Tuple[str, BaseModel]]) -> Dict[str, Callable[[], object]]:
+    cases: Dict[str, Callable[[], object]] = {}
+    for name, value in values:
+        model = type(value)
+        codec = get_wire_codec(model)
+        text = value.model_dump_json()
+        payload = codec.encode(value)
+        cases[f"{name} model_dump_json"] = value.model_dump_json
+        cases[f"{name} wire encode"] = lambda codec=codec, value=value: codec.encode(
+            value
+        )
+        cases[f"{name} model_validate_json"] = (
+            lambda model=model, text=text: model.model_validate_json(text)
+        )
+        cases[f"{name} wire decode"] = (
+            lambda codec=codec, payload=payload: codec.decode(payload)
+        )
+        if codec.positional:
+            keyed = codec.encode(value, positional=False)
+            cases[f"{name} wire decode (keyed body)"] = (
+                lambda codec=codec, keyed=keyed: codec.decode(keyed)
+            )
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+
+    values = samples(args.sizes)
+    print(f"{'payload':<52} {'json bytes':>11} {'wire bytes':>11} {'ratio':>6}")
+    for name, value in values:
+        json_size = len(value.model_dump_json())
+        wire_size = len(get_wire_codec(type(value)).encode(value))
+        print(
+            f"{name:<52} {json_size:>11} {wire_size:>11} "
+            f"{wire_size / json_size:>6.2f}"
+        )
+    print()
+    sys.exit(harness.run(build_cases(values), args))
+
+
+if __name__ == "__main__":
+    main()
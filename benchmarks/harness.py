@@ -0,0 +1,105 @@
+"""Timing, baseline storage and regression checks shared by the benchmarks."""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from importlib import metadata
+from typing import Callable, Dict
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the common ``--save``/``--compare`` options on ``parser``."""
+    parser.add_argument("--filter", default="", help="only run cases containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown vs the baseline before failing (0.25 = 25%%)",
+    )
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    """Return the best observed seconds per call of ``func``."""
+    timer = timeit.Timer(func)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        number *= 2
+    return min([elapsed, *timer.repeat(repeat - 1, number)]) / number
+
+
+def environment() -> Dict[str, str]:
+    """Describe the interpreter and library versions behind a result set."""
+    info = {"python": platform.python_version(), "machine": platform.machine()}
+    for package in ("pydantic", "pydantic-core", "shared-models"):
+        try:
+            info[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            info[package] = "unknown"
+    return info
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> int:
+    """Print the change per case and return the number of regressions."""
+    regressions = 0
+    print(f"\n{'case':<60} {'baseline us':>12} {'now us':>10} {'change':>8}")
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<60} {'-':>12} {seconds * 1e6:>10.2f} {'new':>8}")
+            continue
+        change = seconds / before - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        regressions += bool(flag)
+        print(
+            f"{name:<60} {before * 1e6:>12.2f} {seconds * 1e6:>10.2f} "
+            f"{change:>+7.0%}{flag}"
+        )
+    return regressions
+
+
+def run(cases: Dict[str, Callable[[], object]], args: argparse.Namespace) -> int:
+    """Time ``cases``, optionally save/compare baselines, and return an exit code."""
+    results = {}
+    for name, func in cases.items():
+        if args.filter not in name:
+            continue
+        results[name] = measure(func, args.repeat, args.min_time)
+        print(f"{name:<60} {results[name] * 1e6:>12.2f} us")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"environment": environment(), "results": results},
+                handle,
+                indent=2,
+                sort_keys=True,
+            )
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        if baseline.get("environment") != environment():
+            print("\nwarning: baseline was recorded in a different environment")
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(
+                f"\n{regressions} case(s) regressed by more than {args.threshold:.0%}"
+            )
+            return 1
+    return 0
+
+
+def main(cases: Dict[str, Callable[[], object]], description: str) -> None:
+    """Parse the common arguments, run ``cases`` and exit with the status."""
+    parser = argparse.ArgumentParser(description=description)
+    add_arguments(parser)
+    sys.exit(run(cases, parser.parse_args()))
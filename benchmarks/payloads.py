@@ -0,0 +1,191 @@
+"""Deterministic sample payloads for the shared models, used by the benchmarks."""
+
+from typing import Any, Dict, List, Tuple, Type
+
+from pydantic import BaseModel
+
+from sverse_generic_models import (
+    AppErrorResponseModel,
+    DetailModel,
+    GenericResponseModel,
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+)
+from userverse_models import (
+    CompanyAddressModel,
+    CompanyCreateModel,
+    CompanyQueryParamsModel,
+    CompanyReadModel,
+    CompanyUpdateModel,
+    CompanyUserAddModel,
+    CompanyUserReadModel,
+    OTPValidationRequest,
+    PasswordResetRequest,
+    RoleCreateModel,
+    RoleDeleteModel,
+    RoleQueryParamsModel,
+    RoleReadModel,
+    RoleUpdateModel,
+    TokenResponseModel,
+    UserCreateModel,
+    UserLoginModel,
+    UserQueryParams,
+    UserReadModel,
+    UserUpdateModel,
+)
+
+CITIES = ["Cape Town", "Johannesburg", "Durban", "London", "New York"]
+INDUSTRIES = ["Software", "Finance", "Retail", "Health"]
+ROLES = ["Administrator", "Viewer", "Manager"]
+
+
+def address(i: int = 0) -> Dict[str, Any]:
+    return {
+        "street": f"{i} Main St",
+        "city": CITIES[i % len(CITIES)],
+        "state": "CT",
+        "postal_code": f"{8000 + i % 100}",
+        "country": "South Africa",
+    }
+
+
+def user_read(i: int = 0) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "email": f"user.{i}@example.com",
+        "phone_number": f"+1202555{i % 10000:04d}",
+        "status": "active" if i % 5 else "pending",
+        "is_superuser": i % 50 == 0,
+    }
+
+
+def company_user_read(i: int = 0) -> Dict[str, Any]:
+    return {**user_read(i), "role_name": ROLES[i % len(ROLES)]}
+
+
+def company_read(i: int = 0) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "name": f"Company {i}",
+        "description": "A company used for benchmarking",
+        "industry": INDUSTRIES[i % len(INDUSTRIES)],
+        "phone_number": f"+2721555{i % 10000:04d}",
+        "email": f"info.{i}@example.com",
+        "address": address(i),
+    }
+
+
+def role_read(i: int = 0) -> Dict[str, Any]:
+    return {"name": f"Role {i}", "description": f"Role number {i}"}
+
+
+def pagination_meta(total: int, limit: int = 100, page: int = 1) -> Dict[str, Any]:
+    return {
+        "total_records": total,
+        "limit": limit,
+        "current_page": page,
+        "total_pages": max(1, -(-total // limit)),
+    }
+
+
+def paginated(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"records": records, "pagination": pagination_meta(len(records))}
+
+
+ROW_FACTORIES = {
+    UserReadModel: user_read,
+    CompanyUserReadModel: company_user_read,
+    CompanyReadModel: company_read,
+    RoleReadModel: role_read,
+}
+
+# One representative payload per concrete model shipped by the package.
+MODEL_SAMPLES: Dict[str, Tuple[Type[BaseModel], Dict[str, Any]]] = {
+    "UserLoginModel": (
+        UserLoginModel,
+        {"email": "user@example.com", "password": "secret"},
+    ),
+    "UserCreateModel": (
+        UserCreateModel,
+        {"first_name": "Ada", "last_name": "Lovelace", "phone_number": "+12025550123"},
+    ),
+    "UserUpdateModel": (
+        UserUpdateModel,
+        {"first_name": "Ada", "phone_number": "+12025550123", "password": "secret"},
+    ),
+    "UserReadModel": (UserReadModel, user_read(1)),
+    "TokenResponseModel": (
+        TokenResponseModel,
+        {
+            "access_token": "a" * 200,
+            "access_token_expiration": "2025-01-01 00:00:00",
+            "refresh_token": "r" * 200,
+            "refresh_token_expiration": "2025-01-02 00:00:00",
+        },
+    ),
+    "UserQueryParams": (
+        UserQueryParams,
+        {"limit": 20, "page": 2, "first_name": "Ada", "email": "example.com"},
+    ),
+    "PasswordResetRequest": (PasswordResetRequest, {"email": "user@example.com"}),
+    "OTPValidationRequest": (OTPValidationRequest, {"otp": "123456"}),
+    "CompanyAddressModel": (CompanyAddressModel, address(1)),
+    "CompanyReadModel": (CompanyReadModel, company_read(1)),
+    "CompanyCreateModel": (
+        CompanyCreateModel,
+        {k: v for k, v in company_read(1).items() if k != "id"},
+    ),
+    "CompanyUpdateModel": (
+        CompanyUpdateModel,
+        {"name": "Renamed", "phone_number": "+27215551234", "address": address(2)},
+    ),
+    "CompanyQueryParamsModel": (
+        CompanyQueryParamsModel,
+        {"limit": 50, "page": 1, "industry": "Software", "name": "Comp"},
+    ),
+    "CompanyUserReadModel": (CompanyUserReadModel, company_user_read(1)),
+    "CompanyUserAddModel": (
+        CompanyUserAddModel,
+        {"email": "user@example.com", "role": "Manager"},
+    ),
+    "RoleCreateModel": (RoleCreateModel, role_read(1)),
+    "RoleUpdateModel": (RoleUpdateModel, role_read(2)),
+    "RoleDeleteModel": (
+        RoleDeleteModel,
+        {"replacement_role_name": "Viewer", "role_name_to_delete": "Manager"},
+    ),
+    "RoleReadModel": (RoleReadModel, role_read(3)),
+    "RoleQueryParamsModel": (RoleQueryParamsModel, {"limit": 10, "name": "Man"}),
+    "DetailModel": (DetailModel, {"message": "Not found", "error": "not_found"}),
+    "AppErrorResponseModel": (
+        AppErrorResponseModel,
+        {"detail": {"message": "Not found", "error": "not_found"}},
+    ),
+    "PaginationParams": (PaginationParams, {"limit": 25, "page": 4}),
+    "PaginationMeta": (PaginationMeta, pagination_meta(1000)),
+    "GenericResponseModel[UserReadModel]": (
+        GenericResponseModel[UserReadModel],
+        {"message": "ok", "data": user_read(1)},
+    ),
+    "GenericResponseModel[CompanyReadModel]": (
+        GenericResponseModel[CompanyReadModel],
+        {"message": "ok", "data": company_read(1)},
+    ),
+}
+
+
+def paginated_samples(
+    sizes: Tuple[int, ...] = (100, 1000),
+) -> Dict[str, Tuple[Type[BaseModel], Dict[str, Any]]]:
+    """Large ``PaginatedResponse`` payloads for each Read model and size."""
+    samples = {}
+    for model in (UserReadModel, CompanyReadModel):
+        factory = ROW_FACTORIES[model]
+        for size in sizes:
+            name = f"PaginatedResponse[{model.__name__}] x{size}"
+            payload = paginated([factory(i) for i in range(size)])
+            samples[name] = (PaginatedResponse[model], payload)
+    return samples
@@ -0,0 +1,146 @@
+"""Generic response, pagination and error models shared across services.
+
+Public names are imported lazily on first attribute access so that importing
+the package does not build every model or load optional heavy dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app_error import (
+        AppErrorResponseModel,
+        CatalogError,
+        DetailModel,
+        ErrorCatalog,
+        error_catalog,
+    )
+    from .bulk_import import (
+        BulkImporter,
+        ImportChunk,
+        ImportRowError,
+        ImportStats,
+        import_rows,
+        read_csv,
+        read_ndjson,
+    )
+    from .columnar import ColumnarBatch
+    from .cursor_pagination import (
+        Cursor,
+        CursorCodec,
+        CursorPaginatedResponse,
+        CursorPaginationMeta,
+        CursorPaginationParams,
+    )
+    from .decoding import decode_paginated, decode_records
+    from .filtering import (
+        CompiledFilter,
+        FilterPlan,
+        SqlFragment,
+        compile_filter,
+        filter_plan,
+    )
+    from .generic_pagination import (
+        CountMode,
+        FilterLogic,
+        MatchType,
+        PaginatedResponse,
+        PaginationMeta,
+        PaginationParams,
+    )
+    from .generic_response import GenericResponseModel
+    from .patch import Changeset, compute_changeset
+    from .projection import Projection, ProjectionParams, get_projection
+    from .schema_registry import SchemaRegistry
+    from .specializations import BuildTiming, SpecializationCache
+    from .store import IndexedStore
+    from .streaming import (
+        astream_generic_response_json,
+        astream_ndjson,
+        astream_paginated_json,
+        stream_generic_response_json,
+        stream_ndjson,
+        stream_paginated_json,
+    )
+    from .strict import strict_model
+    from .trusted import (
+        TrustedLoader,
+        TrustedMismatch,
+        TrustedStats,
+        construct_trusted,
+    )
+    from .wire_codec import WireCodec, decode_wire, encode_wire, get_wire_codec
+
+_EXPORTS = {
+    "AppErrorResponseModel": ".app_error",
+    "CatalogError": ".app_error",
+    "DetailModel": ".app_error",
+    "ErrorCatalog": ".app_error",
+    "error_catalog": ".app_error",
+    "BulkImporter": ".bulk_import",
+    "ImportChunk": ".bulk_import",
+    "ImportRowError": ".bulk_import",
+    "ImportStats": ".bulk_import",
+    "import_rows": ".bulk_import",
+    "read_csv": ".bulk_import",
+    "read_ndjson": ".bulk_import",
+    "ColumnarBatch": ".columnar",
+    "Cursor": ".cursor_pagination",
+    "CursorCodec": ".cursor_pagination",
+    "CursorPaginatedResponse": ".cursor_pagination",
+    "CursorPaginationMeta": ".cursor_pagination",
+    "CursorPaginationParams": ".cursor_pagination",
+    "decode_paginated": ".decoding",
+    "decode_records": ".decoding",
+    "CompiledFilter": ".filtering",
+    "FilterPlan": ".filtering",
+    "SqlFragment": ".filtering",
+    "compile_filter": ".filtering",
+    "filter_plan": ".filtering",
+    "CountMode": ".generic_pagination",
+    "FilterLogic": ".generic_pagination",
+    "MatchType": ".generic_pagination",
+    "PaginatedResponse": ".generic_pagination",
+    "PaginationMeta": ".generic_pagination",
+    "PaginationParams": ".generic_pagination",
+    "GenericResponseModel": ".generic_response",
+    "Changeset": ".patch",
+    "compute_changeset": ".patch",
+    "Projection": ".projection",
+    "ProjectionParams": ".projection",
+    "get_projection": ".projection",
+    "SchemaRegistry": ".schema_registry",
+    "BuildTiming": ".specializations",
+    "SpecializationCache": ".specializations",
+    "IndexedStore": ".store",
+    "astream_generic_response_json": ".streaming",
+    "astream_ndjson": ".streaming",
+    "astream_paginated_json": ".streaming",
+    "stream_generic_response_json": ".streaming",
+    "stream_ndjson": ".streaming",
+    "stream_paginated_json": ".streaming",
+    "strict_model": ".strict",
+    "TrustedLoader": ".trusted",
+    "TrustedMismatch": ".trusted",
+    "TrustedStats": ".trusted",
+    "construct_trusted": ".trusted",
+    "WireCodec": ".wire_codec",
+    "decode_wire": ".wire_codec",
+    "encode_wire": ".wire_codec",
+    "get_wire_codec": ".wire_codec",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
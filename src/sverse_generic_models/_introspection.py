@@ -0,0 +1,129 @@
+"""Helpers inspecting pydantic models, shared by the modules of this package.
+
+Kept free of the heavier modules' imports so any of them can use it.
+"""
+
+import dataclasses
+import functools
+import re
+import types
+import typing
+from typing import Any, Optional, Type
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def stable_repr(value: Any) -> str:
+    """Text describing ``value`` that is identical across processes.
+
+    ``repr`` of functions, lambdas and most objects embeds a memory address;
+    callables are described by their qualified name instead, and annotation
+    metadata, dataclasses and containers are described recursively.
+    """
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    origin = typing.get_origin(value)
+    if origin is typing.Annotated:
+        args = [typing.get_args(value)[0], *value.__metadata__]
+        return f"Annotated[{', '.join(stable_repr(arg) for arg in args)}]"
+    if origin is not None:
+        args = ", ".join(stable_repr(arg) for arg in typing.get_args(value))
+        return f"{stable_repr(origin)}[{args}]"
+    if isinstance(value, functools.partial):
+        args = [value.func, *value.args, *value.keywords.values()]
+        return f"partial({', '.join(stable_repr(arg) for arg in args)})"
+    if isinstance(
+        value,
+        (types.FunctionType, types.BuiltinFunctionType, types.MethodType),
+    ):
+        return f"{value.__module__}.{value.__qualname__}"
+    if dataclasses.is_dataclass(value):
+        fields = ", ".join(
+            f"{field.name}={stable_repr(getattr(value, field.name))}"
+            for field in dataclasses.fields(value)
+        )
+        return f"{stable_repr(type(value))}({fields})"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(stable_repr(item) for item in value)}]"
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{stable_repr(key)}: {stable_repr(item)}" for key, item in value.items()
+        )
+        return f"{{{items}}}"
+    return _ADDRESS.sub("", repr(value))
+
+
+def describe_field(field: FieldInfo) -> str:
+    """Stable description of a field: annotation, aliases, default, constraints.
+
+    Covers the same attributes as ``repr(field)``.
+    """
+    parts = []
+    for name, value in field.__repr_args__():
+        if name == "annotation":
+            # The repr args hold display text that drops validator functions.
+            value = field.annotation
+        parts.append(f"{name}={stable_repr(value)}")
+    return ", ".join(parts)
+
+
+def nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The model type of a ``Model`` or ``Optional[Model]`` annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        members = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return nested_model(members[0])
+    return None
+
+
+def has_custom_serialization(schema: Any) -> bool:
+    """True if a core schema customizes how any value is serialized."""
+    if isinstance(schema, dict):
+        config = schema.get("config")
+        if "serialization" in schema or (
+            isinstance(config, dict)
+            and any(key.startswith("ser_json_") for key in config)
+        ):
+            return True
+        return any(has_custom_serialization(value) for value in schema.values())
+    if isinstance(schema, (list, tuple)):
+        return any(has_custom_serialization(value) for value in schema)
+    return False
+
+
+def uses_strict_mode(schema: Any) -> bool:
+    """True if any part of a core schema validates in strict mode."""
+    if isinstance(schema, dict):
+        config = schema.get("config")
+        if schema.get("strict") is True or (
+            isinstance(config, dict) and config.get("strict") is True
+        ):
+            return True
+        return any(uses_strict_mode(value) for value in schema.values())
+    if isinstance(schema, (list, tuple)):
+        return any(uses_strict_mode(value) for value in schema)
+    return False
+
+
+def strip_annotated(annotation: Any) -> Any:
+    """``annotation`` without ``Annotated`` metadata at any depth."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return strip_annotated(args[0])
+    if origin is None or not args:
+        return annotation
+    stripped = tuple(strip_annotated(arg) for arg in args)
+    if all(new is old for new, old in zip(stripped, args)):
+        return annotation
+    if origin in (typing.Union, types.UnionType):
+        return typing.Union[stripped]
+    try:
+        return origin[stripped]
+    except TypeError:
+        return annotation
@@ -1,3 +1,8 @@
+import string
+import threading
+from json.encoder import encode_basestring
+from typing import Any, Dict, List, Optional, Tuple
+
 from pydantic import BaseModel
 
 
@@ -12,3 +17,131 @@ class AppErrorResponseModel(BaseModel):
     """Model representing an application error response."""
 
     detail: DetailModel
+
+
+def _json_text(value: str) -> str:
+    """``value`` escaped like pydantic-core escapes JSON strings, unquoted."""
+    return encode_basestring(value)[1:-1]
+
+
+class CatalogError:
+    """A registered error: a stable ``code`` and a message template.
+
+    The response body is ``{"detail": {"message": ..., "error": code}}``,
+    byte-identical to ``AppErrorResponseModel.model_dump_json()``. A message
+    without ``{placeholders}`` is rendered once; otherwise the JSON around
+    the placeholders is pre-rendered and only the parameters are escaped
+    per call.
+    """
+
+    __slots__ = ("code", "message", "status_code", "fields", "_parts", "_body")
+
+    def __init__(self, code: str, message: str, status_code: int = 400):
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+        # One more literal than fields: literal, field, literal, ...
+        literals: List[str] = [""]
+        fields: List[Tuple[str, str]] = []
+        for literal, field, spec, conversion in string.Formatter().parse(message):
+            literals[-1] += literal
+            if field is None:
+                continue
+            if not field.isidentifier() or conversion:
+                raise ValueError(
+                    f"Error {code!r}: placeholders must be plain names, got {field!r}"
+                )
+            fields.append((field, spec or ""))
+            literals.append("")
+        self.fields = tuple(name for name, _ in fields)
+        head = '{"detail":{"message":"'
+        tail = f'","error":{encode_basestring(code)}}}}}'
+        literals[0] = head + _json_text(literals[0])
+        literals[1:] = [_json_text(literal) for literal in literals[1:]]
+        literals[-1] += tail
+        self._parts = (tuple(literals), tuple(fields))
+        self._body: Optional[bytes] = literals[0].encode() if not fields else None
+
+    def render(self, **params: Any) -> bytes:
+        """Return the JSON response body with ``params`` filled in."""
+        body = self._body
+        if body is not None:
+            if params:
+                raise ValueError(f"Error {self.code!r} takes no parameters")
+            return body
+        literals, fields = self._parts
+        pieces = [literals[0]]
+        try:
+            for (name, spec), literal in zip(fields, literals[1:]):
+                pieces.append(_json_text(format(params[name], spec)))
+                pieces.append(literal)
+        except KeyError as exc:
+            raise ValueError(
+                f"Error {self.code!r} is missing parameter {exc.args[0]!r}"
+            ) from None
+        return "".join(pieces).encode()
+
+    def format_message(self, **params: Any) -> str:
+        """Return the message with ``params`` filled in."""
+        try:
+            return self.message.format(**params)
+        except KeyError as exc:
+            raise ValueError(
+                f"Error {self.code!r} is missing parameter {exc.args[0]!r}"
+            ) from None
+
+    def model(self, **params: Any) -> AppErrorResponseModel:
+        """Build the equivalent ``AppErrorResponseModel``."""
+        detail = DetailModel(message=self.format_message(**params), error=self.code)
+        return AppErrorResponseModel(detail=detail)
+
+    def __repr__(self) -> str:
+        return f"CatalogError({self.code!r}, {self.message!r}, {self.status_code})"
+
+
+class ErrorCatalog:
+    """Registry of common errors, keyed by their stable code.
+
+    Registering is idempotent for identical definitions, so modules can
+    register the errors they raise at import time; registering a different
+    message or status under an existing code raises ``ValueError``.
+    """
+
+    def __init__(self) -> None:
+        self._errors: Dict[str, CatalogError] = {}
+        self._lock = threading.Lock()
+
+    def register(self, code: str, message: str, status_code: int = 400) -> CatalogError:
+        """Add an error and return it; its JSON is rendered now."""
+        error = CatalogError(code, message, status_code)
+        with self._lock:
+            existing = self._errors.get(code)
+            if existing is None:
+                self._errors[code] = error
+                return error
+        if (existing.message, existing.status_code) != (message, status_code):
+            raise ValueError(f"Error code {code!r} is already registered differently")
+        return existing
+
+    def get(self, code: str) -> CatalogError:
+        """Return the error registered under ``code``."""
+        try:
+            return self._errors[code]
+        except KeyError:
+            raise ValueError(f"Unknown error code {code!r}") from None
+
+    def render(self, code: str, **params: Any) -> bytes:
+        """Return the JSON response body of ``code`` with ``params`` filled in."""
+        return self.get(code).render(**params)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._errors
+
+    @property
+    def codes(self) -> List[str]:
+        """Registered codes in registration order."""
+        return list(self._errors)
+
+
+# Process-wide catalog used when callers do not manage their own.
+error_catalog = ErrorCatalog()
@@ -0,0 +1,278 @@
+import asyncio
+import csv
+import os
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
+
+from .app_error import AppErrorResponseModel, DetailModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+Source = Union[str, "os.PathLike[str]", Iterable[Any]]
+Rows = Union[Iterable[Any], AsyncIterable[Any]]
+
+DEFAULT_CHUNK_SIZE = 1_000
+DEFAULT_MAX_PENDING = 4
+
+
+class InvalidRow(NamedTuple):
+    """Placeholder for an input row that could not be parsed, with the
+    error code to report for it."""
+
+    reason: str
+    code: str = "invalid_row"
+
+
+class ImportRowError(AppErrorResponseModel):
+    """Error response for one input row that failed to parse or validate.
+
+    ``detail.error`` is a short code (``validation_error``, ``invalid_json``
+    or ``invalid_csv_row``) and ``detail.message`` explains what is wrong.
+    """
+
+    row: int
+
+
+class ImportChunk(NamedTuple, Generic[ModelT]):
+    """Outcome of one chunk of input rows, in input order."""
+
+    records: List[ModelT]
+    errors: List[ImportRowError]
+
+
+class ImportStats(NamedTuple):
+    """Counters for a ``BulkImporter`` run."""
+
+    rows: int
+    valid: int
+    invalid: int
+
+
+def _lines(source: Source, mode: str) -> Iterator[Any]:
+    if isinstance(source, (str, os.PathLike)):
+        if "b" in mode:
+            handle = open(source, mode)
+        else:
+            # The csv module handles line endings itself, including newlines
+            # inside quoted cells, so the file must not translate them.
+            handle = open(source, mode, encoding="utf-8", newline="")
+        with handle:
+            yield from handle
+    else:
+        yield from source
+
+
+def read_ndjson(source: Source) -> Iterator[Any]:
+    """Yield one row per non-blank line of an NDJSON file or iterable of lines.
+
+    Lines that are not valid JSON are yielded as ``InvalidRow`` so that the
+    import reports them instead of stopping.
+    """
+    for line in _lines(source, "rb"):
+        if not line.strip():
+            continue
+        try:
+            yield from_json(line)
+        except ValueError as exc:
+            yield InvalidRow(f"Invalid JSON: {exc}", "invalid_json")
+
+
+def _unflatten(row: Dict[str, str]) -> Dict[str, Any]:
+    """Nest dotted keys; raises ValueError when a column and its subcolumns
+    (``address`` and ``address.city``) are both filled."""
+    result: Dict[str, Any] = {}
+    for key, value in row.items():
+        if not value or key is None:
+            continue
+        *parents, name = key.split(".")
+        target = result
+        for parent in parents:
+            target = target.setdefault(parent, {})
+            if not isinstance(target, dict):
+                raise ValueError(f"Column {key!r} conflicts with column {parent!r}")
+        if isinstance(target.get(name), dict):
+            raise ValueError(f"Column {key!r} conflicts with its nested columns")
+        target[name] = value
+    return result
+
+
+def read_csv(source: Union[Source, IO[str]]) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per CSV data row, using the header row as field names.
+
+    Empty cells are left out so model defaults apply, and dotted headers
+    such as ``address.city`` build nested dicts. A row filling both
+    ``address`` and ``address.city`` is yielded as ``InvalidRow``.
+    """
+    for row in csv.DictReader(_lines(source, "r")):
+        try:
+            yield _unflatten(row)
+        except ValueError as exc:
+            yield InvalidRow(str(exc), "invalid_csv_row")
+
+
+def _format_errors(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors(include_url=False)
+    )
+
+
+def _row_error(row: int, code: str, message: str) -> ImportRowError:
+    return ImportRowError(row=row, detail=DetailModel(message=message, error=code))
+
+
+def validate_chunk(
+    model: Type[ModelT],
+    first_row: int,
+    rows: List[Any],
+    context: Optional[Dict[str, Any]] = None,
+) -> ImportChunk:
+    """Validate ``rows`` numbered from ``first_row``, collecting per-row errors.
+
+    Module-level so that it can run in a ``ProcessPoolExecutor``.
+    """
+    records = []
+    errors = []
+    for number, row in enumerate(rows, first_row):
+        if isinstance(row, InvalidRow):
+            errors.append(_row_error(number, row.code, row.reason))
+            continue
+        try:
+            records.append(model.model_validate(row, context=context))
+        except ValidationError as exc:
+            errors.append(_row_error(number, "validation_error", _format_errors(exc)))
+    return ImportChunk(records, errors)
+
+
+async def _chunks(rows: Rows, size: int) -> AsyncIterator[List[Any]]:
+    if isinstance(rows, AsyncIterable):
+        chunk = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    # Reading a file blocks, so sync sources are read on a thread.
+    loop = asyncio.get_running_loop()
+    iterator = iter(rows)
+    while True:
+        chunk = await loop.run_in_executor(None, list, islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class BulkImporter(Generic[ModelT]):
+    """Validates a stream of rows into ``model`` off the event loop.
+
+    Rows are read ``chunk_size`` at a time and each chunk is validated on
+    ``executor`` (the loop's default thread pool when None; pass a
+    ``ProcessPoolExecutor`` to use several cores). At most ``max_pending``
+    chunks are in flight, and no more input is read until the consumer
+    takes the oldest result, so memory stays bounded for any input size.
+    Row numbers in errors count input rows from 1.
+    """
+
+    def __init__(
+        self,
+        model: Type[ModelT],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        executor: Optional[Executor] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ):
+        if chunk_size < 1 or max_pending < 1:
+            raise ValueError("chunk_size and max_pending must be >= 1")
+        self.model = model
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+        self.executor = executor
+        self.context = context
+        self._rows = self._valid = self._invalid = 0
+
+    def stats(self) -> ImportStats:
+        """Return the counters of the rows imported so far."""
+        return ImportStats(self._rows, self._valid, self._invalid)
+
+    def _count(self, chunk: ImportChunk) -> ImportChunk:
+        self._valid += len(chunk.records)
+        self._invalid += len(chunk.errors)
+        return chunk
+
+    async def chunks(self, rows: Rows) -> AsyncIterator[ImportChunk]:
+        """Yield an ``ImportChunk`` per ``chunk_size`` input rows, in order."""
+        loop = asyncio.get_running_loop()
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            async for chunk in _chunks(rows, self.chunk_size):
+                first_row = self._rows + 1
+                self._rows += len(chunk)
+                pending.append(
+                    loop.run_in_executor(
+                        self.executor,
+                        validate_chunk,
+                        self.model,
+                        first_row,
+                        chunk,
+                        self.context,
+                    )
+                )
+                if len(pending) >= self.max_pending:
+                    yield self._count(await pending.popleft())
+            while pending:
+                yield self._count(await pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def records(self, rows: Rows) -> AsyncIterator[ModelT]:
+        """Yield valid models only; errors are still counted in ``stats``."""
+        async for chunk in self.chunks(rows):
+            for record in chunk.records:
+                yield record
+
+    async def errors(self, rows: Rows) -> AsyncIterator[ImportRowError]:
+        """Yield per-row errors only, for dry runs that just check a file."""
+        async for chunk in self.chunks(rows):
+            for error in chunk.errors:
+                yield error
+
+
+async def import_rows(
+    model: Type[ModelT], rows: Rows, **options: Any
+) -> Tuple[List[ModelT], List[ImportRowError]]:
+    """Import ``rows`` completely and return all models and errors.
+
+    Convenience for small inputs; ``options`` are passed to ``BulkImporter``.
+    """
+    records: List[ModelT] = []
+    errors: List[ImportRowError] = []
+    async for chunk in BulkImporter(model, **options).chunks(rows):
+        records.extend(chunk.records)
+        errors.extend(chunk.errors)
+    return records, errors
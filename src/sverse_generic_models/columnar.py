@@ -0,0 +1,214 @@
+import typing
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import repeat
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Type,
+    TypedDict,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from .generic_pagination import PaginatedResponse, PaginationMeta
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    _paginated_envelope,
+    _stream,
+    stream_paginated_json,
+)
+from .trusted import construct_trusted
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+# Rows serialized per TypeAdapter call when dumping a batch to JSON.
+ROWS_PER_BLOCK = 1024
+
+_SERIALIZATION_CONFIG = (
+    "ser_json_bytes",
+    "ser_json_inf_nan",
+    "ser_json_temporal",
+    "ser_json_timedelta",
+)
+
+Column = MutableSequence[Any]
+
+
+def _compact(values: List[Any]) -> Column:
+    """Store ``values`` as a typed array when possible, else dedupe strings."""
+    kinds = {type(value) for value in values}
+    if kinds == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if kinds == {float}:
+        return array("d", values)
+    if str in kinds:
+        # Repeated values (statuses, roles, cities) then share one object.
+        seen: Dict[str, str] = {}
+        return [
+            seen.setdefault(value, value) if type(value) is str else value
+            for value in values
+        ]
+    return values
+
+
+def _mentions_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_mentions_model(arg) for arg in typing.get_args(annotation))
+
+
+@lru_cache(maxsize=128)
+def _row_adapter(model: Type[BaseModel]) -> Optional[TypeAdapter]:
+    """Adapter dumping lists of row dicts exactly as ``model`` dumps instances.
+
+    Returns None when the model's output cannot be reproduced from a plain
+    TypedDict: custom or computed serialization, aliases, excluded fields,
+    serialization settings, or nested models.
+    """
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or model.model_computed_fields
+        or any(key in model.model_config for key in _SERIALIZATION_CONFIG)
+    ):
+        return None
+    annotations = {}
+    for name, field in model.model_fields.items():
+        if (
+            field.alias not in (None, name)
+            or field.serialization_alias not in (None, name)
+            or field.exclude
+            or _mentions_model(field.annotation)
+        ):
+            return None
+        annotations[name] = field.annotation
+    row_type = TypedDict(f"{model.__name__}Row", annotations)
+    return TypeAdapter(List[row_type])
+
+
+class ColumnarBatch(Generic[ModelT]):
+    """Rows of ``model`` stored column by column.
+
+    Integer and float columns are typed arrays; other columns are lists in
+    which equal strings share one object. Row models are only built when
+    accessed, with ``construct_trusted``, so the batch must be filled from
+    validated models or from trusted rows. Models with only plain fields are
+    serialized straight from the columns without building row models.
+    """
+
+    def __init__(self, model: Type[ModelT], columns: Dict[str, Column], length: int):
+        self.model = model
+        self.columns = columns
+        self._length = length
+        self._complete = not any(
+            isinstance(column, list) and _MISSING in column
+            for column in columns.values()
+        )
+
+    @classmethod
+    def from_rows(cls, model: Type[ModelT], rows: Iterable[Any]) -> "ColumnarBatch":
+        """Build a batch from mappings or attribute objects with ``model``'s fields."""
+        names = list(model.model_fields)
+        values: Dict[str, List[Any]] = {name: [] for name in names}
+        length = 0
+        for row in rows:
+            if isinstance(row, Mapping):
+                get = row.get
+                for name in names:
+                    values[name].append(get(name, _MISSING))
+            else:
+                for name in names:
+                    values[name].append(getattr(row, name, _MISSING))
+            length += 1
+        columns = {name: _compact(column) for name, column in values.items()}
+        return cls(model, columns, length)
+
+    @classmethod
+    def from_models(cls, models: Iterable[ModelT]) -> "ColumnarBatch":
+        """Build a batch from validated model instances."""
+        models = list(models)
+        if not models:
+            raise ValueError("Cannot infer the model of an empty batch.")
+        return cls.from_rows(type(models[0]), models)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _row(self, index: int) -> ModelT:
+        data = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            if value is not _MISSING:
+                data[name] = value
+        return construct_trusted(self.model, data)
+
+    @overload
+    def __getitem__(self, index: int) -> ModelT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ModelT]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ModelT, List[ModelT]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("batch index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[ModelT]:
+        for index in range(self._length):
+            yield self._row(index)
+
+    def column(self, name: str) -> Column:
+        """Return the stored values of field ``name``."""
+        return self.columns[name]
+
+    def to_paginated_response(self, pagination: PaginationMeta) -> PaginatedResponse:
+        """Materialize every row into a ``PaginatedResponse[model]``."""
+        return PaginatedResponse[self.model].model_construct(
+            records=list(self), pagination=pagination
+        )
+
+    def _blocks(self, adapter: TypeAdapter) -> Iterator[bytes]:
+        names = list(self.columns)
+        for start in range(0, self._length, ROWS_PER_BLOCK):
+            stop = min(start + ROWS_PER_BLOCK, self._length)
+            slices = [column[start:stop] for column in self.columns.values()]
+            rows = list(map(dict, map(zip, repeat(names), zip(*slices))))
+            # Drop the list brackets; _stream joins blocks with commas.
+            yield adapter.dump_json(rows)[1:-1]
+
+    def stream_json(
+        self, pagination: PaginationMeta, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Yield ``PaginatedResponse`` JSON in chunks of about ``chunk_size`` bytes."""
+        adapter = _row_adapter(self.model) if self._complete else None
+        if adapter is None:
+            return stream_paginated_json(self.model, iter(self), pagination, chunk_size)
+        prefix, suffix = _paginated_envelope(pagination)
+        return _stream(
+            lambda block: block, self._blocks(adapter), prefix, b",", suffix, chunk_size
+        )
+
+    def to_json(self, pagination: PaginationMeta) -> bytes:
+        """Return the same bytes as the equivalent ``PaginatedResponse.model_dump_json``."""
+        return b"".join(self.stream_json(pagination))
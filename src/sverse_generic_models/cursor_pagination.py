@@ -0,0 +1,159 @@
+import base64
+import binascii
+import hashlib
+import hmac
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import BaseModel, Field
+from pydantic_core import from_json, to_json
+
+T = TypeVar("T")
+
+Direction = Literal["next", "prev"]
+
+MAX_CURSOR_LENGTH = 1024
+_MAC_BYTES = 12
+_DIRECTION_TAGS = {"next": "n", "prev": "p"}
+_TAG_DIRECTIONS = {tag: direction for direction, tag in _DIRECTION_TAGS.items()}
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class Cursor(NamedTuple):
+    """Decoded keyset position: the sort key values of a boundary record."""
+
+    values: Tuple[Any, ...]
+    direction: Direction = "next"
+
+
+class CursorCodec:
+    """Encodes keyset positions into opaque, tamper-evident cursor strings.
+
+    A cursor is the base64url-encoded JSON list of sort key values followed by
+    a keyed BLAKE2b MAC over it. ``scope`` (for example ``"users:id"``) is
+    mixed into the MAC but not transmitted, so a cursor issued for one
+    endpoint or sort order is rejected by another. Sort key values must be
+    JSON scalars (str, int, float, bool or None).
+    """
+
+    def __init__(self, secret: bytes):
+        if not secret:
+            raise ValueError("Cursor secret must not be empty.")
+        if len(secret) > hashlib.blake2b.MAX_KEY_SIZE:
+            secret = hashlib.blake2b(secret).digest()
+        # Keyed once here; copying the primed state is cheaper than re-keying.
+        self._keyed = hashlib.blake2b(key=secret, digest_size=_MAC_BYTES)
+
+    def _mac(self, body: bytes, scope: str) -> bytes:
+        state = self._keyed.copy()
+        state.update(scope.encode())
+        state.update(b"\x00")
+        state.update(body)
+        return base64.urlsafe_b64encode(state.digest())
+
+    def encode(
+        self, values: Sequence[Any], direction: Direction = "next", scope: str = ""
+    ) -> str:
+        """Encode sort key ``values`` into a signed cursor string."""
+        if isinstance(values, (str, bytes)):
+            raise TypeError("Cursor values must be a sequence of sort key values.")
+        for value in values:
+            if not isinstance(value, _SCALAR_TYPES):
+                raise TypeError(f"Unsupported cursor value type: {type(value)!r}")
+        payload = to_json([_DIRECTION_TAGS[direction], *values])
+        body = base64.urlsafe_b64encode(payload).rstrip(b"=")
+        return (body + b"." + self._mac(body, scope)).decode("ascii")
+
+    def decode(self, cursor: str, scope: str = "") -> Cursor:
+        """Verify and decode ``cursor``; raise ValueError if it was altered."""
+        try:
+            if len(cursor) > MAX_CURSOR_LENGTH:
+                raise ValueError
+            body, _, mac = cursor.encode("ascii").rpartition(b".")
+            if not hmac.compare_digest(mac, self._mac(body, scope)):
+                raise ValueError
+            payload = from_json(
+                base64.urlsafe_b64decode(body + b"=" * (-len(body) % 4))
+            )
+            tag, *values = payload
+            return Cursor(tuple(values), _TAG_DIRECTIONS[tag])
+        except (ValueError, TypeError, KeyError, UnicodeError, binascii.Error) as exc:
+            raise ValueError("Invalid pagination cursor.") from exc
+
+
+class CursorPaginationParams(BaseModel):
+    """Model for keyset (cursor) pagination parameters."""
+
+    limit: int = Field(10, ge=1, le=100)
+    cursor: Optional[str] = Field(
+        None,
+        max_length=MAX_CURSOR_LENGTH,
+        description="Opaque cursor from a previous page; omit for the first page",
+    )
+
+
+class CursorPaginationMeta(BaseModel):
+    """Model for keyset pagination metadata."""
+
+    limit: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset-paginated response model."""
+
+    records: List[T]
+    pagination: CursorPaginationMeta
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[T],
+        params: CursorPaginationParams,
+        sort_key: Callable[[T], Sequence[Any]],
+        codec: CursorCodec,
+        scope: str = "",
+    ) -> "CursorPaginatedResponse[T]":
+        """Build a page from rows fetched with ``LIMIT params.limit + 1``.
+
+        Rows must be in the order of travel: ascending for the first page or
+        a ``next`` cursor, descending for a ``prev`` cursor. The extra row
+        only signals ``has_more`` and is not returned.
+        """
+        cursor = codec.decode(params.cursor, scope) if params.cursor else None
+        direction = cursor.direction if cursor else "next"
+        has_more = len(rows) > params.limit
+        records = list(rows[: params.limit])
+
+        next_cursor = prev_cursor = None
+        if direction == "prev":
+            records.reverse()
+        if records:
+            more_before = has_more if direction == "prev" else cursor is not None
+            more_after = has_more if direction == "next" else True
+            if more_after:
+                next_cursor = codec.encode(sort_key(records[-1]), "next", scope)
+            if more_before:
+                prev_cursor = codec.encode(sort_key(records[0]), "prev", scope)
+
+        return cls(
+            records=records,
+            pagination=CursorPaginationMeta(
+                limit=params.limit,
+                has_more=has_more,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+            ),
+        )
@@ -0,0 +1,70 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from .generic_pagination import PaginatedResponse, PaginationMeta, PaginationParams
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=128)
+def records_adapter(model: Type[ModelT]) -> TypeAdapter[List[ModelT]]:
+    """Return the cached ``TypeAdapter`` validating a list of ``model``."""
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=128)
+def paginated_adapter(
+    model: Type[ModelT],
+) -> TypeAdapter[PaginatedResponse[ModelT]]:
+    """Return the cached ``TypeAdapter`` validating ``PaginatedResponse[model]``."""
+    return TypeAdapter(PaginatedResponse[model])
+
+
+def _as_list(rows: Iterable[Any]) -> List[Any]:
+    return rows if isinstance(rows, list) else list(rows)
+
+
+def decode_records(
+    model: Type[ModelT],
+    rows: Iterable[Any],
+    from_attributes: bool = True,
+    context: Optional[Dict[str, Any]] = None,
+) -> List[ModelT]:
+    """Validate ``rows`` into ``model`` instances in a single pydantic-core call.
+
+    Rows may be dicts or objects exposing the fields as attributes (such as
+    ORM rows) when ``from_attributes`` is enabled. ``context`` is passed to
+    the validators, for example to set a phone region or intern strings.
+    """
+    return records_adapter(model).validate_python(
+        _as_list(rows), from_attributes=from_attributes, context=context
+    )
+
+
+def decode_paginated(
+    model: Type[ModelT],
+    rows: Iterable[Any],
+    params: PaginationParams,
+    total_records: Optional[int] = None,
+    estimated: bool = False,
+    from_attributes: bool = True,
+    context: Optional[Dict[str, Any]] = None,
+) -> PaginatedResponse[ModelT]:
+    """Validate ``rows`` straight into a ``PaginatedResponse[model]``.
+
+    Like ``PaginatedResponse.from_rows``, ``rows`` may be fetched with
+    ``LIMIT params.fetch_limit()``: the extra row only signals ``has_more``
+    and is not returned. ``total_records`` may be exact, estimated or None;
+    see ``PaginationMeta.from_slice``.
+    """
+    rows = _as_list(rows)
+    meta = PaginationMeta.from_slice(params, rows, total_records, estimated)
+    if len(rows) > params.limit:
+        rows = rows[: params.limit]
+    return paginated_adapter(model).validate_python(
+        {"records": rows, "pagination": meta},
+        from_attributes=from_attributes,
+        context=context,
+    )
@@ -0,0 +1,314 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel
+
+from .cursor_pagination import CursorPaginationParams
+from .generic_pagination import FilterLogic, MatchType, PaginationParams
+from .projection import ProjectionParams
+
+Predicate = Callable[[Any], bool]
+
+_NON_FILTER_FIELDS = (
+    frozenset(PaginationParams.model_fields)
+    | frozenset(CursorPaginationParams.model_fields)
+    | frozenset(ProjectionParams.model_fields)
+)
+
+
+class SqlFragment(NamedTuple):
+    """A parameterized SQL condition and its bind parameters."""
+
+    text: str
+    params: Dict[str, Any]
+
+
+@lru_cache(maxsize=128)
+def filter_fields(params_type: Type[BaseModel]) -> Tuple[str, ...]:
+    """Names of the filter fields of a query params model, excluding paging
+    and projection."""
+    return tuple(
+        name for name in params_type.model_fields if name not in _NON_FILTER_FIELDS
+    )
+
+
+def _escape_like(text: str, escape: str = "\\") -> str:
+    """Escape LIKE wildcards with ``escape`` so the value matches literally."""
+    if "%" in text or "_" in text or escape in text:
+        text = (
+            text.replace(escape, escape + escape)
+            .replace("%", escape + "%")
+            .replace("_", escape + "_")
+        )
+    return text
+
+
+def _check_escape(escape: str) -> None:
+    if len(escape) != 1 or escape in "%_'":
+        raise ValueError(f"Invalid LIKE escape character: {escape!r}")
+
+
+def _field_matcher(
+    field: str, needle: str, match_type: MatchType, case_sensitive: bool
+) -> Predicate:
+    # One specialized closure per variant: this runs once per record, so it
+    # avoids helper calls and branches on the match options.
+    if case_sensitive:
+        if match_type is MatchType.EXACT:
+
+            def match(record: Any) -> bool:
+                value = getattr(record, field, None)
+                return value is not None and str(value) == needle
+
+        elif match_type is MatchType.STARTS_WITH:
+
+            def match(record: Any) -> bool:
+                value = getattr(record, field, None)
+                return value is not None and str(value).startswith(needle)
+
+        else:
+
+            def match(record: Any) -> bool:
+                value = getattr(record, field, None)
+                return value is not None and needle in str(value)
+
+    elif match_type is MatchType.EXACT:
+
+        def match(record: Any) -> bool:
+            value = getattr(record, field, None)
+            return value is not None and str(value).lower() == needle
+
+    elif match_type is MatchType.STARTS_WITH:
+
+        def match(record: Any) -> bool:
+            value = getattr(record, field, None)
+            return value is not None and str(value).lower().startswith(needle)
+
+    else:
+
+        def match(record: Any) -> bool:
+            value = getattr(record, field, None)
+            return value is not None and needle in str(value).lower()
+
+    return match
+
+
+def _combine(matchers: List[Predicate], logic: FilterLogic) -> Predicate:
+    if not matchers:
+        return lambda record: True
+    if len(matchers) == 1:
+        return matchers[0]
+    if len(matchers) == 2:
+        first, second = matchers
+        if logic is FilterLogic.OR:
+            return lambda record: first(record) or second(record)
+        return lambda record: first(record) and second(record)
+
+    if logic is FilterLogic.OR:
+
+        def match_any(record: Any) -> bool:
+            for match in matchers:
+                if match(record):
+                    return True
+            return False
+
+        return match_any
+
+    def match_all(record: Any) -> bool:
+        for match in matchers:
+            if not match(record):
+                return False
+        return True
+
+    return match_all
+
+
+class FilterPlan:
+    """A compiled filter for one shape: active fields, match type and logic.
+
+    Plans hold everything that does not depend on the filter values, so they
+    are built once per shape by ``filter_plan`` and shared between requests.
+    """
+
+    def __init__(
+        self,
+        fields: Tuple[str, ...],
+        match_type: MatchType,
+        logic: FilterLogic,
+        case_sensitive: bool,
+    ):
+        self.fields = fields
+        self.match_type = match_type
+        self.logic = logic
+        self.case_sensitive = case_sensitive
+        self._sql: Dict[Tuple[Tuple[Tuple[str, str], ...], str], str] = {}
+
+    def normalize(self, value: Any) -> str:
+        """Fold a filter value the way records are folded before comparing."""
+        text = str(value)
+        return text if self.case_sensitive else text.lower()
+
+    def predicate(self, values: Tuple[Any, ...]) -> Predicate:
+        """Return a function testing one record against ``values``."""
+        matchers = [
+            _field_matcher(
+                field, self.normalize(value), self.match_type, self.case_sensitive
+            )
+            for field, value in zip(self.fields, values)
+        ]
+        return _combine(matchers, self.logic)
+
+    def _template(self, columns: Mapping[str, str], escape: str) -> str:
+        key = (tuple(sorted(columns.items())), escape)
+        template = self._sql.get(key)
+        if template is not None:
+            return template
+        if not self.fields:
+            template = "1 = 1"
+        else:
+            operator = "=" if self.match_type is MatchType.EXACT else "LIKE"
+            clause = "" if self.match_type is MatchType.EXACT else f" ESCAPE '{escape}'"
+            conditions = []
+            for field in self.fields:
+                column = columns.get(field, field)
+                if not self.case_sensitive:
+                    column = f"LOWER({column})"
+                conditions.append(f"{column} {operator} :{field}{clause}")
+            joiner = " OR " if self.logic is FilterLogic.OR else " AND "
+            template = "(" + joiner.join(conditions) + ")"
+        self._sql[key] = template
+        return template
+
+    def sql(
+        self,
+        values: Tuple[Any, ...],
+        columns: Optional[Mapping[str, str]] = None,
+        escape: str = "\\",
+    ) -> SqlFragment:
+        """Return a WHERE condition using ``:field`` named bind parameters.
+
+        ``columns`` maps filter fields to column expressions; fields default to
+        a column of the same name. Column names are inserted verbatim and must
+        come from code, never from user input.
+
+        ``escape`` is the LIKE escape character, written as ``ESCAPE '<c>'``.
+        The default backslash suits PostgreSQL and SQLite. MySQL and MariaDB
+        treat backslashes in string literals as escapes unless
+        ``NO_BACKSLASH_ESCAPES`` is set, so pass another character such as
+        ``"!"`` there.
+        """
+        _check_escape(escape)
+        template = self._template(columns or {}, escape)
+        params = {}
+        for field, value in zip(self.fields, values):
+            text = self.normalize(value)
+            if self.match_type is MatchType.PARTIAL:
+                text = f"%{_escape_like(text, escape)}%"
+            elif self.match_type is MatchType.STARTS_WITH:
+                text = f"{_escape_like(text, escape)}%"
+            params[field] = text
+        return SqlFragment(template, params)
+
+
+@lru_cache(maxsize=256)
+def _cached_plan(
+    fields: Tuple[str, ...],
+    match_type: MatchType,
+    logic: FilterLogic,
+    case_sensitive: bool,
+) -> FilterPlan:
+    return FilterPlan(fields, match_type, logic, case_sensitive)
+
+
+def filter_plan(
+    fields: Tuple[str, ...],
+    match_type: MatchType = MatchType.PARTIAL,
+    logic: FilterLogic = FilterLogic.AND,
+    case_sensitive: bool = False,
+) -> FilterPlan:
+    """Return the shared plan for a filter shape, compiling it on first use."""
+    if type(match_type) is not MatchType:
+        match_type = MatchType(match_type)
+    if type(logic) is not FilterLogic:
+        logic = FilterLogic(logic)
+    return _cached_plan(tuple(fields), match_type, logic, bool(case_sensitive))
+
+
+class CompiledFilter:
+    """A query params model's active filters bound to a cached ``FilterPlan``."""
+
+    def __init__(self, plan: FilterPlan, values: Tuple[Any, ...]):
+        self.plan = plan
+        self.values = values
+        self._predicate: Optional[Predicate] = None
+
+    def matches(self, record: Any) -> bool:
+        """Return True if ``record`` satisfies the filters.
+
+        A record without a filtered attribute, or with None there, does not
+        match that filter. Pass ``record_model`` to ``compile_filter`` to
+        reject such filters up front instead.
+        """
+        if self._predicate is None:
+            self._predicate = self.plan.predicate(self.values)
+        return self._predicate(record)
+
+    def filter(self, records: Iterable[Any]) -> List[Any]:
+        """Return the records that satisfy the filters, preserving order."""
+        if self._predicate is None:
+            self._predicate = self.plan.predicate(self.values)
+        return list(filter(self._predicate, records))
+
+    def where(
+        self, columns: Optional[Mapping[str, str]] = None, escape: str = "\\"
+    ) -> SqlFragment:
+        """Return the filters as a parameterized SQL WHERE condition.
+
+        See ``FilterPlan.sql`` for ``columns`` and ``escape``.
+        """
+        return self.plan.sql(self.values, columns, escape)
+
+
+def compile_filter(
+    params: BaseModel,
+    match_type: MatchType = MatchType.PARTIAL,
+    logic: FilterLogic = FilterLogic.AND,
+    case_sensitive: bool = False,
+    record_model: Optional[Type[BaseModel]] = None,
+) -> CompiledFilter:
+    """Compile the non-None filter fields of a query params model.
+
+    Pagination fields are ignored. With no active filters every record
+    matches and the SQL condition is ``1 = 1``.
+
+    Some filters name columns the Read models lack, such as ``role_name``
+    on ``UserQueryParams``; they only make sense in SQL, and in memory they
+    never match. When ``record_model`` is given, an active filter on a field
+    it does not have raises ``ValueError``.
+    """
+    fields = []
+    values = []
+    for name in filter_fields(type(params)):
+        value = getattr(params, name)
+        if value is not None:
+            fields.append(name)
+            values.append(value)
+    if record_model is not None:
+        unknown = [name for name in fields if name not in record_model.model_fields]
+        if unknown:
+            raise ValueError(
+                f"{record_model.__name__} cannot be filtered by {', '.join(unknown)}"
+            )
+    plan = filter_plan(tuple(fields), match_type, logic, case_sensitive)
+    return CompiledFilter(plan, tuple(values))
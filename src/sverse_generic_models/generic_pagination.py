@@ -1,11 +1,16 @@
 # app/models/generic_pagination.py
+import operator
 from enum import Enum
-from typing import Generic, List, TypeVar
-from pydantic import BaseModel, Field
+from typing import Generic, List, Optional, Sequence, Sized, TypeVar
+from pydantic import BaseModel, Field, model_validator
 
 T = TypeVar("T")
 
 
+def _is_none(value: object) -> bool:
+    return value is None
+
+
 class MatchType(str, Enum):
     """Enumeration for different types of string matching."""
 
@@ -21,6 +26,14 @@ class FilterLogic(str, Enum):
     AND = "and"
 
 
+class CountMode(str, Enum):
+    """How ``PaginationMeta`` reports the size of the result."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 class PaginationParams(BaseModel):
     """Model for pagination parameters."""
 
@@ -31,14 +44,94 @@ class PaginationParams(BaseModel):
         """Calculate the offset based on the current page and limit."""
         return (self.page - 1) * self.limit
 
+    def fetch_limit(self) -> int:
+        """Rows to fetch so that one extra row signals a next page."""
+        return self.limit + 1
+
 
 class PaginationMeta(BaseModel):
-    """Model for pagination metadata."""
+    """Model for pagination metadata.
 
-    total_records: int
+    With an exact count (the default) the JSON is unchanged:
+    ``total_records`` and ``total_pages``. An estimated count adds
+    ``"estimated": true``. Without a count both totals are null and
+    ``has_more`` tells whether a next page exists, so listings can skip
+    ``COUNT(*)``.
+    """
+
+    total_records: Optional[int] = None
     limit: int
     current_page: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    estimated: bool = Field(False, exclude_if=operator.not_)
+    has_more: Optional[bool] = Field(None, exclude_if=_is_none)
+
+    @model_validator(mode="after")
+    def check_count(self) -> "PaginationMeta":
+        """Ensure the totals and ``has_more`` describe one of the count modes."""
+        if (self.total_records is None) != (self.total_pages is None):
+            raise ValueError("total_records and total_pages must be set together")
+        if self.total_records is None:
+            if self.has_more is None:
+                raise ValueError("has_more is required without total_records")
+            if self.estimated:
+                raise ValueError("An estimated count requires total_records")
+        return self
+
+    @property
+    def count_mode(self) -> CountMode:
+        """Whether the totals are exact, estimated or absent."""
+        if self.total_records is None:
+            return CountMode.NONE
+        return CountMode.ESTIMATED if self.estimated else CountMode.EXACT
+
+    @classmethod
+    def from_params(
+        cls,
+        params: PaginationParams,
+        total_records: Optional[int] = None,
+        estimated: bool = False,
+        has_more: Optional[bool] = None,
+    ) -> "PaginationMeta":
+        """Build metadata for a page described by ``params``."""
+        total_pages = None
+        if total_records is not None:
+            total_pages = -(-total_records // params.limit)
+        return cls(
+            total_records=total_records,
+            limit=params.limit,
+            current_page=params.page,
+            total_pages=total_pages,
+            estimated=estimated,
+            has_more=has_more,
+        )
+
+    @classmethod
+    def from_slice(
+        cls,
+        params: PaginationParams,
+        rows: Sized,
+        total_records: Optional[int] = None,
+        estimated: bool = False,
+    ) -> "PaginationMeta":
+        """Build metadata from rows fetched with ``LIMIT params.fetch_limit()``.
+
+        With an exact ``total_records`` this is ``from_params``. Otherwise
+        ``has_more`` is set from the extra row. An estimate is raised to
+        cover the rows seen, and replaced by the exact count when the slice
+        reaches the end of the result.
+        """
+        if total_records is not None and not estimated:
+            return cls.from_params(params, total_records)
+        fetched = len(rows)
+        has_more = fetched > params.limit
+        if total_records is None:
+            return cls.from_params(params, has_more=has_more)
+        seen = params.offset() + min(fetched, params.limit)
+        if not has_more and fetched:
+            return cls.from_params(params, seen, has_more=False)
+        total_records = max(total_records, seen + 1 if has_more else seen)
+        return cls.from_params(params, total_records, estimated=True, has_more=has_more)
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -46,3 +139,19 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
     records: List[T]
     pagination: PaginationMeta
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[T],
+        params: PaginationParams,
+        total_records: Optional[int] = None,
+        estimated: bool = False,
+    ) -> "PaginatedResponse[T]":
+        """Build a page from rows fetched with ``LIMIT params.fetch_limit()``.
+
+        The extra row only signals ``has_more`` and is not returned; see
+        ``PaginationMeta.from_slice`` for how the totals are reported.
+        """
+        meta = PaginationMeta.from_slice(params, rows, total_records, estimated)
+        return cls(records=list(rows[: params.limit]), pagination=meta)
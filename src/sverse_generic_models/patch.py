@@ -0,0 +1,159 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ._introspection import nested_model
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=128)
+def _plan(
+    target: Type[BaseModel], update: Type[BaseModel]
+) -> Dict[str, Tuple[bool, Optional[Tuple[str, ...]]]]:
+    """Per update field: whether the target has it, and the target's nested
+    model fields when both sides hold a nested model there."""
+    plan = {}
+    for name, field in update.model_fields.items():
+        target_field = target.model_fields.get(name)
+        nested_fields = None
+        if target_field is not None and nested_model(field.annotation) is not None:
+            target_model = nested_model(target_field.annotation)
+            if target_model is not None:
+                nested_fields = tuple(target_model.model_fields)
+        plan[name] = (target_field is not None, nested_fields)
+    return plan
+
+
+class Changeset:
+    """The fields an update actually changes, keyed by dotted path.
+
+    Fields merged into an existing nested model are keyed like
+    ``"address.city"``. A nested model that is set where there was none, or
+    cleared, is keyed by its field name with the whole value (or None).
+    Fields the compared model does not have, such as a password on a read
+    model, are listed in ``write_only``.
+    """
+
+    __slots__ = ("changes", "_nested", "_write_only")
+
+    def __init__(
+        self,
+        changes: Optional[Dict[str, Any]] = None,
+        nested: Optional[Dict[str, Tuple[str, ...]]] = None,
+        write_only: Tuple[str, ...] = (),
+    ):
+        self.changes: Dict[str, Any] = changes if changes is not None else {}
+        # Nested field names of whole nested models in ``changes``.
+        self._nested = nested or {}
+        self._write_only = write_only
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.changes)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Changeset):
+            return self.changes == other.changes
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Changeset({self.changes!r})"
+
+    @property
+    def fields(self) -> List[str]:
+        """Top-level fields touched, e.g. for targeted cache invalidation."""
+        return list(dict.fromkeys(path.split(".", 1)[0] for path in self.changes))
+
+    @property
+    def write_only(self) -> Dict[str, Any]:
+        """Changed fields the compared model does not have; ``apply`` skips them."""
+        return {name: self.changes[name] for name in self._write_only}
+
+    def apply(self, target: ModelT) -> ModelT:
+        """Write the changes onto ``target`` in place and return it.
+
+        ``write_only`` fields are left for the caller, e.g. to hash a password.
+        """
+        for path, value in self.changes.items():
+            if path in self._write_only:
+                continue
+            owner = target
+            *parents, name = path.split(".")
+            for parent in parents:
+                owner = getattr(owner, parent)
+            if isinstance(value, BaseModel):
+                value = value.model_copy()
+            setattr(owner, name, value)
+        return target
+
+    def columns(self, column_map: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+        """Render the changes as ``{column: value}`` for an UPDATE statement.
+
+        Paths are mapped through ``column_map`` and default to the path with
+        dots replaced by underscores (``address.city`` -> ``address_city``).
+        A whole nested model expands to one column per nested field, all
+        None when it is cleared.
+        """
+        column_map = column_map or {}
+        columns = {}
+        for path, value in self.changes.items():
+            nested = self._nested.get(path)
+            if nested is None:
+                pairs = [(path, value)]
+            else:
+                pairs = [
+                    (f"{path}.{name}", getattr(value, name, None)) for name in nested
+                ]
+            for column_path, column_value in pairs:
+                column = column_map.get(column_path, column_path.replace(".", "_"))
+                columns[column] = column_value
+        return columns
+
+
+def compute_changeset(current: BaseModel, update: BaseModel) -> Changeset:
+    """Return only the fields of ``update`` that differ from ``current``.
+
+    Fields that were not sent (not in ``model_fields_set``) are ignored, and
+    so are sent values equal to the current ones; sending None clears a
+    field. A sent nested model is compared field by field with the current
+    one. Update fields the current model does not have, such as a password
+    on a read model, always count as changes and are marked write-only.
+    """
+    changes: Dict[str, Any] = {}
+    nested_changes: Dict[str, Tuple[str, ...]] = {}
+    write_only: List[str] = []
+    sent = update.model_fields_set
+    # Walk fields in declaration order so changesets are deterministic.
+    for name, (exists, nested) in _plan(type(current), type(update)).items():
+        if name not in sent:
+            continue
+        value = getattr(update, name)
+        if not exists:
+            changes[name] = value
+            write_only.append(name)
+            continue
+        old = getattr(current, name)
+        if nested is None:
+            if old != value:
+                changes[name] = value
+        elif value is not None and old is not None:
+            sent_children = value.model_fields_set
+            for child in type(value).model_fields:
+                if child not in sent_children:
+                    continue
+                new_child = getattr(value, child)
+                if getattr(old, child, _MISSING) != new_child:
+                    changes[f"{name}.{child}"] = new_child
+        elif old is not value:
+            changes[name] = value
+            nested_changes[name] = nested
+    return Changeset(changes, nested_changes, tuple(write_only))
@@ -0,0 +1,198 @@
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, Field, PlainSerializer, TypeAdapter, field_validator
+from typing_extensions import TypedDict
+
+from ._introspection import has_custom_serialization, nested_model
+
+
+def _split_paths(value: Any) -> Tuple[str, ...]:
+    """Accept ``"a,b.c"`` or repeated values; strip and drop duplicates."""
+    items = value.split(",") if isinstance(value, str) else value
+    paths = []
+    for item in items:
+        if not isinstance(item, str):
+            raise ValueError("fields must be strings")
+        paths.extend(part.strip() for part in item.split(","))
+    return tuple(dict.fromkeys(path for path in paths if path))
+
+
+def _include(model: Type[BaseModel], paths: Iterable[str]) -> Dict[str, Any]:
+    """Build a pydantic ``include`` spec, raising ValueError on unknown paths."""
+    include: Dict[str, Any] = {}
+    for path in paths:
+        owner = model
+        node = include
+        *parents, leaf = path.split(".")
+        for name in parents:
+            field = owner.model_fields.get(name)
+            nested = nested_model(field.annotation) if field is not None else None
+            if nested is None:
+                raise ValueError(f"Unknown field {path!r} for {model.__name__}")
+            child = node.get(name)
+            if child is True:
+                break  # the whole nested model is already included
+            node = node.setdefault(name, {})
+            owner = nested
+        else:
+            if leaf not in owner.model_fields:
+                raise ValueError(f"Unknown field {path!r} for {model.__name__}")
+            node[leaf] = True
+    return include
+
+
+def _row_type(model: Type[BaseModel], include: Dict[str, Any]) -> type:
+    """A TypedDict of the included fields, serialized from ``value.__dict__``."""
+    fields: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        spec = include.get(name)
+        if spec is None:
+            continue
+        annotation = field.annotation
+        if spec is not True:
+            nested = nested_model(annotation)
+            serializer = TypeAdapter(_row_type(nested, spec)).serializer
+
+            def project(value: Any, serializer: Any = serializer) -> Any:
+                if value is None:
+                    return None
+                return serializer.to_python(value.__dict__, mode="json")
+
+            annotation = Annotated[Any, PlainSerializer(project)]
+        fields[name] = annotation
+    return TypedDict(f"{model.__name__}Projection", fields)  # type: ignore[operator]
+
+
+class Projection:
+    """Serializer emitting only a fixed set of fields of ``model``.
+
+    Fields are top-level names or dotted paths into nested models
+    (``address.city``); naming a nested model includes all of it. Output
+    follows the model's field order and matches the full ``model_dump_json``
+    with the other fields removed. Build instances with ``get_projection``,
+    which caches one per model and field set.
+
+    The serializer is compiled for the field set: instances are read through
+    their ``__dict__`` by a TypedDict of only the requested fields, which is
+    cheaper than a full dump. Models with custom serializers fall back to
+    pydantic's ``include``, which is correct but not faster.
+    """
+
+    def __init__(self, model: Type[BaseModel], fields: FrozenSet[str]):
+        self.model = model
+        self.fields = fields
+        self.include = _include(model, sorted(fields, key=len))
+        self._records_include = {"__all__": self.include}
+        self._direct = not has_custom_serialization(model.__pydantic_core_schema__)
+        if self._direct:
+            row_type = _row_type(model, self.include)
+            self._row = TypeAdapter(row_type).serializer
+            self._rows = TypeAdapter(List[row_type]).serializer  # type: ignore[valid-type]
+        else:
+            # Imported here: query params subclass ProjectionParams, and
+            # loading them should not pull in the decoding helpers.
+            from .decoding import records_adapter
+
+            self._records = records_adapter(model)
+
+    def dump(self, value: BaseModel) -> Dict[str, Any]:
+        """Return the projected fields of ``value`` as a JSON-ready dict."""
+        if self._direct:
+            return self._row.to_python(value.__dict__, mode="json")
+        return value.model_dump(mode="json", include=self.include)
+
+    def dump_json(self, value: BaseModel) -> bytes:
+        """Return the projected fields of ``value`` as JSON."""
+        if self._direct:
+            return self._row.to_json(value.__dict__)
+        return value.__pydantic_serializer__.to_json(value, include=self.include)
+
+    def dump_json_records(self, values: Sequence[BaseModel]) -> bytes:
+        """Return a JSON array of the projected fields of each value."""
+        if self._direct:
+            return self._rows.to_json([value.__dict__ for value in values])
+        return self._records.dump_json(list(values), include=self._records_include)
+
+    def dump_json_page(self, response: Any) -> bytes:
+        """Return a ``PaginatedResponse`` or ``CursorPaginatedResponse`` as
+        JSON with its records projected and its pagination unchanged."""
+        return b"".join(
+            (
+                b'{"records":',
+                self.dump_json_records(response.records),
+                b',"pagination":',
+                response.pagination.model_dump_json().encode(),
+                b"}",
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"Projection({self.model.__name__}, {sorted(self.fields)!r})"
+
+
+@lru_cache(maxsize=128)
+def _cached_projection(model: Type[BaseModel], fields: FrozenSet[str]) -> Projection:
+    return Projection(model, fields)
+
+
+def get_projection(model: Type[BaseModel], fields: Iterable[str]) -> Projection:
+    """Return the cached ``Projection`` of ``model`` for ``fields``."""
+    return _cached_projection(model, frozenset(_split_paths(fields)))
+
+
+class ProjectionParams(BaseModel):
+    """Query params mixin adding a ``fields`` sparse fieldset.
+
+    Subclasses set ``projection_model`` to the model their listing returns;
+    requested fields are validated against it. ``fields`` accepts a
+    comma-separated string or repeated values.
+    """
+
+    projection_model: ClassVar[Optional[Type[BaseModel]]] = None
+
+    fields: Optional[Tuple[str, ...]] = Field(
+        None,
+        description="Comma-separated fields to return, e.g. id,name,address.city",
+    )
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value: Any) -> Any:
+        """Split comma-separated values and drop duplicates."""
+        if value is None:
+            return None
+        return _split_paths(value) or None
+
+    @field_validator("fields")
+    @classmethod
+    def check_fields(
+        cls, value: Optional[Tuple[str, ...]]
+    ) -> Optional[Tuple[str, ...]]:
+        """Ensure every requested path exists on ``projection_model``."""
+        if value is not None and cls.projection_model is not None:
+            # Only check the paths: compiling a serializer for every field
+            # set a client sends would be slow and could thrash the cache.
+            _include(cls.projection_model, value)
+        return value
+
+    def projection(self) -> Optional[Projection]:
+        """Return the serializer for the requested fields, or None for all.
+
+        The serializer is compiled and cached on first use.
+        """
+        if self.fields is None or self.projection_model is None:
+            return None
+        return get_projection(self.projection_model, self.fields)
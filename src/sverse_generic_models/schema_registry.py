@@ -0,0 +1,134 @@
+import hashlib
+import json
+import threading
+from importlib import metadata
+from typing import Any, Dict, Iterable, List, Literal, Tuple, Type
+
+import pydantic
+from pydantic import BaseModel
+
+from ._introspection import describe_field
+
+JsonSchemaMode = Literal["validation", "serialization"]
+MODES: Tuple[JsonSchemaMode, ...] = ("validation", "serialization")
+
+DISTRIBUTION_NAME = "shared-models"
+
+
+def schema_version() -> str:
+    """Identify the package and pydantic versions that produced a schema."""
+    try:
+        package_version = metadata.version(DISTRIBUTION_NAME)
+    except metadata.PackageNotFoundError:
+        package_version = "0+unknown"
+    return f"{package_version}+pydantic-{pydantic.VERSION}"
+
+
+def model_key(model: Type[BaseModel]) -> str:
+    """Stable registry key for ``model``, including generic parameters."""
+    return f"{model.__module__}:{model.__qualname__}"
+
+
+class SchemaRegistry:
+    """Generates JSON schemas for registered models once and caches them.
+
+    Schemas are keyed by model and mode (``validation`` or
+    ``serialization``). They can be written to a JSON artifact at build time
+    and loaded at startup; an artifact produced by a different package or
+    pydantic version, or for different model definitions, is ignored.
+    Returned schemas are shared, so callers must treat them as read-only.
+    """
+
+    def __init__(self, version: str = ""):
+        self.version = version or schema_version()
+        self._models: Dict[str, Type[BaseModel]] = {}
+        self._schemas: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, *models: Type[BaseModel]) -> None:
+        """Add ``models`` to the set covered by ``warm`` and artifacts."""
+        for model in models:
+            self._models[model_key(model)] = model
+
+    @property
+    def models(self) -> List[Type[BaseModel]]:
+        """Registered models in registration order."""
+        return list(self._models.values())
+
+    def fingerprint(self) -> str:
+        """Digest of the registered models' keys and field definitions.
+
+        Guards against stale artifacts when the package version is unchanged,
+        for example in editable installs. Built from ``describe_field`` rather
+        than ``repr``, which embeds per-process memory addresses of
+        validators and default factories.
+        """
+        digest = hashlib.sha256()
+        for key, model in sorted(self._models.items()):
+            digest.update(key.encode())
+            for name, field in model.model_fields.items():
+                digest.update(f"{name}={describe_field(field)}".encode())
+        return digest.hexdigest()[:16]
+
+    def schema(
+        self, model: Type[BaseModel], mode: JsonSchemaMode = "validation"
+    ) -> Dict[str, Any]:
+        """Return the cached JSON schema for ``model``, generating it once."""
+        key = (model_key(model), mode)
+        cached = self._schemas.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            cached = self._schemas.get(key)
+            if cached is None:
+                cached = self._schemas[key] = model.model_json_schema(mode=mode)
+        return cached
+
+    def warm(self) -> None:
+        """Generate every mode of every registered model."""
+        for model in self.models:
+            for mode in MODES:
+                self.schema(model, mode)
+
+    def clear(self) -> None:
+        """Drop all cached schemas."""
+        with self._lock:
+            self._schemas.clear()
+
+    def to_artifact(self) -> Dict[str, Any]:
+        """Return all registered schemas as a versioned, JSON-ready dict."""
+        self.warm()
+        return {
+            "version": self.version,
+            "fingerprint": self.fingerprint(),
+            "schemas": {
+                key: {mode: self._schemas[(key, mode)] for mode in MODES}
+                for key in self._models
+            },
+        }
+
+    def write_artifact(self, path: str) -> None:
+        """Write the artifact for all registered models to ``path``."""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_artifact(), handle, sort_keys=True)
+
+    def load_artifact(self, path: str) -> bool:
+        """Fill the cache from an artifact; return False if it is stale.
+
+        Only schemas of registered models are loaded, so an artifact cannot
+        shadow models this process does not know about.
+        """
+        with open(path, encoding="utf-8") as handle:
+            artifact = json.load(handle)
+        if artifact.get("version") != self.version:
+            return False
+        if artifact.get("fingerprint") != self.fingerprint():
+            return False
+        with self._lock:
+            for key, schemas in artifact.get("schemas", {}).items():
+                if key not in self._models:
+                    continue
+                for mode in MODES:
+                    if mode in schemas:
+                        self._schemas[(key, mode)] = schemas[mode]
+        return True
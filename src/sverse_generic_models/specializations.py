@@ -0,0 +1,104 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from .cursor_pagination import CursorPaginatedResponse
+from .generic_pagination import PaginatedResponse
+from .generic_response import GenericResponseModel
+
+DEFAULT_WRAPPERS: Tuple[Type[BaseModel], ...] = (
+    GenericResponseModel,
+    PaginatedResponse,
+    CursorPaginatedResponse,
+)
+
+
+class BuildTiming(NamedTuple):
+    """Time taken to build one specialization."""
+
+    name: str
+    seconds: float
+
+
+class SpecializationCache:
+    """Builds ``wrapper[model]`` specializations ahead of the first request.
+
+    Parametrizing a generic model creates a new class and compiles its
+    pydantic-core validator and serializer, which costs milliseconds on the
+    first request that needs it. Call ``warm`` at startup, or
+    ``warm_in_background`` to overlap it with other startup work. The built
+    classes are the ones pydantic hands out for ``wrapper[model]``, so
+    existing code benefits without going through ``get``.
+    """
+
+    def __init__(self, wrappers: Sequence[Type[BaseModel]] = DEFAULT_WRAPPERS):
+        self.wrappers = tuple(wrappers)
+        self._models: Dict[Type[BaseModel], None] = {}
+        self._built: Dict[Tuple[type, type], Type[BaseModel]] = {}
+        self._timings: List[BuildTiming] = []
+        self._lock = threading.Lock()
+
+    def register(self, *models: Type[BaseModel]) -> None:
+        """Add ``models`` to the set specialized by ``warm``."""
+        for model in models:
+            self._models[model] = None
+
+    @property
+    def models(self) -> List[Type[BaseModel]]:
+        """Registered models in registration order."""
+        return list(self._models)
+
+    @property
+    def timings(self) -> List[BuildTiming]:
+        """Build time of every specialization built so far, in build order."""
+        with self._lock:
+            return list(self._timings)
+
+    def get(self, wrapper: Type[BaseModel], model: type) -> Type[BaseModel]:
+        """Return ``wrapper[model]``, building and caching it once."""
+        key = (wrapper, model)
+        built = self._built.get(key)
+        if built is not None:
+            return built
+        with self._lock:
+            built = self._built.get(key)
+            if built is None:
+                start = time.perf_counter()
+                built = wrapper[model]  # type: ignore[index]
+                elapsed = time.perf_counter() - start
+                self._built[key] = built
+                self._timings.append(BuildTiming(built.__name__, elapsed))
+        return built
+
+    def warm(self) -> List[BuildTiming]:
+        """Build every wrapper of every registered model.
+
+        Returns the timings of the specializations built since the call
+        started; ones that were already cached are skipped.
+        """
+        start = len(self.timings)
+        for model in self.models:
+            for wrapper in self.wrappers:
+                self.get(wrapper, model)
+        return self.timings[start:]
+
+    def warm_in_background(self, name: Optional[str] = None) -> Future:
+        """Run ``warm`` in a daemon thread; the future resolves to its timings."""
+        future: Future = Future()
+
+        def target() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.warm())
+            except BaseException as exc:  # surfaced through the future
+                future.set_exception(exc)
+
+        thread = threading.Thread(
+            target=target, name=name or "specialization-warm-up", daemon=True
+        )
+        thread.start()
+        return future
@@ -0,0 +1,266 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from .filtering import FilterPlan, compile_filter
+from .generic_pagination import (
+    FilterLogic,
+    MatchType,
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Batches larger than this are merged into the sorted indexes with one sort
+# instead of one insort (an O(n) list insert) per record.
+_BULK_THRESHOLD = 64
+
+
+def _fold(value: Any) -> str:
+    return str(value).lower()
+
+
+class _FieldIndex:
+    """Hash and sorted indexes over one field's case-folded values."""
+
+    def __init__(self, field: str):
+        self.field = field
+        self.hash: Dict[str, Set[Hashable]] = {}
+        self.sorted: List[Tuple[str, Hashable]] = []
+
+    def value(self, record: Any) -> Optional[str]:
+        value = getattr(record, self.field, None)
+        return None if value is None else _fold(value)
+
+    def add(self, folded: str, key: Hashable) -> None:
+        self.hash.setdefault(folded, set()).add(key)
+        insort(self.sorted, (folded, key))
+
+    def add_many(self, entries: List[Tuple[str, Hashable]]) -> None:
+        for folded, key in entries:
+            self.hash.setdefault(folded, set()).add(key)
+        self.sorted.extend(entries)
+        self.sorted.sort()
+
+    def remove(self, folded: str, key: Hashable) -> None:
+        keys = self.hash.get(folded)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.hash[folded]
+        position = bisect_left(self.sorted, (folded, key))
+        if position < len(self.sorted) and self.sorted[position] == (folded, key):
+            del self.sorted[position]
+
+    def exact(self, needle: str) -> Set[Hashable]:
+        return self.hash.get(needle, set())
+
+    def prefix(self, needle: str) -> Set[Hashable]:
+        entries = self.sorted
+        keys = set()
+        position = bisect_left(entries, (needle,))
+        while position < len(entries) and entries[position][0].startswith(needle):
+            keys.add(entries[position][1])
+            position += 1
+        return keys
+
+
+class IndexedStore(Generic[ModelT]):
+    """In-memory collection of records with secondary indexes for filtering.
+
+    Records are keyed by ``key`` (``id`` by default; keys must be mutually
+    comparable) and served in key order. Each field in ``indexes`` gets a
+    hash index, used for ``MatchType.EXACT``, and a sorted index, used for
+    ``MatchType.STARTS_WITH``. Indexes hold case-folded values and only
+    narrow the candidates; every candidate is still checked with the
+    compiled filter, so results equal a full scan. ``PARTIAL`` filters and
+    filters on unindexed fields fall back to scanning.
+    """
+
+    def __init__(
+        self,
+        model: Type[ModelT],
+        indexes: Iterable[str] = (),
+        key: str = "id",
+    ):
+        self.model = model
+        self.key = key
+        self._records: Dict[Hashable, ModelT] = {}
+        self._keys: List[Hashable] = []
+        self._indexes = {field: _FieldIndex(field) for field in indexes}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._records
+
+    def __iter__(self) -> Iterator[ModelT]:
+        with self._lock:
+            return iter([self._records[key] for key in self._keys])
+
+    @property
+    def indexes(self) -> Tuple[str, ...]:
+        """Names of the indexed fields."""
+        return tuple(self._indexes)
+
+    def get(self, key: Hashable) -> Optional[ModelT]:
+        """Return the record stored under ``key``, if any."""
+        return self._records.get(key)
+
+    def _unindex(self, key: Hashable, record: ModelT) -> None:
+        for index in self._indexes.values():
+            folded = index.value(record)
+            if folded is not None:
+                index.remove(folded, key)
+
+    def upsert(self, record: ModelT) -> None:
+        """Insert ``record`` or replace the record with the same key."""
+        key = getattr(record, self.key)
+        with self._lock:
+            previous = self._records.get(key)
+            if previous is None:
+                insort(self._keys, key)
+            self._records[key] = record
+            for index in self._indexes.values():
+                folded = index.value(record)
+                if previous is not None:
+                    old = index.value(previous)
+                    if old == folded:
+                        # Sorted index updates are O(n); skip unchanged fields.
+                        continue
+                    if old is not None:
+                        index.remove(old, key)
+                if folded is not None:
+                    index.add(folded, key)
+
+    def upsert_many(self, records: Iterable[ModelT]) -> None:
+        """Insert or replace many records, re-sorting indexes once for large batches."""
+        records = list(records)
+        if len(records) <= _BULK_THRESHOLD:
+            for record in records:
+                self.upsert(record)
+            return
+        with self._lock:
+            batch = {getattr(record, self.key): record for record in records}
+            replaced = [key for key in batch if key in self._records]
+            for key in replaced:
+                self._unindex(key, self._records[key])
+            new_keys = [key for key in batch if key not in self._records]
+            self._records.update(batch)
+            self._keys.extend(new_keys)
+            self._keys.sort()
+            for index in self._indexes.values():
+                entries = []
+                for key, record in batch.items():
+                    folded = index.value(record)
+                    if folded is not None:
+                        entries.append((folded, key))
+                index.add_many(entries)
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove the record stored under ``key``; return False if absent."""
+        with self._lock:
+            record = self._records.pop(key, None)
+            if record is None:
+                return False
+            self._unindex(key, record)
+            position = bisect_left(self._keys, key)
+            del self._keys[position]
+            return True
+
+    def _candidates(
+        self, plan: FilterPlan, values: Tuple[Any, ...]
+    ) -> Optional[Set[Hashable]]:
+        """Keys that may match according to the indexes; None means scan."""
+        if plan.match_type is MatchType.PARTIAL or not plan.fields:
+            return None
+        sets = []
+        for field, value in zip(plan.fields, values):
+            index = self._indexes.get(field)
+            if index is None:
+                if plan.logic is FilterLogic.OR:
+                    return None
+                continue
+            needle = _fold(value)
+            if plan.match_type is MatchType.EXACT:
+                sets.append(index.exact(needle))
+            else:
+                sets.append(index.prefix(needle))
+        if not sets:
+            return None
+        if plan.logic is FilterLogic.OR:
+            return set().union(*sets)
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def query(
+        self,
+        params: BaseModel,
+        match_type: MatchType = MatchType.PARTIAL,
+        logic: FilterLogic = FilterLogic.AND,
+        case_sensitive: bool = False,
+    ) -> PaginatedResponse[ModelT]:
+        """Return one page of records matching the filters of ``params``.
+
+        ``params`` is a query params model; its filter fields are compiled
+        with ``compile_filter`` and, if it is a ``PaginationParams``, its
+        ``page`` and ``limit`` select the page. Filters on fields the stored
+        model lacks raise ``ValueError``. Only the page's records are
+        collected; the rest of the result is counted, not built.
+        """
+        compiled = compile_filter(
+            params, match_type, logic, case_sensitive, record_model=self.model
+        )
+        if isinstance(params, PaginationParams):
+            limit, page = params.limit, params.page
+        else:
+            limit, page = max(len(self._records), 1), 1
+        start = (page - 1) * limit
+        stop = start + limit
+        records = self._records
+
+        with self._lock:
+            candidates = self._candidates(compiled.plan, compiled.values)
+            if candidates is None:
+                total = 0
+                keys = []
+                for key in self._keys:
+                    if compiled.matches(records[key]):
+                        if start <= total < stop:
+                            keys.append(key)
+                        total += 1
+            else:
+                matched = [key for key in candidates if compiled.matches(records[key])]
+                total = len(matched)
+                keys = heapq.nsmallest(stop, matched)[start:]
+            page_records = [records[key] for key in keys]
+
+        meta = PaginationMeta(
+            total_records=total,
+            limit=limit,
+            current_page=page,
+            total_pages=-(-total // limit),
+        )
+        return PaginatedResponse[self.model].model_construct(
+            records=page_records, pagination=meta
+        )
@@ -0,0 +1,184 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    Union,
+)
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from .generic_pagination import PaginationMeta
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+Records = Union[Iterable[Any], AsyncIterable[Any]]
+Encoder = Callable[[Any], bytes]
+
+
+@lru_cache(maxsize=128)
+def _item_encoder(model: Type[Any]) -> Encoder:
+    return TypeAdapter(model).dump_json
+
+
+def _ndjson_encoder(model: Type[Any]) -> Encoder:
+    dump_json = _item_encoder(model)
+    return lambda record: dump_json(record) + b"\n"
+
+
+class _ChunkBuffer:
+    """Accumulates encoded records and hands out chunks of about ``chunk_size``."""
+
+    def __init__(self, prefix: bytes, separator: bytes, chunk_size: int):
+        self._buffer = bytearray(prefix)
+        self._separator = separator
+        self._chunk_size = chunk_size
+        self._first = True
+
+    def add(self, encoded: bytes) -> Optional[bytes]:
+        if self._first:
+            self._first = False
+        else:
+            self._buffer += self._separator
+        self._buffer += encoded
+        if len(self._buffer) < self._chunk_size:
+            return None
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return chunk
+
+    def finish(self, suffix: bytes) -> bytes:
+        self._buffer += suffix
+        return bytes(self._buffer)
+
+
+def _stream(
+    encode: Encoder,
+    records: Iterable[Any],
+    prefix: bytes,
+    separator: bytes,
+    suffix: bytes,
+    chunk_size: int,
+) -> Iterator[bytes]:
+    buffer = _ChunkBuffer(prefix, separator, chunk_size)
+    for record in records:
+        chunk = buffer.add(encode(record))
+        if chunk is not None:
+            yield chunk
+    yield buffer.finish(suffix)
+
+
+async def _astream(
+    encode: Encoder,
+    records: Records,
+    prefix: bytes,
+    separator: bytes,
+    suffix: bytes,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    if not isinstance(records, AsyncIterable):
+        for chunk in _stream(encode, records, prefix, separator, suffix, chunk_size):
+            yield chunk
+        return
+    buffer = _ChunkBuffer(prefix, separator, chunk_size)
+    async for record in records:
+        chunk = buffer.add(encode(record))
+        if chunk is not None:
+            yield chunk
+    yield buffer.finish(suffix)
+
+
+def _paginated_envelope(pagination: PaginationMeta) -> tuple:
+    meta = pagination.model_dump_json().encode()
+    return b'{"records":[', b'],"pagination":' + meta + b"}"
+
+
+def _generic_envelope(message: str) -> tuple:
+    return b'{"message":' + to_json(message) + b',"data":[', b"]}"
+
+
+def _ndjson_header(pagination: Optional[PaginationMeta]) -> bytes:
+    if pagination is None:
+        return b""
+    return b'{"pagination":' + pagination.model_dump_json().encode() + b"}\n"
+
+
+def stream_paginated_json(
+    model: Type[Any],
+    records: Iterable[Any],
+    pagination: PaginationMeta,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield ``PaginatedResponse[model]`` JSON in chunks without building it.
+
+    The concatenated chunks are byte-for-byte identical to
+    ``PaginatedResponse[model](records=..., pagination=...).model_dump_json()``.
+    Only one chunk of about ``chunk_size`` bytes is held at a time.
+    """
+    prefix, suffix = _paginated_envelope(pagination)
+    return _stream(_item_encoder(model), records, prefix, b",", suffix, chunk_size)
+
+
+def astream_paginated_json(
+    model: Type[Any],
+    records: Records,
+    pagination: PaginationMeta,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Async variant of ``stream_paginated_json`` accepting sync or async records."""
+    prefix, suffix = _paginated_envelope(pagination)
+    return _astream(_item_encoder(model), records, prefix, b",", suffix, chunk_size)
+
+
+def stream_generic_response_json(
+    model: Type[Any],
+    message: str,
+    data: Iterable[Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield ``GenericResponseModel[List[model]]`` JSON in chunks."""
+    prefix, suffix = _generic_envelope(message)
+    return _stream(_item_encoder(model), data, prefix, b",", suffix, chunk_size)
+
+
+def astream_generic_response_json(
+    model: Type[Any],
+    message: str,
+    data: Records,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Async variant of ``stream_generic_response_json``."""
+    prefix, suffix = _generic_envelope(message)
+    return _astream(_item_encoder(model), data, prefix, b",", suffix, chunk_size)
+
+
+def stream_ndjson(
+    model: Type[Any],
+    records: Iterable[Any],
+    pagination: Optional[PaginationMeta] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield one JSON document per record, newline-delimited.
+
+    When ``pagination`` is given it is emitted first as a
+    ``{"pagination": {...}}`` line.
+    """
+    header = _ndjson_header(pagination)
+    return _stream(_ndjson_encoder(model), records, header, b"", b"", chunk_size)
+
+
+def astream_ndjson(
+    model: Type[Any],
+    records: Records,
+    pagination: Optional[PaginationMeta] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Async variant of ``stream_ndjson`` accepting sync or async records."""
+    header = _ndjson_header(pagination)
+    return _astream(_ndjson_encoder(model), records, header, b"", b"", chunk_size)
@@ -0,0 +1,78 @@
+import sys
+import types
+import typing
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Type, TypeVar, Union
+
+from pydantic import BaseModel, ConfigDict
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+STRICT_CONFIG = ConfigDict(strict=True)
+
+
+def _strict_annotation(annotation: Any) -> Any:
+    """``annotation`` with every nested model replaced by its strict variant."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return strict_model(annotation)
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is None or not args:
+        return annotation
+    if origin is Annotated:
+        inner = _strict_annotation(args[0])
+        if inner is args[0]:
+            return annotation
+        return Annotated[(inner, *annotation.__metadata__)]
+    strict_args = tuple(_strict_annotation(arg) for arg in args)
+    if all(new is old for new, old in zip(strict_args, args)):
+        return annotation
+    if origin in (Union, types.UnionType):
+        return Union[strict_args]
+    return origin[strict_args]
+
+
+@lru_cache(maxsize=128)
+def strict_model(model: Type[ModelT]) -> Type[ModelT]:
+    """Return the cached strict variant of ``model``.
+
+    The variant is a subclass validating in pydantic's strict mode: values
+    must already have the declared types (``"1"`` is not an ``int``), which
+    suits payloads exchanged between our own services. Nested models,
+    including the records of parametrized generic responses, are replaced
+    by their strict variants. Field names, validators and serialization are
+    inherited, so the JSON shape is unchanged and instances are still
+    instances of ``model``. The variant is registered on ``model``'s module
+    under its own name so instances can be pickled, e.g. for process pools.
+    """
+    if model.__dict__.get("__strict_variant__"):
+        return model
+    if model.__pydantic_generic_metadata__["parameters"]:
+        raise ValueError(f"Parametrize {model.__name__} before making it strict")
+    class_name = f"Strict{model.__name__}"
+    annotations: Dict[str, Any] = {}
+    namespace: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        annotation = _strict_annotation(field.annotation)
+        if annotation is not field.annotation:
+            annotations[name] = annotation
+            namespace[name] = field
+    namespace.update(
+        {
+            "__module__": model.__module__,
+            "__qualname__": class_name,
+            "__annotations__": annotations,
+            "__strict_variant__": True,
+            "model_config": STRICT_CONFIG,
+        }
+    )
+    variant = type(model)(class_name, (model,), namespace)
+    module = sys.modules.get(model.__module__)
+    existing = getattr(module, class_name, None)
+    if module is not None and (
+        existing is None
+        or isinstance(existing, type)
+        and existing.__dict__.get("__strict_variant__", False)
+    ):
+        setattr(module, class_name, variant)
+    return variant
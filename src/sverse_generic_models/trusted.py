@@ -0,0 +1,236 @@
+import logging
+import random
+import threading
+import types
+import typing
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+_object_setattr = object.__setattr__
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def _nested_converter(annotation: Any) -> Converter:
+    """Return a function building nested models for ``annotation``, if any."""
+    origin = typing.get_origin(annotation)
+    if origin is None:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return lambda value: _construct_value(annotation, value)
+        return None
+    args = typing.get_args(annotation)
+    if origin in (list, tuple, set, frozenset) and args:
+        item = _nested_converter(args[0])
+        if item is None:
+            return None
+        return lambda value: (
+            None if value is None else origin(item(entry) for entry in value)
+        )
+    if origin in (typing.Union, types.UnionType):
+        # Optional[...]: _construct_value and the sequence converter above
+        # pass None through.
+        for arg in args:
+            converter = _nested_converter(arg)
+            if converter is not None:
+                return converter
+    return None
+
+
+def _construct_value(model: Type[BaseModel], value: Any) -> Any:
+    if value is None or isinstance(value, BaseModel):
+        return value
+    return construct_trusted(model, value)
+
+
+class _Plan(NamedTuple):
+    """How ``construct_trusted`` builds one model type."""
+
+    # (name, nested converter, whether the field has a default) per field.
+    fields: Tuple[Tuple[str, Converter, bool], ...]
+    names: Tuple[str, ...]
+    keys: frozenset
+    nested: Tuple[Tuple[str, Callable[[Any], Any]], ...]
+    # Whether instances can be assembled directly instead of via
+    # model_construct, which is pure Python and costs more than validating.
+    direct: bool
+    extra: Optional[dict]
+
+
+@lru_cache(maxsize=256)
+def _plan(model: Type[BaseModel]) -> _Plan:
+    fields = tuple(
+        (name, _nested_converter(field.annotation), not field.is_required())
+        for name, field in model.model_fields.items()
+    )
+    names = tuple(model.model_fields)
+    nested = tuple(
+        (name, converter) for name, converter, _ in fields if converter is not None
+    )
+    direct = not model.__pydantic_root_model__ and not model.__pydantic_post_init__
+    extra = {} if model.model_config.get("extra") == "allow" else None
+    return _Plan(fields, names, frozenset(names), nested, direct, extra)
+
+
+def _collect(model: Type[BaseModel], plan: _Plan, data: Any) -> Tuple[dict, set]:
+    """Field values of ``data``, filling defaults for missing fields."""
+    if isinstance(data, Mapping):
+        get = data.get
+    else:
+
+        def get(name: str, default: Any) -> Any:
+            return getattr(data, name, default)
+
+    values = {}
+    fields_set = set()
+    for name, converter, has_default in plan.fields:
+        value = get(name, _MISSING)
+        if value is _MISSING:
+            if has_default:
+                values[name] = model.model_fields[name].get_default(
+                    call_default_factory=True, validated_data=values
+                )
+            continue
+        values[name] = value if converter is None else converter(value)
+        fields_set.add(name)
+    return values, fields_set
+
+
+def construct_trusted(model: Type[ModelT], data: Any) -> ModelT:
+    """Build ``model`` from already-validated ``data`` without validation.
+
+    Unlike ``model.model_construct(**data)``, nested models (including those
+    inside ``Optional`` and lists) are constructed too, and ``data`` may be a
+    mapping or an object exposing the fields as attributes, such as an ORM
+    row. Only use this for data that was validated when it was written.
+    """
+    plan = _plan(model)
+    if (type(data) is dict or isinstance(data, Mapping)) and plan.keys <= data.keys():
+        # Common case: every field present, read without a per-field loop.
+        values = {name: data[name] for name in plan.names}
+        for name, converter in plan.nested:
+            values[name] = converter(values[name])
+        fields_set = set(plan.keys)
+    else:
+        values, fields_set = _collect(model, plan, data)
+    if not plan.direct:
+        return model.model_construct(fields_set, **values)
+    # What model_construct does, without its per-field alias handling.
+    instance = model.__new__(model)
+    _object_setattr(instance, "__dict__", values)
+    _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+    _object_setattr(instance, "__pydantic_extra__", None if plan.extra is None else {})
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
+
+
+class TrustedMismatch(NamedTuple):
+    """A sampled object whose trusted construction disagreed with validation."""
+
+    model: Type[BaseModel]
+    data: Any
+    error: Optional[ValidationError]
+    constructed: dict
+    validated: Optional[dict]
+
+
+class TrustedStats(NamedTuple):
+    """Counters for a ``TrustedLoader``."""
+
+    constructed: int
+    sampled: int
+    mismatches: int
+
+
+def _log_mismatch(mismatch: TrustedMismatch) -> None:
+    logger.warning(
+        "Trusted %s data failed sampled validation: %s",
+        mismatch.model.__name__,
+        mismatch.error or "validated value differs from constructed value",
+    )
+
+
+class TrustedLoader(Generic[ModelT]):
+    """Constructs models from trusted rows, fully validating a random sample.
+
+    ``sample_rate`` is the fraction of objects that are also run through
+    ``model_validate``; any validation error or difference is passed to
+    ``on_mismatch`` (logged as a warning by default). When the validated
+    value differs it is returned instead of the constructed one; when
+    validation fails the constructed value is returned.
+    """
+
+    def __init__(
+        self,
+        model: Type[ModelT],
+        sample_rate: float = 0.01,
+        on_mismatch: Callable[[TrustedMismatch], None] = _log_mismatch,
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.model = model
+        self.sample_rate = sample_rate
+        self.on_mismatch = on_mismatch
+        self._lock = threading.Lock()
+        self._constructed = 0
+        self._sampled = 0
+        self._mismatches = 0
+
+    def load(self, data: Any) -> ModelT:
+        """Construct one model, validating it if it falls in the sample."""
+        instance = construct_trusted(self.model, data)
+        sampled = self.sample_rate and random.random() < self.sample_rate
+        with self._lock:
+            self._constructed += 1
+            self._sampled += bool(sampled)
+        if sampled:
+            return self._verify(data, instance)
+        return instance
+
+    def load_many(self, rows: Iterable[Any]) -> List[ModelT]:
+        """Construct a model per row."""
+        return [self.load(row) for row in rows]
+
+    def _verify(self, data: Any, instance: ModelT) -> ModelT:
+        constructed = instance.model_dump(warnings=False)
+        try:
+            validated = self.model.model_validate(data, from_attributes=True)
+        except ValidationError as exc:
+            self._report(TrustedMismatch(self.model, data, exc, constructed, None))
+            return instance
+        validated_dump = validated.model_dump()
+        if validated_dump != constructed:
+            self._report(
+                TrustedMismatch(self.model, data, None, constructed, validated_dump)
+            )
+            return validated
+        return instance
+
+    def _report(self, mismatch: TrustedMismatch) -> None:
+        with self._lock:
+            self._mismatches += 1
+        self.on_mismatch(mismatch)
+
+    def stats(self) -> TrustedStats:
+        """Return a snapshot of the loader's counters."""
+        with self._lock:
+            return TrustedStats(self._constructed, self._sampled, self._mismatches)
@@ -0,0 +1,85 @@
+"""Reusable field validators and validated types.
+
+Public names are imported lazily on first attribute access so that importing
+the package does not build every model or load optional heavy dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .batch import BatchItemResult, validate_emails, validate_phone_numbers
+    from .cache import BoundedCache, CacheInfo
+    from .email_address import (
+        EmailStr,
+        email_cache,
+        normalize_email,
+        validate_email_address,
+    )
+    from .instrumentation import (
+        HistogramStats,
+        InMemorySink,
+        InstrumentationSink,
+        LatencyHistogram,
+        SeriesStats,
+        active_sink,
+        disable_instrumentation,
+        enable_instrumentation,
+        instrumented_validator,
+    )
+    from .interning import (
+        InternedStr,
+        InternStats,
+        InternTable,
+        interned_model,
+        string_intern_table,
+    )
+    from .phone_number import (
+        normalize_phone_number,
+        phone_number_cache,
+        validate_phone_number_format,
+    )
+
+_EXPORTS = {
+    "BatchItemResult": ".batch",
+    "validate_emails": ".batch",
+    "validate_phone_numbers": ".batch",
+    "BoundedCache": ".cache",
+    "CacheInfo": ".cache",
+    "EmailStr": ".email_address",
+    "email_cache": ".email_address",
+    "normalize_email": ".email_address",
+    "validate_email_address": ".email_address",
+    "HistogramStats": ".instrumentation",
+    "InMemorySink": ".instrumentation",
+    "InstrumentationSink": ".instrumentation",
+    "LatencyHistogram": ".instrumentation",
+    "SeriesStats": ".instrumentation",
+    "active_sink": ".instrumentation",
+    "disable_instrumentation": ".instrumentation",
+    "enable_instrumentation": ".instrumentation",
+    "instrumented_validator": ".instrumentation",
+    "InternedStr": ".interning",
+    "InternStats": ".interning",
+    "InternTable": ".interning",
+    "interned_model": ".interning",
+    "string_intern_table": ".interning",
+    "normalize_phone_number": ".phone_number",
+    "phone_number_cache": ".phone_number",
+    "validate_phone_number_format": ".phone_number",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,125 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence
+
+from .email_address import normalize_email
+from .phone_number import normalize_phone_number
+
+# Below this many unique values the cost of shipping work to other processes
+# outweighs the parsing time saved.
+DEFAULT_PARALLEL_THRESHOLD = 20_000
+DEFAULT_CHUNK_SIZE = 5_000
+
+
+class BatchItemResult(NamedTuple):
+    """Outcome of validating a single value within a batch."""
+
+    value: Optional[str]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True when the value passed validation."""
+        return self.error is None
+
+
+def _validate_chunk(
+    validator: Callable[[Optional[str]], Optional[str]],
+    chunk: Sequence[Optional[str]],
+) -> List[BatchItemResult]:
+    results = []
+    for raw in chunk:
+        try:
+            results.append(BatchItemResult(validator(raw)))
+        except ValueError as exc:
+            results.append(BatchItemResult(None, str(exc)))
+    return results
+
+
+def run_batch(
+    validator: Callable[[Optional[str]], Optional[str]],
+    values: Iterable[Optional[str]],
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+) -> List[BatchItemResult]:
+    """Apply ``validator`` to deduplicated ``values`` and fan results back out.
+
+    ``validator`` must be picklable (a module-level function or a
+    ``partial`` of one) when the work is spread across processes. Results are
+    returned in input order, one per input value.
+    """
+    items = list(values)
+    unique = list(dict.fromkeys(items))
+
+    parallel = executor is not None or workers > 1
+    if not parallel or len(unique) < parallel_threshold:
+        outcomes = _validate_chunk(validator, unique)
+    else:
+        chunks = [
+            unique[start : start + chunk_size]
+            for start in range(0, len(unique), chunk_size)
+        ]
+        validators = [validator] * len(chunks)
+        if executor is not None:
+            mapped = executor.map(_validate_chunk, validators, chunks)
+            outcomes = [result for chunk in mapped for result in chunk]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                mapped = pool.map(_validate_chunk, validators, chunks)
+                outcomes = [result for chunk in mapped for result in chunk]
+
+    by_value = dict(zip(unique, outcomes))
+    return [by_value[item] for item in items]
+
+
+def validate_phone_numbers(
+    phones: Iterable[Optional[str]],
+    region: Optional[str] = None,
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+) -> List[BatchItemResult]:
+    """Validate many phone numbers and format the valid ones to E.164.
+
+    Each result matches what ``validate_phone_number_format`` returns or
+    raises for the same input and ``region``. The shared validation cache is
+    bypassed so bulk imports do not evict entries used by regular traffic.
+    """
+    return run_batch(
+        partial(normalize_phone_number, region=region),
+        phones,
+        workers=workers,
+        executor=executor,
+        chunk_size=chunk_size,
+        parallel_threshold=parallel_threshold,
+    )
+
+
+def _normalize_optional_email(email: Optional[str]) -> Optional[str]:
+    return email if email is None else normalize_email(email)
+
+
+def validate_emails(
+    emails: Iterable[Optional[str]],
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+) -> List[BatchItemResult]:
+    """Validate and normalize many email addresses.
+
+    Each result holds the address ``EmailStr`` would produce, or the error
+    message it would report, for the same input; None stays None. Like
+    ``validate_phone_numbers``, the shared cache is bypassed.
+    """
+    return run_batch(
+        _normalize_optional_email,
+        emails,
+        workers=workers,
+        executor=executor,
+        chunk_size=chunk_size,
+        parallel_threshold=parallel_threshold,
+    )
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional, Tuple
+
+
+class CacheInfo(NamedTuple):
+    """Snapshot of a cache's counters and configuration."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    maxsize: int
+    ttl: Optional[float]
+
+
+_MISSING = object()
+
+
+class BoundedCache:
+    """Thread-safe LRU cache with an optional time-to-live per entry.
+
+    The cache never holds more than ``maxsize`` entries; a ``maxsize`` of 0
+    disables caching entirely. Entries older than ``ttl`` seconds are treated
+    as misses and dropped on access.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self._validate_config(maxsize, ttl)
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def _validate_config(maxsize: int, ttl: Optional[float]) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0 or None")
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries held by the cache."""
+        return self._maxsize
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Entry lifetime in seconds, or None for no expiry."""
+        return self._ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` on a miss."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self._misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries if full."""
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            expires_at = time.monotonic() + self._ttl if self._ttl else None
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            self._evict_overflow()
+
+    def _evict_overflow(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def configure(
+        self,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = _MISSING,  # type: ignore[assignment]
+    ) -> None:
+        """Resize the cache and/or change its TTL at runtime.
+
+        Shrinking evicts the least recently used entries immediately. A new
+        TTL only applies to entries stored after the change.
+        """
+        with self._lock:
+            new_maxsize = self._maxsize if maxsize is None else maxsize
+            new_ttl = self._ttl if ttl is _MISSING else ttl
+            self._validate_config(new_maxsize, new_ttl)
+            self._maxsize = new_maxsize
+            self._ttl = new_ttl
+            self._evict_overflow()
+
+    def info(self) -> CacheInfo:
+        """Return a consistent snapshot of the cache counters."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                currsize=len(self._data),
+                maxsize=self._maxsize,
+                ttl=self._ttl,
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import PydanticCustomError, core_schema
+
+from .cache import BoundedCache
+from .instrumentation import instrumented_validator
+
+# Inputs longer than this are never cached; valid addresses are at most 254
+# characters, leaving room for a display name.
+MAX_CACHEABLE_LENGTH = 320
+
+email_cache = BoundedCache(maxsize=4096)
+"""Shared cache of email normalization results, including rejected inputs."""
+
+
+class _InvalidEmail:
+    """Cached description of the error raised for an invalid input."""
+
+    __slots__ = ("error_type", "message_template", "context")
+
+    def __init__(self, error: PydanticCustomError):
+        self.error_type = error.type
+        self.message_template = error.message_template
+        self.context = error.context
+
+    def error(self) -> PydanticCustomError:
+        # A fresh exception per hit: re-raising one instance would keep
+        # growing its traceback.
+        return PydanticCustomError(self.error_type, self.message_template, self.context)
+
+
+def normalize_email(value: str) -> str:
+    """Validate ``value`` like ``pydantic.EmailStr`` without using the cache.
+
+    Returns the normalized address; invalid input raises the same
+    ``PydanticCustomError`` (a ``ValueError``) as ``pydantic.EmailStr``.
+    """
+    # Imported on first use: email_validator noticeably slows cold starts.
+    from pydantic.networks import validate_email
+
+    return validate_email(value)[1]
+
+
+@instrumented_validator()
+def validate_email_address(value: str) -> str:
+    """Validate and normalize ``value``, memoizing results in ``email_cache``."""
+    if len(value) > MAX_CACHEABLE_LENGTH:
+        return normalize_email(value)
+
+    cached: Optional[Any] = email_cache.get(value)
+    if cached is not None:
+        if isinstance(cached, _InvalidEmail):
+            raise cached.error()
+        return cached
+
+    try:
+        result = normalize_email(value)
+    except PydanticCustomError as exc:
+        email_cache.put(value, _InvalidEmail(exc))
+        raise
+    email_cache.put(value, result)
+    return result
+
+
+if TYPE_CHECKING:
+    EmailStr = str
+else:
+
+    class EmailStr:
+        """Drop-in replacement for ``pydantic.EmailStr``.
+
+        Validation and JSON schema are identical, but ``email_validator`` is
+        only imported the first time a value is validated instead of when the
+        model class is built, and results are memoized in ``email_cache``.
+        """
+
+        @classmethod
+        def __get_pydantic_core_schema__(
+            cls, _source: type[Any], _handler: GetCoreSchemaHandler
+        ) -> core_schema.CoreSchema:
+            return core_schema.no_info_after_validator_function(
+                cls._validate, core_schema.str_schema()
+            )
+
+        @classmethod
+        def __get_pydantic_json_schema__(
+            cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+        ) -> JsonSchemaValue:
+            field_schema = handler(schema)
+            field_schema.update(type="string", format="email")
+            return field_schema
+
+        @classmethod
+        def _validate(cls, input_value: str, /) -> str:
+            return validate_email_address(input_value)
@@ -0,0 +1,310 @@
+import abc
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Kinds of measured operations.
+VALIDATE = "validate"
+SERIALIZE = "serialize"
+VALIDATOR = "validator"
+
+_MODEL_METHODS = {
+    "__init__": VALIDATE,
+    "model_validate": VALIDATE,
+    "model_validate_json": VALIDATE,
+    "model_validate_strings": VALIDATE,
+    "model_dump": SERIALIZE,
+    "model_dump_json": SERIALIZE,
+}
+
+_MISSING = object()
+
+
+def _bucket(ns: int) -> int:
+    # Four buckets per power of two: values within ~20% share a bucket.
+    if ns < 4:
+        return max(ns, 0)
+    shift = ns.bit_length() - 3
+    return shift * 4 + (ns >> shift)
+
+
+def _bucket_floor(index: int) -> int:
+    if index < 8:
+        return index
+    shift, top = divmod(index - 4, 4)
+    return (top + 4) << shift
+
+
+class HistogramStats(NamedTuple):
+    """Summary of a ``LatencyHistogram``; times are in seconds."""
+
+    count: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in nanoseconds.
+
+    Recording is a bit-length computation and a list increment, so it is
+    cheap enough for every validation call. Percentiles are accurate to
+    about 20%. Not thread-safe on its own; ``InMemorySink`` serializes
+    access.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = []
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        """Add one duration."""
+        index = _bucket(ns)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, fraction: float) -> float:
+        """Return the lower bound, in seconds, of the bucket holding ``fraction``."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return _bucket_floor(index) / 1e9
+        return self.max / 1e9
+
+    def stats(self) -> HistogramStats:
+        """Return count, mean, p50/p90/p99 and max in seconds."""
+        mean = self.total / self.count / 1e9 if self.count else 0.0
+        return HistogramStats(
+            count=self.count,
+            mean=mean,
+            p50=self.percentile(0.5),
+            p90=self.percentile(0.9),
+            p99=self.percentile(0.99),
+            max=self.max / 1e9,
+        )
+
+
+class SeriesStats(NamedTuple):
+    """Latency and outcomes of one measured operation."""
+
+    latency: HistogramStats
+    successes: int
+    failures: Dict[str, int]
+
+
+class InstrumentationSink(abc.ABC):
+    """Receives one event per measured call; subclass to export elsewhere.
+
+    ``kind`` is ``"validate"``, ``"serialize"`` or ``"validator"``, ``name``
+    is the model class or validator name, and ``error`` is None on success
+    or the error type (for example ``"missing"`` or ``"value_error"``).
+    ``record`` runs inline on the measured call and must be fast.
+    """
+
+    @abc.abstractmethod
+    def record(self, kind: str, name: str, ns: int, error: Optional[str]) -> None:
+        """Handle one measured call."""
+
+
+class InMemorySink(InstrumentationSink):
+    """Default sink aggregating events into in-process histograms."""
+
+    def __init__(self) -> None:
+        self._series: Dict[Tuple[str, str], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, name: str, ns: int, error: Optional[str]) -> None:
+        key = (kind, name)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [LatencyHistogram(), 0, {}]
+            series[0].record(ns)
+            if error is None:
+                series[1] += 1
+            else:
+                series[2][error] = series[2].get(error, 0) + 1
+
+    def snapshot(self) -> Dict[Tuple[str, str], SeriesStats]:
+        """Return stats per ``(kind, name)``, sorted by kind and name."""
+        with self._lock:
+            return {
+                key: SeriesStats(histogram.stats(), successes, dict(failures))
+                for key, (histogram, successes, failures) in sorted(
+                    self._series.items()
+                )
+            }
+
+    def reset(self) -> None:
+        """Drop all recorded events."""
+        with self._lock:
+            self._series.clear()
+
+    def report(self) -> str:
+        """Render the snapshot as a plain-text table, times in microseconds."""
+        lines = [
+            f"{'kind':<10} {'name':<40} {'count':>8} {'fail':>6} "
+            f"{'mean':>9} {'p50':>9} {'p99':>9}"
+        ]
+        for (kind, name), series in self.snapshot().items():
+            latency = series.latency
+            lines.append(
+                f"{kind:<10} {name:<40} {latency.count:>8} "
+                f"{sum(series.failures.values()):>6} {latency.mean * 1e6:>9.2f} "
+                f"{latency.p50 * 1e6:>9.2f} {latency.p99 * 1e6:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+_sink: Optional[InstrumentationSink] = None
+_patched: Dict[type, Dict[str, Any]] = {}
+_patch_lock = threading.Lock()
+
+
+def _error_type(exc: BaseException) -> str:
+    # Imported here: the validators using this module avoid loading pydantic.
+    from pydantic import ValidationError
+
+    if isinstance(exc, ValidationError):
+        errors = exc.errors(include_url=False, include_context=False)
+        return errors[0]["type"] if errors else "validation_error"
+    # PydanticCustomError carries its own type, e.g. "value_error".
+    return getattr(exc, "type", None) or type(exc).__name__
+
+
+def instrumented_validator(name: Optional[str] = None) -> Callable:
+    """Decorate a validator function so its calls are measured when enabled.
+
+    While instrumentation is disabled the wrapper only checks a global and
+    calls through.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sink = _sink
+            if sink is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as exc:
+                sink.record(
+                    VALIDATOR, label, time.perf_counter_ns() - start, _error_type(exc)
+                )
+                raise
+            sink.record(VALIDATOR, label, time.perf_counter_ns() - start, None)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def _timed_method(original: Callable, kind: str, is_classmethod: bool) -> Callable:
+    @functools.wraps(original)
+    def wrapper(owner: Any, *args: Any, **kwargs: Any) -> Any:
+        sink = _sink
+        if sink is None:
+            return original(owner, *args, **kwargs)
+        name = owner.__name__ if is_classmethod else type(owner).__name__
+        start = time.perf_counter_ns()
+        try:
+            result = original(owner, *args, **kwargs)
+        except Exception as exc:
+            sink.record(kind, name, time.perf_counter_ns() - start, _error_type(exc))
+            raise
+        sink.record(kind, name, time.perf_counter_ns() - start, None)
+        return result
+
+    wrapper._sv_instrumented = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _instrument_model(model: type) -> None:
+    if model in _patched:
+        return
+    saved = {}
+    for method, kind in _MODEL_METHODS.items():
+        static = next(
+            klass.__dict__[method]
+            for klass in model.__mro__
+            if method in klass.__dict__
+        )
+        is_classmethod = isinstance(static, classmethod)
+        function = static.__func__ if is_classmethod else static
+        if getattr(function, "_sv_instrumented", False):
+            # Inherited from an instrumented base, which already records
+            # under the concrete class name.
+            continue
+        saved[method] = model.__dict__.get(method, _MISSING)
+        wrapper = _timed_method(function, kind, is_classmethod)
+        setattr(model, method, classmethod(wrapper) if is_classmethod else wrapper)
+    _patched[model] = saved
+
+
+def _uninstrument_all() -> None:
+    for model, saved in _patched.items():
+        for method, original in saved.items():
+            if original is _MISSING:
+                delattr(model, method)
+            else:
+                setattr(model, method, original)
+    _patched.clear()
+
+
+def enable_instrumentation(
+    sink: Optional[InstrumentationSink] = None, models: Iterable[type] = ()
+) -> InstrumentationSink:
+    """Start sending measurements to ``sink`` (a new ``InMemorySink`` if None).
+
+    Validators decorated with ``instrumented_validator`` are always covered.
+    ``models`` are patched so their validation (``__init__`` and
+    ``model_validate*``) and serialization (``model_dump*``) calls are
+    timed; subclasses, including generic specializations, are covered
+    through their base. Validation of nested models is included in the
+    outer call's time.
+    """
+    from pydantic import BaseModel
+
+    global _sink
+    sink = sink if sink is not None else InMemorySink()
+    with _patch_lock:
+        for model in models:
+            if not (isinstance(model, type) and issubclass(model, BaseModel)):
+                raise ValueError(f"{model!r} is not a pydantic model class")
+            _instrument_model(model)
+        _sink = sink
+    return sink
+
+
+def disable_instrumentation() -> None:
+    """Stop measuring and restore the original model methods."""
+    global _sink
+    with _patch_lock:
+        _sink = None
+        _uninstrument_all()
+
+
+def active_sink() -> Optional[InstrumentationSink]:
+    """Return the active sink, or None while instrumentation is disabled."""
+    return _sink
@@ -0,0 +1,215 @@
+import sys
+import threading
+import types
+import typing
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import AfterValidator, BaseModel, ValidationInfo
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Key looked up in the pydantic validation context to choose the table.
+INTERN_CONTEXT_KEY = "intern_strings"
+
+# Longer values are unlikely to repeat and are never stored in a table.
+MAX_INTERNABLE_LENGTH = 64
+
+
+class InternStats(NamedTuple):
+    """Snapshot of an ``InternTable``'s counters."""
+
+    hits: int
+    misses: int
+    rejected: int
+    currsize: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that returned an already interned string."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class InternTable:
+    """Bounded, thread-safe table mapping equal strings to one shared object.
+
+    Once ``maxsize`` distinct strings are held, new strings are returned
+    unchanged (and counted as rejected) rather than evicting older ones, so
+    strings already shared stay shared. Values longer than
+    ``MAX_INTERNABLE_LENGTH`` are never stored.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self._maxsize = maxsize
+        self._table: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._rejected = 0
+
+    def intern(self, value: str) -> str:
+        """Return the shared object equal to ``value``, storing it if there is room."""
+        if len(value) > MAX_INTERNABLE_LENGTH:
+            with self._lock:
+                self._rejected += 1
+            return value
+        with self._lock:
+            existing = self._table.get(value)
+            if existing is not None:
+                self._hits += 1
+                return existing
+            self._misses += 1
+            if len(self._table) >= self._maxsize:
+                self._rejected += 1
+                return value
+            self._table[value] = value
+            return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._table.clear()
+            self._hits = self._misses = self._rejected = 0
+
+    def configure(self, maxsize: int) -> None:
+        """Change the capacity; shrinking below the current size clears the table."""
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        with self._lock:
+            self._maxsize = maxsize
+            if len(self._table) > maxsize:
+                self._table.clear()
+
+    def info(self) -> InternStats:
+        """Return a consistent snapshot of the table counters."""
+        with self._lock:
+            return InternStats(
+                hits=self._hits,
+                misses=self._misses,
+                rejected=self._rejected,
+                currsize=len(self._table),
+                maxsize=self._maxsize,
+            )
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+string_intern_table = InternTable()
+"""Default table used when interning is requested with ``True``."""
+
+
+def table_from_context(context: Optional[Any]) -> Optional[InternTable]:
+    """Return the intern table requested by a validation context, if any.
+
+    ``{"intern_strings": True}`` selects ``string_intern_table``; an
+    ``InternTable`` instance selects that table. Contexts that are not
+    mappings request nothing.
+    """
+    if not context or not isinstance(context, Mapping):
+        return None
+    requested = context.get(INTERN_CONTEXT_KEY)
+    if isinstance(requested, InternTable):
+        return requested
+    return string_intern_table if requested else None
+
+
+def _intern_validator(value: str, info: ValidationInfo) -> str:
+    table = table_from_context(info.context)
+    return (string_intern_table if table is None else table).intern(value)
+
+
+class _Internable:
+    """Marker for fields deduplicated by ``interned_model`` variants."""
+
+    def __repr__(self) -> str:
+        return "Internable"
+
+
+_INTERNABLE = _Internable()
+_INTERN = AfterValidator(_intern_validator)
+
+InternedStr = Annotated[str, _INTERNABLE]
+"""A ``str`` deduplicated through an intern table by the ``interned_model``
+variant of its model, for low-cardinality fields such as statuses or
+cities. Plain validation ignores the marker and costs nothing extra."""
+
+
+def _interned_annotation(annotation: Any) -> Any:
+    """``annotation`` with markers and nested models swapped for interning."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return interned_model(annotation)
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is None or not args:
+        return annotation
+    if origin is Annotated:
+        inner = _interned_annotation(args[0])
+        metadata = annotation.__metadata__
+        if inner is args[0] and _INTERNABLE not in metadata:
+            return annotation
+        metadata = tuple(_INTERN if item is _INTERNABLE else item for item in metadata)
+        return Annotated[(inner, *metadata)]
+    interned_args = tuple(_interned_annotation(arg) for arg in args)
+    if all(new is old for new, old in zip(interned_args, args)):
+        return annotation
+    if origin in (Union, types.UnionType):
+        return Union[interned_args]
+    return origin[interned_args]
+
+
+@lru_cache(maxsize=128)
+def interned_model(model: Type[ModelT]) -> Type[ModelT]:
+    """Return the cached variant of ``model`` that interns its ``InternedStr``
+    fields, including those of nested models.
+
+    Values go to the table named by the validation context
+    (``{"intern_strings": table}``), else to ``string_intern_table``.
+    Instances are instances of ``model`` and serialize identically. The
+    variant is bound as ``Interned<Name>`` in ``model``'s module so its
+    instances can be pickled.
+    """
+    if model.__dict__.get("__interned_variant__"):
+        return model
+    annotations: Dict[str, Any] = {}
+    namespace: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        annotation = _interned_annotation(field.annotation)
+        if _INTERNABLE in field.metadata:
+            annotation = Annotated[annotation, _INTERN]
+        if annotation is not field.annotation:
+            annotations[name] = annotation
+            namespace[name] = field
+    name = f"Interned{model.__name__}"
+    namespace.update(
+        {
+            "__module__": model.__module__,
+            "__qualname__": name,
+            "__annotations__": annotations,
+            "__interned_variant__": True,
+        }
+    )
+    variant = type(model)(name, (model,), namespace)
+    module = sys.modules.get(model.__module__)
+    existing = getattr(module, name, None)
+    if module is not None and (
+        existing is None
+        or isinstance(existing, type)
+        and existing.__dict__.get("__interned_variant__", False)
+    ):
+        setattr(module, name, variant)
+    return variant
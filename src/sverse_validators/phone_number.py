@@ -1,17 +1,166 @@
-from typing import Optional
-import phonenumbers
+import re
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
+from .cache import BoundedCache
+from .instrumentation import instrumented_validator
 
-def validate_phone_number_format(phone: Optional[str]) -> Optional[str]:
-    """Validate and format the phone number to E.164 standard."""
+if TYPE_CHECKING:
+    from phonenumbers import PhoneNumber
+
+# Inputs longer than this are never cached so that oversized payloads cannot
+# inflate the cache's memory footprint beyond ``maxsize`` small keys.
+MAX_CACHEABLE_LENGTH = 64
+
+# Key looked up in the pydantic validation context for a per-call region hint.
+PHONE_REGION_CONTEXT_KEY = "phone_region"
+
+# Mirrors the limits and start-character rules libphonenumber applies before
+# parsing, so the lexical screen only rejects input ``parse`` would reject.
+_MAX_INPUT_LENGTH = 250
+_MIN_NSN_LENGTH = 2
+_MAX_NSN_LENGTH = 17
+_PLUS_CHARS = "+＋"
+_PHONE_CONTEXT = ";phone-context="
+_START_CHAR_PATTERN = re.compile(r"[+＋\d]")
+_CANONICAL_E164_PATTERN = re.compile(r"\+[1-9][0-9]{3,19}")
+
+_INVALID_FORMAT = "Invalid phone number format."
+_INVALID_NUMBER = "Invalid phone number."
+
+phone_number_cache = BoundedCache(maxsize=4096)
+"""Shared cache of normalization results, including rejected inputs."""
+
+
+class _InvalidPhoneNumber:
+    """Cached marker for an input that failed validation."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def region_from_context(
+    context: Optional[Mapping[str, Any]], default: Optional[str] = None
+) -> Optional[str]:
+    """Return the region hint from a validation context, falling back to ``default``.
+
+    Contexts that are not mappings carry no hint and are ignored.
+    """
+    if context and isinstance(context, Mapping):
+        return context.get(PHONE_REGION_CONTEXT_KEY, default)
+    return default
+
+
+def _passes_lexical_screen(phone: str, region: Optional[str]) -> bool:
+    """Cheaply check whether ``phonenumbers.parse`` could possibly accept ``phone``."""
+    if len(phone) > _MAX_INPUT_LENGTH:
+        return False
+    start = _START_CHAR_PATTERN.search(phone)
+    if start is None:
+        return False
+    # Without a region the first number character must be a plus sign, unless
+    # an RFC 3966 phone-context supplies the country code.
+    if region is None and start.group() not in _PLUS_CHARS:
+        return _PHONE_CONTEXT in phone
+    return True
+
+
+def _parse_canonical(phone: str) -> Optional["PhoneNumber"]:
+    """Build a PhoneNumber for ``+<digits>`` input without running ``parse``.
+
+    Returns None whenever ``parse`` could interpret the digits differently
+    (unknown country code, national prefix, leading zeros or odd lengths), so
+    the caller can fall back to the full parser.
+    """
+    import phonenumbers
+    from phonenumbers import PhoneMetadata, PhoneNumber
+
+    digits = phone[1:]
+    for length in (1, 2, 3):
+        country_code = int(digits[:length])
+        if country_code in phonenumbers.COUNTRY_CODE_TO_REGION_CODE:
+            break
+    else:
+        return None
+
+    national = digits[length:]
+    if not _MIN_NSN_LENGTH <= len(national) <= _MAX_NSN_LENGTH or national[0] == "0":
+        return None
+
+    metadata = PhoneMetadata.metadata_for_region_or_calling_code(
+        country_code, phonenumbers.region_code_for_country_code(country_code)
+    )
+    if metadata is None:
+        return None
+    prefix = metadata.national_prefix_for_parsing
+    if prefix and re.match(prefix, national):
+        return None
+    return PhoneNumber(country_code=country_code, national_number=int(national))
+
+
+def normalize_phone_number(
+    phone: Optional[str], region: Optional[str] = None
+) -> Optional[str]:
+    """Validate and format the phone number to E.164 without using the cache.
+
+    Validation is tiered: a lexical screen rejects junk before touching
+    libphonenumber, canonical ``+<digits>`` input skips parsing and
+    formatting, and everything else goes through ``phonenumbers.parse`` with
+    ``region`` as the default region for numbers in local format.
+    """
     if not phone:
         return phone
 
+    if not _passes_lexical_screen(phone, region):
+        raise ValueError(_INVALID_FORMAT)
+
+    # Imported on first use: loading libphonenumber dominates cold-start time.
+    import phonenumbers
+
+    if _CANONICAL_E164_PATTERN.fullmatch(phone):
+        canonical = _parse_canonical(phone)
+        if canonical is not None:
+            if not phonenumbers.is_valid_number(canonical):
+                raise ValueError(_INVALID_NUMBER)
+            return phone
+
     try:
-        parsed = phonenumbers.parse(phone, None)  # No default region
+        parsed = phonenumbers.parse(phone, region)
         if not phonenumbers.is_valid_number(parsed):
-            raise ValueError("Invalid phone number.")
+            raise ValueError(_INVALID_NUMBER)
     except phonenumbers.NumberParseException as exc:
-        raise ValueError("Invalid phone number format.") from exc
+        raise ValueError(_INVALID_FORMAT) from exc
 
     return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
+@instrumented_validator()
+def validate_phone_number_format(
+    phone: Optional[str], region: Optional[str] = None
+) -> Optional[str]:
+    """Validate and format the phone number to E.164 standard.
+
+    ``region`` is an optional ISO 3166 region code (for example ``"ZA"``)
+    used to interpret numbers written without a leading ``+``.
+    """
+    if not phone:
+        return phone
+
+    if len(phone) > MAX_CACHEABLE_LENGTH:
+        return normalize_phone_number(phone, region)
+
+    key = (phone, region)
+    cached = phone_number_cache.get(key)
+    if cached is not None:
+        if isinstance(cached, _InvalidPhoneNumber):
+            raise ValueError(cached.message)
+        return cached
+
+    try:
+        result = normalize_phone_number(phone, region)
+    except ValueError as exc:
+        phone_number_cache.put(key, _InvalidPhoneNumber(str(exc)))
+        raise
+    phone_number_cache.put(key, result)
+    return result
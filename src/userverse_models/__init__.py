@@ -0,0 +1,100 @@
+"""Shared Pydantic models for Userverse users, companies and roles.
+
+Public names are imported lazily on first attribute access so that importing
+the package does not build every model or load optional heavy dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .user.user import (
+        TokenResponseModel,
+        UserCreateModel,
+        UserLoginModel,
+        UserQueryParams,
+        UserReadModel,
+        UserUpdateModel,
+    )
+    from .user.password import OTPValidationRequest, PasswordResetRequest
+    from .company.address import CompanyAddressModel
+    from .company.company import (
+        CompanyCreateModel,
+        CompanyQueryParamsModel,
+        CompanyReadModel,
+        CompanyUpdateModel,
+    )
+    from .company.roles import (
+        CompanyDefaultRoles,
+        RoleCreateModel,
+        RoleDeleteModel,
+        RoleQueryParamsModel,
+        RoleReadModel,
+        RoleUpdateModel,
+    )
+    from .company.role_registry import CompiledRole, Permission, RoleRegistry
+    from .company.user import CompanyUserAddModel, CompanyUserReadModel
+    from .interned import (
+        InternedCompanyAddressModel,
+        InternedCompanyReadModel,
+        InternedCompanyUserReadModel,
+        InternedUserReadModel,
+    )
+    from .strict import (
+        StrictCompanyAddressModel,
+        StrictCompanyReadModel,
+        StrictCompanyUserReadModel,
+        StrictRoleReadModel,
+        StrictUserReadModel,
+    )
+
+_EXPORTS = {
+    "TokenResponseModel": ".user.user",
+    "UserCreateModel": ".user.user",
+    "UserLoginModel": ".user.user",
+    "UserQueryParams": ".user.user",
+    "UserReadModel": ".user.user",
+    "UserUpdateModel": ".user.user",
+    "OTPValidationRequest": ".user.password",
+    "PasswordResetRequest": ".user.password",
+    "CompanyAddressModel": ".company.address",
+    "CompanyCreateModel": ".company.company",
+    "CompanyQueryParamsModel": ".company.company",
+    "CompanyReadModel": ".company.company",
+    "CompanyUpdateModel": ".company.company",
+    "CompanyDefaultRoles": ".company.roles",
+    "RoleCreateModel": ".company.roles",
+    "RoleDeleteModel": ".company.roles",
+    "RoleQueryParamsModel": ".company.roles",
+    "RoleReadModel": ".company.roles",
+    "RoleUpdateModel": ".company.roles",
+    "CompiledRole": ".company.role_registry",
+    "Permission": ".company.role_registry",
+    "RoleRegistry": ".company.role_registry",
+    "CompanyUserAddModel": ".company.user",
+    "CompanyUserReadModel": ".company.user",
+    "InternedCompanyAddressModel": ".interned",
+    "InternedCompanyReadModel": ".interned",
+    "InternedCompanyUserReadModel": ".interned",
+    "InternedUserReadModel": ".interned",
+    "StrictCompanyAddressModel": ".strict",
+    "StrictCompanyReadModel": ".strict",
+    "StrictCompanyUserReadModel": ".strict",
+    "StrictRoleReadModel": ".strict",
+    "StrictUserReadModel": ".strict",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -1,12 +1,18 @@
 from typing import Optional
 from pydantic import BaseModel, Field
 
+from sverse_validators.interning import InternedStr
+
 
 class CompanyAddressModel(BaseModel):
     """Model representing a company's address."""
 
     street: Optional[str] = Field(None, json_schema_extra={"example": "123 Main St"})
-    city: Optional[str] = Field(None, json_schema_extra={"example": "Cape Town"})
-    state: Optional[str] = Field(None, json_schema_extra={"example": "CT"})
+    city: Optional[InternedStr] = Field(
+        None, json_schema_extra={"example": "Cape Town"}
+    )
+    state: Optional[InternedStr] = Field(None, json_schema_extra={"example": "CT"})
     postal_code: Optional[str] = Field(None, json_schema_extra={"example": "8000"})
-    country: Optional[str] = Field(None, json_schema_extra={"example": "South Africa"})
+    country: Optional[InternedStr] = Field(
+        None, json_schema_extra={"example": "South Africa"}
+    )
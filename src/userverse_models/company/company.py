@@ -1,9 +1,16 @@
-from typing import Optional
+from typing import ClassVar, Optional, Type
 
-from pydantic import BaseModel, EmailStr, field_validator, Field
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
+from sverse_generic_models.cursor_pagination import CursorPaginationParams
 from sverse_generic_models.generic_pagination import PaginationParams
-from sverse_validators.phone_number import validate_phone_number_format
+from sverse_generic_models.projection import ProjectionParams
+from sverse_validators.email_address import EmailStr
+from sverse_validators.interning import InternedStr
+from sverse_validators.phone_number import (
+    region_from_context,
+    validate_phone_number_format,
+)
 
 from .address import CompanyAddressModel
 
@@ -14,7 +21,7 @@ class CompanyReadModel(BaseModel):
     id: int
     name: Optional[str] = None
     description: Optional[str] = None
-    industry: Optional[str] = None
+    industry: Optional[InternedStr] = None
     phone_number: Optional[str] = Field(
         None, json_schema_extra={"example": "1236547899"}
     )
@@ -32,12 +39,16 @@ class CompanyUpdateModel(BaseModel):
         None, json_schema_extra={"example": "1236547899"}
     )
     address: Optional[CompanyAddressModel] = None
+    phone_region: ClassVar[Optional[str]] = None
 
     @field_validator("phone_number")
     @classmethod
-    def validate_phone_number(cls, v: Optional[str]) -> Optional[str]:
+    def validate_phone_number(
+        cls, v: Optional[str], info: ValidationInfo
+    ) -> Optional[str]:
         """Validate phone number format."""
-        return validate_phone_number_format(v)
+        region = region_from_context(info.context, cls.phone_region)
+        return validate_phone_number_format(v, region)
 
 
 class CompanyCreateModel(BaseModel):
@@ -51,17 +62,25 @@ class CompanyCreateModel(BaseModel):
     )
     email: EmailStr
     address: Optional[CompanyAddressModel] = None
+    phone_region: ClassVar[Optional[str]] = None
 
     @field_validator("phone_number")
     @classmethod
-    def validate_phone_number(cls, v: Optional[str]) -> Optional[str]:
+    def validate_phone_number(
+        cls, v: Optional[str], info: ValidationInfo
+    ) -> Optional[str]:
         """Validate phone number format."""
-        return validate_phone_number_format(v)
+        region = region_from_context(info.context, cls.phone_region)
+        return validate_phone_number_format(v, region)
 
 
-class CompanyQueryParamsModel(PaginationParams):
+class CompanyQueryParamsModel(
+    PaginationParams, CursorPaginationParams, ProjectionParams
+):
     """Model for querying companies with optional filters."""
 
+    projection_model: ClassVar[Type[BaseModel]] = CompanyReadModel
+
     role_name: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
@@ -0,0 +1,189 @@
+import threading
+from enum import IntFlag
+from typing import Dict, Iterable, NamedTuple, Optional, Union
+
+from .roles import CompanyDefaultRoles, RoleCreateModel, RoleReadModel
+from .user import CompanyUserReadModel
+
+
+class Permission(IntFlag):
+    """Company permissions, combinable into a single integer bitmask."""
+
+    VIEW_COMPANY = 1
+    EDIT_COMPANY = 2
+    VIEW_USERS = 4
+    MANAGE_USERS = 8
+    MANAGE_ROLES = 16
+    VIEW_DATA = 32
+    EDIT_DATA = 64
+    ALL = 127
+
+
+DEFAULT_ROLE_PERMISSIONS = {
+    CompanyDefaultRoles.ADMINISTRATOR: Permission.ALL,
+    CompanyDefaultRoles.VIEWER: (
+        Permission.VIEW_COMPANY | Permission.VIEW_USERS | Permission.VIEW_DATA
+    ),
+}
+"""Permissions granted to each default role."""
+
+PermissionSpec = Union[Permission, int, str, Iterable[Union[Permission, str]]]
+
+
+class CompiledRole(NamedTuple):
+    """A role resolved to its permission bitmask."""
+
+    name: str
+    description: Optional[str]
+    permissions: int
+    is_default: bool = False
+
+    def allows(self, permission: int) -> bool:
+        """Return True if the role grants every bit in ``permission``."""
+        return _grants(self.permissions, permission)
+
+
+def _grants(mask: int, permission: int) -> bool:
+    # Plain int arithmetic: IntFlag operators are about 10x slower.
+    required = int(permission)
+    return mask & required == required
+
+
+def compile_permissions(spec: PermissionSpec) -> int:
+    """Turn permissions, permission names or an int mask into a bitmask."""
+    if isinstance(spec, int):
+        if spec & ~int(Permission.ALL):
+            raise ValueError(f"Unknown permission bits: {spec:#x}")
+        return int(spec)
+    if isinstance(spec, str):
+        spec = (spec,)
+    mask = 0
+    for item in spec:
+        if isinstance(item, str):
+            try:
+                item = Permission[item.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown permission: '{item}'") from None
+        mask |= compile_permissions(item)
+    return mask
+
+
+_DEFAULT_ROLES: Dict[str, CompiledRole] = {
+    role.name_value: CompiledRole(
+        role.name_value, role.description, int(DEFAULT_ROLE_PERMISSIONS[role]), True
+    )
+    for role in CompanyDefaultRoles
+}
+_DEFAULT_ROLE_MEMBERS: Dict[str, CompanyDefaultRoles] = {
+    role.name_value: role for role in CompanyDefaultRoles
+}
+
+
+class RoleRegistry:
+    """Resolves role names to compiled permission bitmasks.
+
+    The default company roles are always present. Custom roles are
+    registered per company (``company_id``) or globally (``None``); they may
+    not reuse a default role name.
+
+    Each company gets one merged dict of the roles it can see (global custom
+    roles, its own roles, then the defaults), plus a parallel dict of plain
+    int masks. Writes rebuild the affected dicts under a lock; reads are two
+    lock-free dict lookups.
+    """
+
+    def __init__(self):
+        self._custom: Dict[Optional[int], Dict[str, CompiledRole]] = {None: {}}
+        self._lock = threading.Lock()
+        self._roles: Dict[Optional[int], Dict[str, CompiledRole]] = {}
+        self._masks: Dict[Optional[int], Dict[str, int]] = {}
+        self._rebuild(None)
+
+    def _rebuild(self, company_id: Optional[int]) -> None:
+        """Refresh the merged views of ``company_id``, or of all for None."""
+        shared = self._custom[None]
+        companies = list(self._custom) if company_id is None else [company_id]
+        for company in companies:
+            own = self._custom.get(company, {}) if company is not None else {}
+            roles = {**shared, **own, **_DEFAULT_ROLES}
+            # Replace whole dicts so concurrent readers never see a partial view.
+            self._roles[company] = roles
+            self._masks[company] = {
+                name: role.permissions for name, role in roles.items()
+            }
+
+    @staticmethod
+    def default_role(name: str) -> Optional[CompanyDefaultRoles]:
+        """Return the default role enum member called ``name``, if any."""
+        return _DEFAULT_ROLE_MEMBERS.get(name)
+
+    @staticmethod
+    def is_default(name: str) -> bool:
+        """Return True if ``name`` is a default company role."""
+        return name in _DEFAULT_ROLES
+
+    def register(
+        self,
+        name: str,
+        permissions: PermissionSpec,
+        description: Optional[str] = None,
+        company_id: Optional[int] = None,
+    ) -> CompiledRole:
+        """Compile and store a custom role, replacing any previous definition."""
+        if name in _DEFAULT_ROLES:
+            raise ValueError(f"Cannot redefine default system role: '{name}'")
+        role = CompiledRole(name, description, compile_permissions(permissions))
+        with self._lock:
+            self._custom.setdefault(company_id, {})[name] = role
+            self._rebuild(company_id)
+        return role
+
+    def register_model(
+        self,
+        model: Union[RoleCreateModel, RoleReadModel],
+        permissions: PermissionSpec,
+        company_id: Optional[int] = None,
+    ) -> CompiledRole:
+        """Register a role from its create or read model."""
+        if not model.name:
+            raise ValueError("Role name is required.")
+        return self.register(model.name, permissions, model.description, company_id)
+
+    def unregister(self, name: str, company_id: Optional[int] = None) -> None:
+        """Remove a custom role; unknown names are ignored."""
+        with self._lock:
+            roles = self._custom.get(company_id)
+            if roles is not None and roles.pop(name, None) is not None:
+                self._rebuild(company_id)
+
+    def get(
+        self, name: str, company_id: Optional[int] = None
+    ) -> Optional[CompiledRole]:
+        """Return the compiled role for ``name``, or None if it is unknown.
+
+        Default roles cannot be redefined, so they win; then ``company_id``'s
+        roles, then global custom roles.
+        """
+        roles = self._roles
+        return roles.get(company_id, roles[None]).get(name)
+
+    def permissions(self, name: str, company_id: Optional[int] = None) -> int:
+        """Return the permission bitmask for ``name``; unknown roles get 0."""
+        masks = self._masks
+        return masks.get(company_id, masks[None]).get(name, 0)
+
+    def has_permission(
+        self, name: str, permission: int, company_id: Optional[int] = None
+    ) -> bool:
+        """Return True if role ``name`` grants every bit in ``permission``."""
+        masks = self._masks
+        return _grants(masks.get(company_id, masks[None]).get(name, 0), permission)
+
+    def can(
+        self,
+        user: CompanyUserReadModel,
+        permission: int,
+        company_id: Optional[int] = None,
+    ) -> bool:
+        """Return True if ``user``'s role grants every bit in ``permission``."""
+        return self.has_permission(user.role_name, permission, company_id)
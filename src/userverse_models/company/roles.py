@@ -1,9 +1,12 @@
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Optional, Type
 from pydantic import BaseModel
 from pydantic import field_validator, Field
 
+from sverse_generic_models.cursor_pagination import CursorPaginationParams
 from sverse_generic_models.generic_pagination import PaginationParams
+from sverse_generic_models.projection import ProjectionParams
+from sverse_validators.instrumentation import instrumented_validator
 
 
 class CompanyDefaultRoles(str, Enum):
@@ -12,15 +15,25 @@ class CompanyDefaultRoles(str, Enum):
     ADMINISTRATOR = "Administrator: Full access to manage users and data"
     VIEWER = "Viewer: Read-only access to company data"
 
+    def __init__(self, value: str):
+        # Split once at class creation instead of on every property access.
+        name, _, description = value.partition(":")
+        self._name_value = name.strip()
+        self._description = description.strip()
+
     @property
     def name_value(self) -> str:
         """Returns just the role name (e.g., 'Administrator')."""
-        return self.value.split(":")[0].strip()
+        return self._name_value
 
     @property
     def description(self) -> str:
         """Returns just the role description."""
-        return self.value.split(":", 1)[1].strip()
+        return self._description
+
+
+DEFAULT_ROLE_NAMES = frozenset(role.name_value for role in CompanyDefaultRoles)
+"""Names of the default company roles, which cannot be deleted."""
 
 
 class RoleCreateModel(BaseModel):
@@ -45,10 +58,10 @@ class RoleDeleteModel(BaseModel):
 
     @field_validator("role_name_to_delete")
     @classmethod
+    @instrumented_validator()
     def validate_not_default_role(cls, v: str) -> str:
         """Ensure that default system roles cannot be deleted."""
-        default_roles = {r.name_value for r in CompanyDefaultRoles}
-        if v in default_roles:
+        if v in DEFAULT_ROLE_NAMES:
             raise ValueError(f"Cannot delete default system role: '{v}'")
         return v
 
@@ -60,8 +73,10 @@ class RoleReadModel(BaseModel):
     description: Optional[str]
 
 
-class RoleQueryParamsModel(PaginationParams):
+class RoleQueryParamsModel(PaginationParams, CursorPaginationParams, ProjectionParams):
     """Model for querying roles with optional filters."""
 
+    projection_model: ClassVar[Type[BaseModel]] = RoleReadModel
+
     name: Optional[str] = Field(None, description="Filter by role name")
     description: Optional[str] = Field(None, description="Filter by role description")
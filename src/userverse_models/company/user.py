@@ -1,6 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
+
+from sverse_validators.email_address import EmailStr
+from sverse_validators.interning import InternedStr
 
 from .roles import CompanyDefaultRoles
 from ..user.user import UserReadModel
@@ -9,7 +12,7 @@ from ..user.user import UserReadModel
 class CompanyUserReadModel(UserReadModel):
     """Model representing a user within a company, including their role."""
 
-    role_name: str
+    role_name: InternedStr
 
 
 class CompanyUserAddModel(BaseModel):
@@ -0,0 +1,26 @@
+"""Common Userverse errors, registered once in the shared error catalog.
+
+Handlers return ``ERROR.render(...)`` as the response body with
+``ERROR.status_code`` instead of building an ``AppErrorResponseModel``.
+"""
+
+from sverse_generic_models.app_error import error_catalog
+
+INVALID_CREDENTIALS = error_catalog.register(
+    "invalid_credentials", "Invalid email or password.", status_code=401
+)
+INVALID_PHONE_NUMBER = error_catalog.register(
+    "invalid_phone_number", "Invalid phone number.", status_code=422
+)
+USER_NOT_FOUND = error_catalog.register(
+    "user_not_found", "User '{email}' was not found.", status_code=404
+)
+COMPANY_NOT_FOUND = error_catalog.register(
+    "company_not_found", "Company {company_id} was not found.", status_code=404
+)
+ROLE_NOT_FOUND = error_catalog.register(
+    "role_not_found", "Role '{role_name}' was not found.", status_code=404
+)
+DEFAULT_ROLE_DELETE = error_catalog.register(
+    "default_role_delete", "Cannot delete default system role: '{role_name}'"
+)
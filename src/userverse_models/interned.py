@@ -0,0 +1,20 @@
+"""Interning variants of the Read models for bulk decoding.
+
+Low-cardinality strings (statuses, role names, industries, address parts)
+are deduplicated through an intern table, so large result sets hold one
+object per distinct value. The plain Read models do no interning and pay
+nothing for it. Wrap responses with ``interned_model`` too, e.g.
+``interned_model(PaginatedResponse[UserReadModel])``.
+"""
+
+from sverse_validators.interning import interned_model
+
+from .company.address import CompanyAddressModel
+from .company.company import CompanyReadModel
+from .company.user import CompanyUserReadModel
+from .user.user import UserReadModel
+
+InternedUserReadModel = interned_model(UserReadModel)
+InternedCompanyUserReadModel = interned_model(CompanyUserReadModel)
+InternedCompanyAddressModel = interned_model(CompanyAddressModel)
+InternedCompanyReadModel = interned_model(CompanyReadModel)
@@ -0,0 +1,135 @@
+"""Schema registry pre-populated with every model shipped by this package.
+
+Write the artifact at build time with::
+
+    python -m userverse_models.schemas --output schemas.json
+
+and load it at startup with ``default_registry().load_artifact(path)``.
+``default_specializations().warm()`` builds the generic wrappers of every
+Read model ahead of the first request.
+"""
+
+import argparse
+from functools import lru_cache
+from typing import List, Type
+
+from pydantic import BaseModel
+
+from sverse_generic_models.app_error import AppErrorResponseModel, DetailModel
+from sverse_generic_models.cursor_pagination import (
+    CursorPaginatedResponse,
+    CursorPaginationMeta,
+    CursorPaginationParams,
+)
+from sverse_generic_models.generic_pagination import (
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+)
+from sverse_generic_models.generic_response import GenericResponseModel
+from sverse_generic_models.schema_registry import SchemaRegistry
+from sverse_generic_models.specializations import SpecializationCache
+
+from .company.address import CompanyAddressModel
+from .company.company import (
+    CompanyCreateModel,
+    CompanyQueryParamsModel,
+    CompanyReadModel,
+    CompanyUpdateModel,
+)
+from .company.roles import (
+    RoleCreateModel,
+    RoleDeleteModel,
+    RoleQueryParamsModel,
+    RoleReadModel,
+    RoleUpdateModel,
+)
+from .company.user import CompanyUserAddModel, CompanyUserReadModel
+from .user.password import OTPValidationRequest, PasswordResetRequest
+from .user.user import (
+    TokenResponseModel,
+    UserCreateModel,
+    UserLoginModel,
+    UserQueryParams,
+    UserReadModel,
+    UserUpdateModel,
+)
+
+READ_MODELS: List[Type[BaseModel]] = [
+    UserReadModel,
+    CompanyUserReadModel,
+    CompanyReadModel,
+    RoleReadModel,
+]
+
+MODELS: List[Type[BaseModel]] = [
+    AppErrorResponseModel,
+    DetailModel,
+    PaginationParams,
+    PaginationMeta,
+    CursorPaginationParams,
+    CursorPaginationMeta,
+    UserLoginModel,
+    UserCreateModel,
+    UserUpdateModel,
+    UserReadModel,
+    UserQueryParams,
+    TokenResponseModel,
+    PasswordResetRequest,
+    OTPValidationRequest,
+    CompanyAddressModel,
+    CompanyCreateModel,
+    CompanyUpdateModel,
+    CompanyReadModel,
+    CompanyQueryParamsModel,
+    CompanyUserAddModel,
+    CompanyUserReadModel,
+    RoleCreateModel,
+    RoleUpdateModel,
+    RoleDeleteModel,
+    RoleReadModel,
+    RoleQueryParamsModel,
+]
+
+
+def shipped_models() -> List[Type[BaseModel]]:
+    """All shipped models plus the generic wrappers of each Read model."""
+    specializations = [
+        wrapper[model]
+        for model in READ_MODELS
+        for wrapper in (
+            GenericResponseModel,
+            PaginatedResponse,
+            CursorPaginatedResponse,
+        )
+    ]
+    return MODELS + specializations
+
+
+@lru_cache(maxsize=None)
+def default_registry() -> SchemaRegistry:
+    """Return the process-wide registry covering ``shipped_models()``."""
+    registry = SchemaRegistry()
+    registry.register(*shipped_models())
+    return registry
+
+
+@lru_cache(maxsize=None)
+def default_specializations() -> SpecializationCache:
+    """Return the process-wide cache of the Read models' generic wrappers."""
+    cache = SpecializationCache()
+    cache.register(*READ_MODELS)
+    return cache
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write the JSON schema artifact.")
+    parser.add_argument("--output", required=True, help="path of the artifact")
+    args = parser.parse_args()
+    registry = default_registry()
+    registry.write_artifact(args.output)
+    print(f"Wrote {len(registry.models)} model schemas ({registry.version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Strict variants of the Read models for service-to-service traffic.
+
+Values must already have their declared types; nothing is coerced. The
+JSON shape is unchanged. Wrap responses with ``strict_model`` too, e.g.
+``strict_model(PaginatedResponse[UserReadModel])``, whose records are
+``StrictUserReadModel`` instances.
+"""
+
+from sverse_generic_models.strict import strict_model
+
+from .company.address import CompanyAddressModel
+from .company.company import CompanyReadModel
+from .company.roles import RoleReadModel
+from .company.user import CompanyUserReadModel
+from .user.user import UserReadModel
+
+StrictUserReadModel = strict_model(UserReadModel)
+StrictCompanyUserReadModel = strict_model(CompanyUserReadModel)
+StrictCompanyAddressModel = strict_model(CompanyAddressModel)
+StrictCompanyReadModel = strict_model(CompanyReadModel)
+StrictRoleReadModel = strict_model(RoleReadModel)
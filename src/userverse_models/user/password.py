@@ -1,4 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from sverse_validators.email_address import EmailStr
 
 
 class PasswordResetRequest(BaseModel):
@@ -1,9 +1,16 @@
-from typing import Optional, Literal
+from typing import ClassVar, Literal, Optional, Type
 
-from pydantic import BaseModel, EmailStr, field_validator, Field
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
+from sverse_generic_models.cursor_pagination import CursorPaginationParams
 from sverse_generic_models.generic_pagination import PaginationParams
-from sverse_validators.phone_number import validate_phone_number_format
+from sverse_generic_models.projection import ProjectionParams
+from sverse_validators.email_address import EmailStr
+from sverse_validators.interning import InternedStr
+from sverse_validators.phone_number import (
+    region_from_context,
+    validate_phone_number_format,
+)
 
 
 class UserLoginModel(BaseModel):
@@ -22,12 +29,16 @@ class UserUpdateModel(BaseModel):
         None, json_schema_extra={"example": "1236547899"}
     )
     password: Optional[str] = None
+    phone_region: ClassVar[Optional[str]] = None
 
     @field_validator("phone_number")
     @classmethod
-    def validate_phone_number(cls, v: Optional[str]) -> Optional[str]:
+    def validate_phone_number(
+        cls, v: Optional[str], info: ValidationInfo
+    ) -> Optional[str]:
         """Validate phone number format."""
-        return validate_phone_number_format(v)
+        region = region_from_context(info.context, cls.phone_region)
+        return validate_phone_number_format(v, region)
 
 
 class UserCreateModel(BaseModel):
@@ -38,12 +49,16 @@ class UserCreateModel(BaseModel):
     phone_number: Optional[str] = Field(
         None, json_schema_extra={"example": "1236547899"}
     )
+    phone_region: ClassVar[Optional[str]] = None
 
     @field_validator("phone_number")
     @classmethod
-    def validate_phone_number(cls, v: Optional[str]) -> Optional[str]:
+    def validate_phone_number(
+        cls, v: Optional[str], info: ValidationInfo
+    ) -> Optional[str]:
         """Validate phone number format."""
-        return validate_phone_number_format(v)
+        region = region_from_context(info.context, cls.phone_region)
+        return validate_phone_number_format(v, region)
 
 
 class UserReadModel(BaseModel):
@@ -56,7 +71,7 @@ class UserReadModel(BaseModel):
     phone_number: Optional[str] = Field(
         None, json_schema_extra={"example": "1236547899"}
     )
-    status: Optional[str] = None  # <-- Add this
+    status: Optional[InternedStr] = None
     is_superuser: bool = Field(
         False, description="Indicates if the user has superuser privileges"
     )
@@ -79,9 +94,11 @@ class TokenResponseModel(BaseModel):
     )
 
 
-class UserQueryParams(PaginationParams):
+class UserQueryParams(PaginationParams, CursorPaginationParams, ProjectionParams):
     """Model for querying users with optional filters."""
 
+    projection_model: ClassVar[Type[BaseModel]] = UserReadModel
+
     role_name: Optional[str] = Field(None, description="Filter by role name")
     first_name: Optional[str] = Field(None, description="Filter by user first name")
     last_name: Optional[str] = Field(None, description="Filter by user last name")
@@ -1,5 +1,5 @@
 """Compatibility shim for userverse model phone validation."""
 
-from validators.phone_number import validate_phone_number_format
+from sverse_validators.phone_number import validate_phone_number_format
 
 __all__ = ["validate_phone_number_format"]
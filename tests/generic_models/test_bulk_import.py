@@ -0,0 +1,242 @@
+import asyncio
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, field_validator
+
+from sverse_generic_models.app_error import AppErrorResponseModel
+from sverse_generic_models.bulk_import import (
+    BulkImporter,
+    ImportRowError,
+    InvalidRow,
+    import_rows,
+    read_csv,
+    read_ndjson,
+    validate_chunk,
+)
+
+
+class Address(BaseModel):
+    """Nested model filled from dotted CSV headers."""
+
+    city: str
+    country: Optional[str] = None
+
+
+class Person(BaseModel):
+    """Record type for import tests."""
+
+    name: str
+    age: int = 0
+    address: Optional[Address] = None
+
+    @field_validator("name")
+    @classmethod
+    def not_blank(cls, value: str) -> str:
+        """Reject blank names."""
+        if not value.strip():
+            raise ValueError("Name must not be blank.")
+        return value
+
+
+def rows(count: int, bad_every: int = 0):
+    for i in range(1, count + 1):
+        if bad_every and i % bad_every == 0:
+            yield {"name": f"p{i}", "age": "not a number"}
+        else:
+            yield {"name": f"p{i}", "age": i}
+
+
+async def agen(items):
+    for item in items:
+        yield item
+
+
+def collect(importer: BulkImporter, source):
+    async def run():
+        return [chunk async for chunk in importer.chunks(source)]
+
+    return asyncio.run(run())
+
+
+class TestReaders:
+    """Tests for the incremental NDJSON and CSV readers."""
+
+    def test_ndjson_from_lines(self):
+        """Each non-blank line should be parsed; bad JSON becomes InvalidRow."""
+        lines = [b'{"name": "a"}\n', b"\n", b"{oops\n", '{"name": "b"}']
+        parsed = list(read_ndjson(lines))
+        assert parsed[0] == {"name": "a"}
+        assert isinstance(parsed[1], InvalidRow)
+        assert parsed[1].reason.startswith("Invalid JSON")
+        assert parsed[2] == {"name": "b"}
+
+    def test_ndjson_from_path(self, tmp_path):
+        """A path should be opened and read line by line."""
+        path = tmp_path / "people.ndjson"
+        path.write_text("\n".join(json.dumps(row) for row in rows(3)))
+        assert list(read_ndjson(path)) == list(rows(3))
+
+    def test_csv_nests_dotted_headers_and_drops_empty_cells(self):
+        """Dotted headers should build nested dicts and empty cells be omitted."""
+        text = "name,age,address.city,address.country\nAda,36,London,\nBob,,,\n"
+        assert list(read_csv(io.StringIO(text))) == [
+            {"name": "Ada", "age": "36", "address": {"city": "London"}},
+            {"name": "Bob"},
+        ]
+
+
+class TestValidateChunk:
+    """Tests for validating one chunk of rows."""
+
+    def test_splits_records_and_errors(self):
+        """Valid rows become models; invalid rows become numbered errors."""
+        chunk = validate_chunk(
+            Person,
+            11,
+            [
+                {"name": "a"},
+                {"name": " "},
+                InvalidRow("Invalid JSON: x", "invalid_json"),
+            ],
+        )
+        assert chunk.records == [Person(name="a")]
+        assert [error.row for error in chunk.errors] == [12, 13]
+        assert chunk.errors[0].detail.error == "validation_error"
+        assert "name: Value error, Name must not be blank." in (
+            chunk.errors[0].detail.message
+        )
+        assert chunk.errors[1].detail.error == "invalid_json"
+        assert chunk.errors[1].detail.message == "Invalid JSON: x"
+
+    def test_error_is_an_app_error_response(self):
+        """Row errors should serialize like AppErrorResponseModel plus the row."""
+        error = validate_chunk(Person, 1, [{"address": {}}]).errors[0]
+        assert isinstance(error, AppErrorResponseModel)
+        dumped = error.model_dump()
+        assert dumped["row"] == 1
+        assert dumped["detail"]["error"] == "validation_error"
+        assert "name: Field required" in dumped["detail"]["message"]
+        assert "address.city: Field required" in dumped["detail"]["message"]
+
+
+class TestBulkImporter:
+    """Tests for the chunked async import pipeline."""
+
+    @pytest.mark.parametrize("async_source", [False, True])
+    def test_chunks_preserve_order_and_row_numbers(self, async_source):
+        """Chunks should come back in input order with global row numbers."""
+        importer = BulkImporter(Person, chunk_size=10, max_pending=2)
+        source = agen(rows(95, bad_every=7)) if async_source else rows(95, 7)
+        chunks = collect(importer, source)
+
+        assert len(chunks) == 10
+        names = [record.name for chunk in chunks for record in chunk.records]
+        assert names == [f"p{i}" for i in range(1, 96) if i % 7]
+        error_rows = [error.row for chunk in chunks for error in chunk.errors]
+        assert error_rows == list(range(7, 96, 7))
+        assert importer.stats() == (95, 95 - 13, 13)
+
+    def test_records_and_errors_iterators(self):
+        """records() and errors() should yield the flattened outcomes."""
+
+        async def run():
+            importer = BulkImporter(Person, chunk_size=4)
+            records = [record async for record in importer.records(rows(10, 5))]
+            errors = [error async for error in BulkImporter(Person).errors(rows(10, 5))]
+            return records, errors, importer.stats()
+
+        records, errors, stats = asyncio.run(run())
+        assert len(records) == 8
+        assert [error.row for error in errors] == [5, 10]
+        assert all(isinstance(error, ImportRowError) for error in errors)
+        assert stats.invalid == 2
+
+    def test_reads_lazily_with_backpressure(self):
+        """Input should not be read far ahead of what the consumer has taken."""
+        consumed = []
+
+        def source():
+            for row in rows(1000):
+                consumed.append(row)
+                yield row
+
+        async def run():
+            importer = BulkImporter(Person, chunk_size=10, max_pending=2)
+            stream = importer.chunks(source())
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        first = asyncio.run(run())
+        assert len(first.records) == 10
+        assert len(consumed) <= 30
+
+    def test_custom_executor_and_context(self):
+        """A supplied executor and validation context should be used."""
+        seen = []
+
+        class Contextual(BaseModel):
+            name: str
+
+            @field_validator("name")
+            @classmethod
+            def record_context(cls, value, info):
+                seen.append(info.context)
+                return value
+
+        with ThreadPoolExecutor(2) as executor:
+            records, errors = asyncio.run(
+                import_rows(
+                    Contextual,
+                    rows(5),
+                    chunk_size=2,
+                    executor=executor,
+                    context={"source": "csv"},
+                )
+            )
+        assert len(records) == 5 and errors == []
+        assert seen == [{"source": "csv"}] * 5
+
+    def test_empty_input(self):
+        """An empty source should produce no chunks."""
+        assert collect(BulkImporter(Person), []) == []
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"max_pending": 0}])
+    def test_rejects_invalid_limits(self, options):
+        """Chunk size and pending limit must be positive."""
+        with pytest.raises(ValueError):
+            BulkImporter(Person, **options)
+
+    def test_csv_end_to_end(self):
+        """CSV text should import into nested models with per-row errors."""
+        text = "name,age,address.city\nAda,36,London\n,1,Paris\nBob,x,\n"
+        records, errors = asyncio.run(import_rows(Person, read_csv(io.StringIO(text))))
+        assert records == [Person(name="Ada", age=36, address=Address(city="London"))]
+        assert [error.row for error in errors] == [2, 3]
+        assert "name: Field required" in errors[0].detail.message
+        assert "age: Input should be a valid integer" in errors[1].detail.message
+
+    def test_csv_file_with_quoted_newlines(self, tmp_path):
+        """Quoted newlines and CRLF line endings in a CSV file should parse."""
+        path = tmp_path / "people.csv"
+        path.write_bytes(
+            b'name,age,address.city\r\n"Ada\r\nLovelace",36,London\r\nBob,2,\r\n'
+        )
+        assert list(read_csv(path)) == [
+            {"name": "Ada\r\nLovelace", "age": "36", "address": {"city": "London"}},
+            {"name": "Bob", "age": "2"},
+        ]
+
+    def test_csv_conflicting_columns_are_row_errors(self):
+        """Filling a column and its dotted subcolumns should fail only that row."""
+        text = "name,address,address.city\nAda,,London\nBob,Home,Paris\n"
+        records, errors = asyncio.run(import_rows(Person, read_csv(io.StringIO(text))))
+        assert records == [Person(name="Ada", address=Address(city="London"))]
+        assert [error.row for error in errors] == [2]
+        assert errors[0].detail.error == "invalid_csv_row"
+        reversed_text = "name,address.city,address\nBob,Paris,Home\n"
+        assert list(read_csv(io.StringIO(reversed_text)))[0].code == "invalid_csv_row"
@@ -0,0 +1,124 @@
+from array import array
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from sverse_generic_models.columnar import ColumnarBatch, _row_adapter
+from sverse_generic_models.generic_pagination import PaginatedResponse, PaginationMeta
+
+
+class Tag(BaseModel):
+    """Nested model used by columnar batch tests."""
+
+    label: str
+
+
+class Item(BaseModel):
+    """Record type used by columnar batch tests."""
+
+    id: int
+    name: str
+    status: str
+    score: float
+    active: bool
+    note: Optional[str] = None
+    tags: List[Tag] = []
+
+
+def rows(size: int = 5):
+    return [
+        {
+            "id": i,
+            "name": f"item {i}",
+            "status": "active" if i % 2 else "pending",
+            "score": i / 2,
+            "active": bool(i % 2),
+            "note": None if i % 3 else "n",
+            "tags": [{"label": f"t{i}"}],
+        }
+        for i in range(size)
+    ]
+
+
+class FlatItem(BaseModel):
+    """Flat record type that is serialized straight from columns."""
+
+    id: int
+    name: Optional[str]
+    created: datetime
+    status: Literal["active", "pending"]
+
+
+META = PaginationMeta(total_records=5, limit=5, current_page=1, total_pages=1)
+
+
+class TestColumnarBatch:
+    """Tests for column-oriented record batches."""
+
+    def test_columns_are_compact(self):
+        """Numeric columns should be arrays and repeated strings shared."""
+        batch = ColumnarBatch.from_rows(Item, rows())
+        assert isinstance(batch.column("id"), array)
+        assert isinstance(batch.column("score"), array)
+        statuses = batch.column("status")
+        assert statuses[1] is statuses[3]
+        assert batch.column("active") == [False, True, False, True, False]
+
+    def test_rows_materialize_lazily(self):
+        """Indexing should build an equal model for that row only."""
+        batch = ColumnarBatch.from_rows(Item, rows())
+        expected = [Item.model_validate(row) for row in rows()]
+        assert len(batch) == 5
+        assert batch[2] == expected[2]
+        assert batch[-1] == expected[4]
+        assert batch[1:3] == expected[1:3]
+        assert list(batch) == expected
+        assert isinstance(batch[0].tags[0], Tag)
+        with pytest.raises(IndexError):
+            batch[5]
+
+    def test_json_matches_paginated_response(self):
+        """Serialized batches should equal PaginatedResponse.model_dump_json."""
+        models = [Item.model_validate(row) for row in rows()]
+        expected = PaginatedResponse[Item](records=models, pagination=META)
+        batch = ColumnarBatch.from_models(models)
+        assert batch.to_json(META) == expected.model_dump_json().encode()
+        assert b"".join(batch.stream_json(META, chunk_size=16)) == batch.to_json(META)
+        assert batch.to_paginated_response(META) == expected
+
+    def test_flat_models_serialize_from_columns(self):
+        """Flat models should skip row models and still match model_dump_json."""
+        created = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+        models = [
+            FlatItem(
+                id=i, name=None if i % 4 else f"n{i}", created=created, status="active"
+            )
+            for i in range(2500)
+        ]
+        meta = META.model_copy(update={"total_records": 2500, "limit": 2500})
+        expected = PaginatedResponse[FlatItem](records=models, pagination=meta)
+        batch = ColumnarBatch.from_models(models)
+        assert _row_adapter(FlatItem) is not None
+        assert _row_adapter(Item) is None
+        assert batch.to_json(meta) == expected.model_dump_json().encode()
+
+    def test_empty_batch_json(self):
+        """An empty batch should serialize to an empty records list."""
+        batch = ColumnarBatch.from_rows(FlatItem, [])
+        expected = PaginatedResponse[FlatItem](records=[], pagination=META)
+        assert batch.to_json(META) == expected.model_dump_json().encode()
+
+    def test_missing_fields_use_defaults(self):
+        """Fields absent from a row should fall back to model defaults."""
+        batch = ColumnarBatch.from_rows(
+            Item, [{"id": 1, "name": "a", "status": "s", "score": 1.0, "active": True}]
+        )
+        assert batch[0].tags == []
+        assert batch[0].note is None
+
+    def test_empty_models_rejected(self):
+        """from_models needs at least one model to infer the type."""
+        with pytest.raises(ValueError):
+            ColumnarBatch.from_models([])
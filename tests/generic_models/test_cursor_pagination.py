@@ -0,0 +1,189 @@
+import random
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from sverse_generic_models.cursor_pagination import (
+    MAX_CURSOR_LENGTH,
+    Cursor,
+    CursorCodec,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+)
+
+CODEC = CursorCodec(b"test-secret")
+
+
+class Item(BaseModel):
+    """Record type for cursor pagination tests."""
+
+    id: int
+    name: str
+
+
+def random_value(rng: random.Random):
+    kind = rng.randrange(5)
+    if kind == 0:
+        return rng.randint(-(2**63), 2**63)
+    if kind == 1:
+        return rng.uniform(-1e12, 1e12)
+    if kind == 2:
+        return "".join(chr(rng.randint(32, 0x2FFF)) for _ in range(rng.randint(0, 20)))
+    if kind == 3:
+        return rng.random() < 0.5
+    return None
+
+
+class TestCursorCodec:
+    """Tests for cursor encoding and tamper detection."""
+
+    @pytest.mark.parametrize("seed", range(200))
+    def test_round_trip(self, seed):
+        """Decoding an encoded cursor should return the same values."""
+        rng = random.Random(seed)
+        values = tuple(random_value(rng) for _ in range(rng.randint(1, 4)))
+        direction = rng.choice(["next", "prev"])
+        scope = rng.choice(["", "users:id", "companies:name,id"])
+        cursor = CODEC.encode(values, direction, scope)
+        assert CODEC.decode(cursor, scope) == Cursor(values, direction)
+
+    def test_cursor_is_url_safe(self):
+        """Cursors should only use URL-safe characters."""
+        cursor = CODEC.encode(["ÿ" * 10, 2**40])
+        assert set(cursor) <= set(
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.="
+        )
+
+    @pytest.mark.parametrize("seed", range(50))
+    def test_any_single_character_change_is_rejected(self, seed):
+        """Altering any character of a cursor should fail verification."""
+        rng = random.Random(seed)
+        cursor = CODEC.encode([rng.randint(0, 10**6), "name"])
+        index = rng.randrange(len(cursor))
+        replacement = "A" if cursor[index] != "A" else "B"
+        tampered = cursor[:index] + replacement + cursor[index + 1 :]
+        with pytest.raises(ValueError, match="Invalid pagination cursor."):
+            CODEC.decode(tampered)
+
+    @pytest.mark.parametrize(
+        "cursor", ["", "garbage", "a.b.c", "é.x", "x" * (MAX_CURSOR_LENGTH + 1)]
+    )
+    def test_malformed_cursor_is_rejected(self, cursor):
+        """Malformed cursors should raise ValueError."""
+        with pytest.raises(ValueError):
+            CODEC.decode(cursor)
+
+    def test_other_secret_or_scope_is_rejected(self):
+        """Cursors should only verify with the same secret and scope."""
+        cursor = CODEC.encode([1], scope="users:id")
+        with pytest.raises(ValueError):
+            CursorCodec(b"other-secret").decode(cursor, "users:id")
+        with pytest.raises(ValueError):
+            CODEC.decode(cursor, "roles:id")
+
+    def test_long_secret_is_accepted(self):
+        """Secrets longer than the BLAKE2b key size should still work."""
+        codec = CursorCodec(b"k" * 200)
+        assert codec.decode(codec.encode([1])) == Cursor((1,))
+
+    def test_empty_secret_is_rejected(self):
+        """An empty secret would make cursors forgeable."""
+        with pytest.raises(ValueError):
+            CursorCodec(b"")
+
+    @pytest.mark.parametrize("values", ["abc", [object()], [[1, 2]]])
+    def test_unsupported_values_are_rejected(self, values):
+        """Only sequences of JSON scalars can be encoded."""
+        with pytest.raises(TypeError):
+            CODEC.encode(values)
+
+
+class TestCursorPaginationParams:
+    """Tests for cursor pagination parameters."""
+
+    def test_defaults(self):
+        """The first page needs no cursor."""
+        params = CursorPaginationParams()
+        assert params.limit == 10
+        assert params.cursor is None
+
+    def test_oversized_cursor_rejected(self):
+        """Cursors longer than the maximum should fail validation."""
+        with pytest.raises(ValidationError):
+            CursorPaginationParams(cursor="x" * (MAX_CURSOR_LENGTH + 1))
+
+
+def fetch(items, params):
+    """Emulate a keyset query ordered by id with LIMIT limit + 1."""
+    if params.cursor is None:
+        rows = items
+    else:
+        cursor = CODEC.decode(params.cursor)
+        (boundary,) = cursor.values
+        if cursor.direction == "next":
+            rows = [item for item in items if item.id > boundary]
+        else:
+            rows = [item for item in reversed(items) if item.id < boundary]
+    return rows[: params.limit + 1]
+
+
+def page(items, params):
+    return CursorPaginatedResponse[Item].from_rows(
+        fetch(items, params), params, lambda item: (item.id,), CODEC
+    )
+
+
+class TestCursorPaginatedResponse:
+    """Tests for building keyset pages."""
+
+    ITEMS = [Item(id=i, name=f"item {i}") for i in range(1, 8)]
+
+    def test_walk_forward_and_back(self):
+        """Following next then prev cursors should revisit the same pages."""
+        first = page(self.ITEMS, CursorPaginationParams(limit=3))
+        assert [r.id for r in first.records] == [1, 2, 3]
+        assert first.pagination.has_more
+        assert first.pagination.prev_cursor is None
+
+        second = page(
+            self.ITEMS,
+            CursorPaginationParams(limit=3, cursor=first.pagination.next_cursor),
+        )
+        assert [r.id for r in second.records] == [4, 5, 6]
+
+        last = page(
+            self.ITEMS,
+            CursorPaginationParams(limit=3, cursor=second.pagination.next_cursor),
+        )
+        assert [r.id for r in last.records] == [7]
+        assert not last.pagination.has_more
+        assert last.pagination.next_cursor is None
+
+        back = page(
+            self.ITEMS,
+            CursorPaginationParams(limit=3, cursor=last.pagination.prev_cursor),
+        )
+        assert [r.id for r in back.records] == [4, 5, 6]
+        assert back.pagination.next_cursor is not None
+
+        start = page(
+            self.ITEMS,
+            CursorPaginationParams(limit=3, cursor=back.pagination.prev_cursor),
+        )
+        assert [r.id for r in start.records] == [1, 2, 3]
+        assert start.pagination.prev_cursor is None
+
+    def test_empty_page(self):
+        """No rows should produce no cursors."""
+        response = page([], CursorPaginationParams(limit=3))
+        assert response.records == []
+        assert not response.pagination.has_more
+        assert response.pagination.next_cursor is None
+
+    def test_tampered_cursor_raises(self):
+        """A tampered cursor in the params should raise ValueError."""
+        params = CursorPaginationParams(cursor="bogus.cursor")
+        with pytest.raises(ValueError):
+            CursorPaginatedResponse[Item].from_rows(
+                [], params, lambda i: (i.id,), CODEC
+            )
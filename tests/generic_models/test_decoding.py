@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from sverse_generic_models.decoding import (
+    decode_paginated,
+    decode_records,
+    paginated_adapter,
+    records_adapter,
+)
+from sverse_generic_models.generic_pagination import (
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+)
+
+
+class Address(BaseModel):
+    """Nested record type for decoding tests."""
+
+    city: str
+
+
+class Row(BaseModel):
+    """Record type for decoding tests."""
+
+    id: int
+    name: str
+    address: Address
+
+
+ROWS = [
+    {"id": 1, "name": "one", "address": {"city": "Cape Town"}},
+    {"id": 2, "name": "two", "address": {"city": "Durban"}},
+]
+
+
+class TestDecodeRecords:
+    """Tests for bulk decoding of rows into models."""
+
+    def test_decodes_dicts(self):
+        """Dict rows should decode into model instances."""
+        records = decode_records(Row, ROWS)
+        assert records == [Row.model_validate(row) for row in ROWS]
+
+    def test_decodes_attribute_objects(self):
+        """Attribute objects, including nested ones, should decode."""
+        rows = [
+            SimpleNamespace(id=1, name="one", address=SimpleNamespace(city="Paris"))
+        ]
+        records = decode_records(Row, rows)
+        assert records[0].address.city == "Paris"
+
+    def test_attribute_objects_rejected_without_from_attributes(self):
+        """from_attributes=False should only accept mappings."""
+        with pytest.raises(ValidationError):
+            decode_records(Row, [SimpleNamespace(**ROWS[0])], from_attributes=False)
+
+    def test_accepts_generators(self):
+        """Any iterable of rows should be accepted."""
+        assert len(decode_records(Row, (row for row in ROWS))) == 2
+
+    def test_invalid_row_reports_index(self):
+        """Validation errors should point at the offending row."""
+        with pytest.raises(ValidationError) as exc_info:
+            decode_records(Row, [ROWS[0], {"id": "x"}])
+        assert exc_info.value.errors()[0]["loc"][0] == 1
+
+    def test_adapters_are_cached(self):
+        """Adapters should be built once per model."""
+        assert records_adapter(Row) is records_adapter(Row)
+        assert paginated_adapter(Row) is paginated_adapter(Row)
+
+
+class TestDecodePaginated:
+    """Tests for decoding rows straight into a paginated response."""
+
+    def test_builds_paginated_response(self):
+        """Rows and params should produce records plus pagination metadata."""
+        params = PaginationParams(limit=2, page=3)
+        response = decode_paginated(Row, ROWS, params, total_records=5)
+        assert isinstance(response, PaginatedResponse[Row])
+        assert response.records == decode_records(Row, ROWS)
+        assert response.pagination == PaginationMeta(
+            total_records=5, limit=2, current_page=3, total_pages=3
+        )
+
+    def test_matches_manual_construction_json(self):
+        """The JSON output should match a manually built response."""
+        params = PaginationParams(limit=10, page=1)
+        manual = PaginatedResponse[Row](
+            records=[Row.model_validate(row) for row in ROWS],
+            pagination=PaginationMeta.from_params(params, 2),
+        )
+        decoded = decode_paginated(Row, ROWS, params, total_records=2)
+        assert decoded.model_dump_json() == manual.model_dump_json()
+
+    def test_without_a_count(self):
+        """Rows fetched with the extra row should report has_more, no totals."""
+        params = PaginationParams(limit=1, page=1)
+        response = decode_paginated(Row, ROWS, params)
+        assert response.records == decode_records(Row, ROWS[:1])
+        assert response.pagination == PaginationMeta.from_slice(params, ROWS)
+        assert response.pagination.has_more is True
+        assert response.pagination.total_records is None
+
+    def test_estimated_count(self):
+        """An estimate should be reported as such, as from_rows does."""
+        params = PaginationParams(limit=1, page=1)
+        decoded = decode_paginated(Row, iter(ROWS), params, 40, estimated=True)
+        built = PaginatedResponse[Row].from_rows(
+            [Row.model_validate(row) for row in ROWS], params, 40, estimated=True
+        )
+        assert decoded.model_dump_json() == built.model_dump_json()
+        assert decoded.pagination.estimated
@@ -0,0 +1,165 @@
+import sqlite3
+from typing import Optional
+
+import pytest
+
+from pydantic import BaseModel
+
+from sverse_generic_models.filtering import (
+    SqlFragment,
+    compile_filter,
+    filter_fields,
+    filter_plan,
+)
+from sverse_generic_models.generic_pagination import (
+    FilterLogic,
+    MatchType,
+    PaginationParams,
+)
+
+
+class PersonQuery(PaginationParams):
+    """Query params used by filter compiler tests."""
+
+    first_name: Optional[str] = None
+    email: Optional[str] = None
+
+
+class Person(BaseModel):
+    """Read model used by filter compiler tests."""
+
+    id: int
+    first_name: Optional[str] = None
+    email: Optional[str] = None
+
+
+PEOPLE = [
+    Person(id=1, first_name="Alice", email="alice@example.com"),
+    Person(id=2, first_name="Alicia", email="ally@test.org"),
+    Person(id=3, first_name="Bob", email="bob_100%@example.com"),
+    Person(id=4, first_name=None, email="nobody@example.com"),
+]
+
+
+def ids(records):
+    return [record.id for record in records]
+
+
+class TestFilterPredicates:
+    """Tests for in-memory filtering."""
+
+    def test_pagination_fields_are_ignored(self):
+        """Only declared filter fields should be compiled."""
+        assert filter_fields(PersonQuery) == ("first_name", "email")
+        compiled = compile_filter(PersonQuery(page=3, limit=5))
+        assert compiled.plan.fields == ()
+        assert ids(compiled.filter(PEOPLE)) == [1, 2, 3, 4]
+
+    def test_match_types(self):
+        """Partial, starts-with and exact matching should differ."""
+        query = PersonQuery(first_name="ali")
+        assert ids(compile_filter(query).filter(PEOPLE)) == [1, 2]
+        starts = compile_filter(PersonQuery(first_name="lic"), MatchType.STARTS_WITH)
+        assert ids(starts.filter(PEOPLE)) == []
+        exact = compile_filter(PersonQuery(first_name="alice"), MatchType.EXACT)
+        assert ids(exact.filter(PEOPLE)) == [1]
+
+    def test_case_sensitive(self):
+        """case_sensitive should disable case folding."""
+        compiled = compile_filter(PersonQuery(first_name="ali"), case_sensitive=True)
+        assert ids(compiled.filter(PEOPLE)) == []
+
+    def test_and_or_logic(self):
+        """AND requires all filters, OR any of them."""
+        query = PersonQuery(first_name="ali", email="example.com")
+        assert ids(compile_filter(query).filter(PEOPLE)) == [1]
+        either = compile_filter(query, logic=FilterLogic.OR)
+        assert ids(either.filter(PEOPLE)) == [1, 2, 3, 4]
+
+    def test_none_record_values_never_match(self):
+        """Missing record values should not match a filter."""
+        compiled = compile_filter(PersonQuery(first_name="o"))
+        assert not compiled.matches(PEOPLE[3])
+
+    def test_fields_missing_from_record_model(self):
+        """Filters on fields the records lack never match, or raise when checked."""
+
+        class RoleQuery(PersonQuery):
+            """Query params with a filter only SQL can answer."""
+
+            role_name: Optional[str] = None
+
+        query = RoleQuery(role_name="Admin")
+        assert compile_filter(query).filter(PEOPLE) == []
+        with pytest.raises(ValueError, match="role_name"):
+            compile_filter(query, record_model=Person)
+        assert compile_filter(RoleQuery(email="a"), record_model=Person).values
+
+    def test_plans_are_cached_by_shape(self):
+        """Queries with the same active fields should share a plan."""
+        first = compile_filter(PersonQuery(first_name="a"), MatchType.EXACT)
+        second = compile_filter(PersonQuery(first_name="b"), "exact")
+        assert first.plan is second.plan
+        assert first.plan is filter_plan(("first_name",), MatchType.EXACT)
+        other = compile_filter(PersonQuery(email="b"), MatchType.EXACT)
+        assert other.plan is not first.plan
+
+
+class TestFilterSql:
+    """Tests for SQL WHERE fragments."""
+
+    def test_fragment_text_and_params(self):
+        """Fragments should use named parameters and mapped columns."""
+        compiled = compile_filter(
+            PersonQuery(first_name="Al", email="x"), MatchType.STARTS_WITH
+        )
+        assert compiled.where({"first_name": "u.first_name"}) == SqlFragment(
+            "(LOWER(u.first_name) LIKE :first_name ESCAPE '\\' "
+            "AND LOWER(email) LIKE :email ESCAPE '\\')",
+            {"first_name": "al%", "email": "x%"},
+        )
+
+    def test_exact_case_sensitive_uses_equality(self):
+        """Exact case-sensitive filters should compare columns directly."""
+        compiled = compile_filter(
+            PersonQuery(email="a@b.c"), MatchType.EXACT, case_sensitive=True
+        )
+        assert compiled.where() == SqlFragment("(email = :email)", {"email": "a@b.c"})
+
+    def test_custom_escape_character(self):
+        """The LIKE escape character should be configurable for other dialects."""
+        compiled = compile_filter(PersonQuery(email="_100%!"))
+        assert compiled.where(escape="!") == SqlFragment(
+            "(LOWER(email) LIKE :email ESCAPE '!')", {"email": "%!_100!%!!%"}
+        )
+        with pytest.raises(ValueError):
+            compiled.where(escape="'")
+
+    def test_empty_filter(self):
+        """No active filters should produce an always-true condition."""
+        assert compile_filter(PersonQuery()).where() == SqlFragment("1 = 1", {})
+
+    def test_sql_agrees_with_predicate(self):
+        """SQL results should equal in-memory results, including LIKE escaping."""
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE person (id, first_name, email)")
+        connection.executemany(
+            "INSERT INTO person VALUES (?, ?, ?)",
+            [(p.id, p.first_name, p.email) for p in PEOPLE],
+        )
+        queries = [
+            (PersonQuery(first_name="ALI"), MatchType.PARTIAL, FilterLogic.AND),
+            (PersonQuery(email="_100%"), MatchType.PARTIAL, FilterLogic.AND),
+            (PersonQuery(email="b"), MatchType.STARTS_WITH, FilterLogic.AND),
+            (PersonQuery(first_name="bob", email="al"), MatchType.PARTIAL, "or"),
+            (PersonQuery(first_name="Alice"), MatchType.EXACT, FilterLogic.AND),
+        ]
+        for query, match_type, logic in queries:
+            compiled = compile_filter(query, match_type, logic)
+            for escape in ("\\", "!"):
+                fragment = compiled.where(escape=escape)
+                rows = connection.execute(
+                    f"SELECT id FROM person WHERE {fragment.text} ORDER BY id",
+                    fragment.params,
+                ).fetchall()
+                assert [row[0] for row in rows] == ids(compiled.filter(PEOPLE))
@@ -1,8 +1,13 @@
 import pytest
 from pydantic import BaseModel, ValidationError
 
-from sverse_generic_models.app_error import AppErrorResponseModel, DetailModel
+from sverse_generic_models.app_error import (
+    AppErrorResponseModel,
+    DetailModel,
+    ErrorCatalog,
+)
 from sverse_generic_models.generic_pagination import (
+    CountMode,
     FilterLogic,
     MatchType,
     PaginatedResponse,
@@ -34,6 +39,61 @@ class TestAppErrorModels:
             AppErrorResponseModel()
 
 
+class TestErrorCatalog:
+    """Tests for pre-rendered error responses."""
+
+    def test_static_error_is_rendered_once(self):
+        """A message without placeholders should reuse the same bytes."""
+        catalog = ErrorCatalog()
+        error = catalog.register("missing_resource", "Not found", status_code=404)
+        body = catalog.render("missing_resource")
+        assert body is error.render()
+        assert body == error.model().model_dump_json().encode()
+        assert AppErrorResponseModel.model_validate_json(body).detail.error == (
+            "missing_resource"
+        )
+
+    @pytest.mark.parametrize(
+        "value",
+        ["Admin", 'quote " and \\ slash', "line\nbreak\x01", "caf\u00e9 \u2028", 42],
+    )
+    def test_template_matches_model_dump_json(self, value):
+        """Rendered templates should be byte-identical to the model's JSON."""
+        error = ErrorCatalog().register("role_not_found", "Role '{name}' {{x}}: {name}")
+        assert error.fields == ("name", "name")
+        expected = error.model(name=value).model_dump_json().encode()
+        assert error.render(name=value) == expected
+
+    def test_format_spec_is_applied(self):
+        """Format specs should behave like ``str.format``."""
+        error = ErrorCatalog().register("limit", "Retry in {seconds:.1f}s")
+        assert b"Retry in 2.5s" in error.render(seconds=2.5)
+
+    def test_parameter_errors(self):
+        """Missing or unexpected parameters should raise ValueError."""
+        catalog = ErrorCatalog()
+        catalog.register("static", "Static")
+        catalog.register("templated", "Hello {name}")
+        with pytest.raises(ValueError):
+            catalog.render("templated")
+        with pytest.raises(ValueError):
+            catalog.render("static", name="x")
+        with pytest.raises(ValueError):
+            catalog.register("positional", "Hello {}")
+        with pytest.raises(ValueError):
+            catalog.render("unknown")
+
+    def test_register_is_idempotent_per_definition(self):
+        """Re-registering the same error is allowed; changing it is not."""
+        catalog = ErrorCatalog()
+        first = catalog.register("conflict", "Conflict", status_code=409)
+        assert catalog.register("conflict", "Conflict", status_code=409) is first
+        with pytest.raises(ValueError):
+            catalog.register("conflict", "Other", status_code=409)
+        assert "conflict" in catalog
+        assert catalog.codes == ["conflict"]
+
+
 class TestGenericResponseModel:
     """Tests for GenericResponseModel."""
 
@@ -115,3 +175,86 @@ class TestPaginatedResponse:
         assert len(response.records) == 2
         assert response.records[0].id == 1
         assert response.pagination.total_records == 2
+
+    @pytest.mark.parametrize(
+        "total_records,total_pages", [(0, 0), (1, 1), (25, 3), (30, 3)]
+    )
+    def test_meta_from_params(self, total_records, total_pages):
+        """from_params should round the page count up."""
+        params = PaginationParams(limit=10, page=2)
+        meta = PaginationMeta.from_params(params, total_records)
+        assert meta.total_pages == total_pages
+        assert meta.limit == 10
+        assert meta.current_page == 2
+
+
+class TestPaginationCountModes:
+    """Tests for exact, estimated and count-free pagination metadata."""
+
+    def test_exact_json_shape_is_unchanged(self):
+        """Exact metadata should serialize with only the original four keys."""
+        meta = PaginationMeta.from_params(PaginationParams(limit=10), 25)
+        assert meta.count_mode is CountMode.EXACT
+        assert meta.model_dump_json() == (
+            '{"total_records":25,"limit":10,"current_page":1,"total_pages":3}'
+        )
+        assert list(meta.model_dump()) == [
+            "total_records",
+            "limit",
+            "current_page",
+            "total_pages",
+        ]
+
+    def test_count_free_page_from_extra_row(self):
+        """Without a count, the extra fetched row should set has_more."""
+        params = PaginationParams(limit=2, page=1)
+        assert params.fetch_limit() == 3
+        page = PaginatedResponse[Item].from_rows(
+            [Item(id=1), Item(id=2), Item(id=3)], params
+        )
+        assert [item.id for item in page.records] == [1, 2]
+        assert page.pagination.count_mode is CountMode.NONE
+        assert page.pagination.model_dump_json() == (
+            '{"total_records":null,"limit":2,"current_page":1,'
+            '"total_pages":null,"has_more":true}'
+        )
+        last = PaginatedResponse[Item].from_rows([Item(id=3)], params)
+        assert last.pagination.has_more is False
+
+    def test_estimated_count_is_flagged(self):
+        """Estimated totals should be flagged and raised to cover seen rows."""
+        params = PaginationParams(limit=2, page=3)
+        rows = [Item(id=5), Item(id=6), Item(id=7)]
+        meta = PaginationMeta.from_slice(params, rows, 3, estimated=True)
+        assert meta.count_mode is CountMode.ESTIMATED
+        assert (meta.total_records, meta.total_pages) == (7, 4)
+        assert meta.model_dump()["estimated"] is True
+        assert meta.has_more is True
+
+    def test_estimate_replaced_at_end_of_result(self):
+        """A short last page gives the exact count, whatever the estimate."""
+        params = PaginationParams(limit=10, page=2)
+        meta = PaginationMeta.from_slice(params, range(4), 1000, estimated=True)
+        assert meta.count_mode is CountMode.EXACT
+        assert (meta.total_records, meta.has_more) == (14, False)
+
+    def test_exact_count_from_slice(self):
+        """An exact count should keep the original shape and trim the rows."""
+        params = PaginationParams(limit=1)
+        page = PaginatedResponse[Item].from_rows([Item(id=1), Item(id=2)], params, 9)
+        assert len(page.records) == 1
+        assert page.pagination == PaginationMeta.from_params(params, 9)
+        assert page.pagination.has_more is None
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"limit": 10, "current_page": 1},
+            {"total_records": 5, "limit": 10, "current_page": 1},
+            {"limit": 10, "current_page": 1, "has_more": True, "estimated": True},
+        ],
+    )
+    def test_inconsistent_meta_raises(self, data):
+        """Metadata must match exactly one of the count modes."""
+        with pytest.raises(ValidationError):
+            PaginationMeta(**data)
@@ -0,0 +1,122 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from sverse_generic_models.patch import Changeset, compute_changeset
+
+
+class Address(BaseModel):
+    """Nested model of the record."""
+
+    street: Optional[str] = None
+    city: Optional[str] = None
+
+
+class Record(BaseModel):
+    """Stored record, as read from the database."""
+
+    id: int
+    name: Optional[str] = None
+    tags: List[str] = []
+    address: Optional[Address] = None
+
+
+class RecordUpdate(BaseModel):
+    """All-optional update for ``Record``."""
+
+    name: Optional[str] = None
+    tags: Optional[List[str]] = None
+    address: Optional[Address] = None
+    secret: Optional[str] = None
+
+
+def record(**overrides) -> Record:
+    data = {"id": 1, "name": "a", "address": {"street": "1 Main", "city": "X"}}
+    data.update(overrides)
+    return Record.model_validate(data)
+
+
+class TestComputeChangeset:
+    """Tests for diffing an update against the current record."""
+
+    def test_unsent_fields_are_ignored(self):
+        """Fields left at their defaults but not sent must not clear values."""
+        assert not compute_changeset(record(), RecordUpdate())
+
+    def test_equal_values_are_skipped(self):
+        """Resending the current values should produce an empty changeset."""
+        update = RecordUpdate(name="a", address=Address(street="1 Main", city="X"))
+        assert compute_changeset(record(), update) == Changeset()
+
+    def test_explicit_none_clears(self):
+        """Sending None for a set field is a change."""
+        changes = compute_changeset(record(), RecordUpdate(name=None)).changes
+        assert changes == {"name": None}
+
+    def test_nested_fields_are_diffed(self):
+        """Only sent and changed nested fields should appear, as dotted paths."""
+        update = RecordUpdate(address=Address(city="Y"), tags=["t"])
+        changeset = compute_changeset(record(), update)
+        assert changeset.changes == {"tags": ["t"], "address.city": "Y"}
+        assert changeset.fields == ["tags", "address"]
+
+    def test_nested_model_set_and_cleared(self):
+        """Setting a nested model from None or clearing it replaces it whole."""
+        set_update = RecordUpdate(address=Address(city="Y"))
+        changeset = compute_changeset(record(address=None), set_update)
+        assert changeset.changes == {"address": Address(city="Y")}
+        assert changeset.columns() == {"address_street": None, "address_city": "Y"}
+
+        cleared = compute_changeset(record(), RecordUpdate(address=None))
+        assert cleared.changes == {"address": None}
+        assert cleared.columns() == {"address_street": None, "address_city": None}
+
+    def test_fields_missing_on_target_always_change(self):
+        """Write-only update fields cannot be compared and are always kept."""
+        changeset = compute_changeset(record(), RecordUpdate(secret="s"))
+        assert changeset.changes == {"secret": "s"}
+        assert changeset.write_only == {"secret": "s"}
+
+    def test_order_follows_field_declaration(self):
+        """Changes should be ordered like the update model's fields."""
+        update = RecordUpdate(address=Address(city="Y"), secret="s", name="b")
+        assert list(compute_changeset(record(), update)) == [
+            "name",
+            "address.city",
+            "secret",
+        ]
+
+
+class TestChangeset:
+    """Tests for applying and rendering changesets."""
+
+    def test_apply_in_place(self):
+        """Applying should only touch the changed fields of the target."""
+        current = record()
+        address = current.address
+        update = RecordUpdate(name="b", address=Address(city="Y"))
+        assert compute_changeset(current, update).apply(current) is current
+        assert current.name == "b"
+        assert current.address is address
+        assert current.address.model_dump() == {"street": "1 Main", "city": "Y"}
+
+    def test_apply_whole_nested_model_copies_it(self):
+        """A nested model from the update should not be shared with the target."""
+        current = record(address=None)
+        update = RecordUpdate(address=Address(city="Y"))
+        compute_changeset(current, update).apply(current)
+        assert current.address == update.address
+        assert current.address is not update.address
+
+    def test_apply_skips_write_only_fields(self):
+        """Fields the target does not have should be left out of apply."""
+        current = record()
+        compute_changeset(current, RecordUpdate(name="b", secret="s")).apply(current)
+        assert current.name == "b"
+        assert "secret" not in current.__dict__
+
+    def test_columns_with_map(self):
+        """column_map should rename paths; others default to underscores."""
+        update = RecordUpdate(name="b", address=Address(city="Y"))
+        columns = compute_changeset(record(), update).columns({"name": "full_name"})
+        assert columns == {"full_name": "b", "address_city": "Y"}
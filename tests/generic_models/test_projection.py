@@ -0,0 +1,136 @@
+from typing import ClassVar, Optional, Type
+
+import pytest
+from pydantic import BaseModel, ValidationError, field_serializer
+
+from sverse_generic_models.filtering import filter_fields
+from sverse_generic_models.generic_pagination import (
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+)
+from sverse_generic_models.projection import (
+    ProjectionParams,
+    _cached_projection,
+    get_projection,
+)
+
+
+class Address(BaseModel):
+    """Nested model of the record."""
+
+    street: Optional[str] = None
+    city: Optional[str] = None
+
+
+class Record(BaseModel):
+    """Record returned by the listing."""
+
+    id: int
+    name: Optional[str] = None
+    address: Optional[Address] = None
+
+
+class RecordQuery(PaginationParams, ProjectionParams):
+    """Query params projecting ``Record``."""
+
+    projection_model: ClassVar[Type[BaseModel]] = Record
+
+    name: Optional[str] = None
+
+
+class Shouting(Record):
+    """Record with a custom field serializer."""
+
+    @field_serializer("name")
+    def shout(self, value: Optional[str]) -> Optional[str]:
+        return value.upper() if value else value
+
+
+RECORD = Record(id=1, name="a", address=Address(street="1 Main", city="X"))
+
+
+class TestProjection:
+    """Tests for projected serialization."""
+
+    def test_top_level_and_nested_paths(self):
+        """Only requested fields should be emitted, in model order."""
+        projection = get_projection(Record, ["address.city", "id"])
+        assert projection.dump_json(RECORD) == b'{"id":1,"address":{"city":"X"}}'
+        assert projection.dump(RECORD) == {"id": 1, "address": {"city": "X"}}
+
+    def test_output_follows_model_order(self):
+        """Field order should not depend on the requested order."""
+        projection = get_projection(Record, "address.city,name")
+        assert projection.dump_json(RECORD) == (b'{"name":"a","address":{"city":"X"}}')
+        assert projection.dump_json(Record(id=2)) == b'{"name":null,"address":null}'
+
+    def test_custom_serializers_are_kept(self):
+        """Models with custom serializers should still serialize correctly."""
+        value = Shouting(id=1, name="a", address=Address(city="X"))
+        projection = get_projection(Shouting, "name,address.city")
+        assert projection.dump_json(value) == b'{"name":"A","address":{"city":"X"}}'
+        assert projection.dump_json_records([value]) == (
+            b'[{"name":"A","address":{"city":"X"}}]'
+        )
+
+    def test_whole_nested_model_wins(self):
+        """Naming a nested model should include all of it."""
+        projection = get_projection(Record, "address.city,address")
+        assert projection.include == {"address": True}
+        assert projection.dump(RECORD) == {"address": {"street": "1 Main", "city": "X"}}
+
+    def test_cached_per_model_and_field_set(self):
+        """Equal field sets should share one projection regardless of order."""
+        first = get_projection(Record, "id,name")
+        assert get_projection(Record, ("name", "id", "id")) is first
+        assert get_projection(Record, "id") is not first
+
+    def test_records_and_pages(self):
+        """Lists and pages should project every record, keeping pagination."""
+        projection = get_projection(Record, "id")
+        page = PaginatedResponse[Record](
+            records=[RECORD, Record(id=2)],
+            pagination=PaginationMeta.from_params(PaginationParams(), 2),
+        )
+        assert projection.dump_json_records(page.records) == b'[{"id":1},{"id":2}]'
+        body = projection.dump_json_page(page)
+        assert body.startswith(b'{"records":[{"id":1},{"id":2}],"pagination":')
+        assert body.endswith(page.pagination.model_dump_json().encode() + b"}")
+
+    @pytest.mark.parametrize("fields", ["missing", "name.first", "address.zip", ""])
+    def test_unknown_paths_raise(self, fields):
+        """Paths must name fields, and only nested models can be traversed."""
+        with pytest.raises(ValueError):
+            get_projection(Record, [fields or "address..city"])
+
+
+class TestProjectionParams:
+    """Tests for the ``fields`` query parameter."""
+
+    def test_parses_and_validates(self):
+        """Comma-separated and repeated values should be accepted."""
+        query = RecordQuery(fields=["id, name", "address.city"])
+        assert query.fields == ("id", "name", "address.city")
+        assert query.projection() is get_projection(Record, query.fields)
+
+    def test_absent_fields_means_everything(self):
+        """Without fields, no projection applies."""
+        assert RecordQuery().projection() is None
+        assert RecordQuery(fields="").fields is None
+
+    def test_rejects_unknown_fields(self):
+        """Paths not on the projection model should fail validation."""
+        with pytest.raises(ValidationError):
+            RecordQuery(fields="id,secret")
+
+    def test_validation_does_not_compile(self):
+        """Validating fields should not build or cache a projection."""
+        before = _cached_projection.cache_info().currsize
+        query = RecordQuery(fields="id,address.street")
+        assert _cached_projection.cache_info().currsize == before
+        assert query.projection() is get_projection(Record, ["id", "address.street"])
+
+    def test_fields_is_not_a_filter(self):
+        """The projection parameter should not be compiled into filters."""
+        assert filter_fields(RecordQuery) == ("name",)
@@ -0,0 +1,122 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Annotated, List, Optional
+
+from pydantic import AfterValidator, BaseModel, Field
+
+from sverse_generic_models.generic_response import GenericResponseModel
+from sverse_generic_models.schema_registry import SchemaRegistry, model_key
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def run_fresh(code: str) -> str:
+    """Run ``code`` in a new interpreter that can import the tests package."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), "."])},
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class Item(BaseModel):
+    """Record type for schema registry tests.
+
+    The validator, default factory and ``exclude_if`` callables would put
+    memory addresses into ``repr`` of the fields.
+    """
+
+    id: int
+    name: Optional[Annotated[str, AfterValidator(str.strip)]] = Field(
+        None, description="Display name", exclude_if=lambda value: value is None
+    )
+    tags: List[str] = Field(default_factory=list)
+
+
+def make_registry(version: str = "1.0") -> SchemaRegistry:
+    registry = SchemaRegistry(version=version)
+    registry.register(Item, GenericResponseModel[Item])
+    return registry
+
+
+class TestSchemaRegistry:
+    """Tests for cached JSON schema generation."""
+
+    def test_schema_matches_model_json_schema(self):
+        """Cached schemas should equal pydantic's output for each mode."""
+        registry = make_registry()
+        for mode in ("validation", "serialization"):
+            assert registry.schema(Item, mode) == Item.model_json_schema(mode=mode)
+
+    def test_schema_is_generated_once(self, monkeypatch):
+        """Repeated lookups should reuse the cached schema object."""
+        registry = make_registry()
+        first = registry.schema(Item)
+        monkeypatch.setattr(Item, "model_json_schema", None)
+        assert registry.schema(Item) is first
+
+    def test_generic_specializations_have_distinct_keys(self):
+        """Parametrized generics should be cached separately."""
+        assert model_key(GenericResponseModel[Item]) != model_key(GenericResponseModel)
+        registry = make_registry()
+        assert registry.schema(GenericResponseModel[Item]) == (
+            GenericResponseModel[Item].model_json_schema()
+        )
+
+    def test_artifact_round_trip(self, tmp_path):
+        """Schemas loaded from an artifact should be served without generation."""
+        path = tmp_path / "schemas.json"
+        make_registry().write_artifact(str(path))
+
+        registry = make_registry()
+        assert registry.load_artifact(str(path)) is True
+        expected = Item.model_json_schema(mode="serialization")
+        assert registry.schema(Item, "serialization") == expected
+
+    def test_stale_version_is_ignored(self, tmp_path):
+        """Artifacts from another version should not be loaded."""
+        path = tmp_path / "schemas.json"
+        make_registry("1.0").write_artifact(str(path))
+        registry = make_registry("2.0")
+        assert registry.load_artifact(str(path)) is False
+        assert registry._schemas == {}
+
+    def test_changed_models_are_ignored(self, tmp_path):
+        """Artifacts for different model definitions should not be loaded."""
+        path = tmp_path / "schemas.json"
+        artifact = make_registry().to_artifact()
+        artifact["fingerprint"] = "0" * 16
+        path.write_text(json.dumps(artifact))
+        assert make_registry().load_artifact(str(path)) is False
+
+    def test_fingerprint_is_stable_across_processes(self):
+        """Another interpreter should compute the same fingerprint."""
+        fingerprint = run_fresh(
+            "from tests.generic_models.test_schema_registry import make_registry\n"
+            "print(make_registry().fingerprint())"
+        )
+        assert fingerprint == make_registry().fingerprint()
+
+    def test_artifact_loads_in_fresh_process(self, tmp_path):
+        """An artifact written here should be accepted by a new process."""
+        path = tmp_path / "schemas.json"
+        make_registry().write_artifact(str(path))
+        loaded = run_fresh(
+            "from tests.generic_models.test_schema_registry import make_registry\n"
+            f"print(make_registry().load_artifact({str(path)!r}))"
+        )
+        assert loaded == "True"
+
+    def test_clear_drops_cache(self):
+        """clear() should force regeneration."""
+        registry = make_registry()
+        first = registry.schema(Item)
+        registry.clear()
+        assert registry.schema(Item) is not first
@@ -0,0 +1,62 @@
+from pydantic import BaseModel
+
+from sverse_generic_models.generic_pagination import PaginatedResponse
+from sverse_generic_models.generic_response import GenericResponseModel
+from sverse_generic_models.specializations import SpecializationCache
+
+
+def make_model() -> type:
+    """Return a new model class, so its specializations are not prebuilt."""
+
+    class Item(BaseModel):
+        """Record model used as a generic parameter."""
+
+        id: int
+
+    return Item
+
+
+class TestSpecializationCache:
+    """Tests for building generic specializations ahead of time."""
+
+    def test_warm_builds_every_wrapper_once(self):
+        """warm should build each wrapper of each model and report timings."""
+        cache = SpecializationCache()
+        item = make_model()
+        cache.register(item, item)
+        timings = cache.warm()
+        assert [timing.name.split("[")[0] for timing in timings] == [
+            "GenericResponseModel",
+            "PaginatedResponse",
+            "CursorPaginatedResponse",
+        ]
+        assert all(timing.seconds > 0 for timing in timings)
+        assert cache.warm() == []
+        assert len(cache.timings) == 3
+
+    def test_get_matches_pydantic_specialization(self):
+        """Cached classes should be the ones pydantic hands out."""
+        cache = SpecializationCache(wrappers=[GenericResponseModel])
+        item = make_model()
+        built = cache.get(PaginatedResponse, item)
+        assert built is PaginatedResponse[item]
+        assert cache.get(PaginatedResponse, item) is built
+        page = built(
+            records=[{"id": 1}],
+            pagination={
+                "total_records": 1,
+                "limit": 10,
+                "current_page": 1,
+                "total_pages": 1,
+            },
+        )
+        assert page.records[0].id == 1
+
+    def test_warm_in_background(self):
+        """The returned future should resolve to the timings of the warm-up."""
+        cache = SpecializationCache(wrappers=[GenericResponseModel])
+        cache.register(make_model())
+        future = cache.warm_in_background()
+        timings = future.result(timeout=30)
+        assert len(timings) == 1
+        assert timings[0].name.startswith("GenericResponseModel[")
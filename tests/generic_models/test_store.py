@@ -0,0 +1,137 @@
+import random
+from typing import Optional
+
+from pydantic import BaseModel
+
+from sverse_generic_models.filtering import compile_filter
+from sverse_generic_models.generic_pagination import (
+    FilterLogic,
+    MatchType,
+    PaginatedResponse,
+    PaginationParams,
+)
+from sverse_generic_models.store import IndexedStore
+
+
+class PersonQuery(PaginationParams):
+    """Query params used by indexed store tests."""
+
+    first_name: Optional[str] = None
+    email: Optional[str] = None
+    city: Optional[str] = None
+
+
+class Person(BaseModel):
+    """Read model used by indexed store tests."""
+
+    id: int
+    first_name: Optional[str] = None
+    email: Optional[str] = None
+    city: Optional[str] = None
+
+
+NAMES = ["Alice", "alicia", "Bob", "Bobby", "Carol", None]
+CITIES = ["Cape Town", "Durban", "London"]
+
+
+def person(i: int) -> Person:
+    return Person(
+        id=i,
+        first_name=NAMES[i % len(NAMES)],
+        email=f"user{i % 7}@example.com",
+        city=CITIES[i % len(CITIES)],
+    )
+
+
+def make_store(size: int = 50) -> IndexedStore[Person]:
+    store = IndexedStore(Person, indexes=("first_name", "email"))
+    store.upsert_many(person(i) for i in range(size))
+    return store
+
+
+def scan(records, query, match_type, logic=FilterLogic.AND, case_sensitive=False):
+    compiled = compile_filter(query, match_type, logic, case_sensitive)
+    matched = sorted(compiled.filter(records), key=lambda record: record.id)
+    start = query.offset()
+    return [record.id for record in matched[start : start + query.limit]], len(matched)
+
+
+class TestIndexedStore:
+    """Tests for the indexed in-memory store."""
+
+    def test_query_returns_paginated_response(self):
+        """Queries should return a page plus pagination metadata."""
+        store = make_store()
+        page = store.query(PersonQuery(first_name="bob", limit=3), MatchType.EXACT)
+        assert isinstance(page, PaginatedResponse)
+        assert [record.id for record in page.records] == [2, 8, 14]
+        assert page.pagination.total_records == 8
+        assert page.pagination.total_pages == 3
+
+    def test_matches_full_scan(self):
+        """Every combination of filters should agree with a list scan."""
+        store = make_store(200)
+        records = [person(i) for i in range(200)]
+        queries = [
+            PersonQuery(first_name="ali"),
+            PersonQuery(first_name="ALICE", limit=7, page=2),
+            PersonQuery(email="user3@example.com", first_name="bob"),
+            PersonQuery(email="user1", city="cape"),
+            PersonQuery(first_name="carol", email="user2@example.com"),
+            PersonQuery(city="london", page=3),
+            PersonQuery(),
+        ]
+        for query in queries:
+            for match_type in MatchType:
+                for logic in FilterLogic:
+                    for case_sensitive in (False, True):
+                        page = store.query(query, match_type, logic, case_sensitive)
+                        expected_ids, total = scan(
+                            records, query, match_type, logic, case_sensitive
+                        )
+                        assert [r.id for r in page.records] == expected_ids
+                        assert page.pagination.total_records == total
+
+    def test_upsert_replaces_index_entries(self):
+        """Updating a record should move it between index entries."""
+        store = make_store(10)
+        store.upsert(Person(id=0, first_name="Zed", email="z@example.com"))
+        exact = MatchType.EXACT
+        alices = store.query(PersonQuery(first_name="alice"), exact).records
+        assert [record.id for record in alices] == [6]
+        page = store.query(PersonQuery(first_name="zed"), exact)
+        assert [record.id for record in page.records] == [0]
+        assert len(store) == 10
+
+    def test_delete(self):
+        """Deleted records should disappear from queries and lookups."""
+        store = make_store(10)
+        assert store.delete(2) is True
+        assert store.delete(2) is False
+        assert 2 not in store
+        assert store.get(2) is None
+        page = store.query(PersonQuery(first_name="bob"), MatchType.STARTS_WITH)
+        assert [record.id for record in page.records] == [3, 8, 9]
+
+    def test_random_mutations_keep_indexes_consistent(self):
+        """Interleaved upserts and deletes should not corrupt the indexes."""
+        rng = random.Random(7)
+        store = IndexedStore(Person, indexes=("first_name", "email"))
+        expected = {}
+        for step in range(500):
+            i = rng.randrange(60)
+            if rng.random() < 0.3:
+                store.delete(i)
+                expected.pop(i, None)
+            else:
+                record = person(i + step)
+                record = record.model_copy(update={"id": i})
+                store.upsert(record)
+                expected[i] = record
+        records = list(expected.values())
+        query = PersonQuery(first_name="al", limit=100)
+        page = store.query(query, MatchType.STARTS_WITH)
+        assert [r.id for r in page.records] == scan(
+            records, query, MatchType.STARTS_WITH
+        )[0]
+        assert [record.id for record in store] == sorted(expected)
@@ -0,0 +1,124 @@
+import asyncio
+import json
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from sverse_generic_models.generic_pagination import PaginatedResponse, PaginationMeta
+from sverse_generic_models.generic_response import GenericResponseModel
+from sverse_generic_models.streaming import (
+    astream_generic_response_json,
+    astream_ndjson,
+    astream_paginated_json,
+    stream_generic_response_json,
+    stream_ndjson,
+    stream_paginated_json,
+)
+
+
+class Item(BaseModel):
+    """Record type for streaming tests."""
+
+    id: int
+    name: Optional[str] = None
+
+
+class ChildItem(Item):
+    """Subclass whose extra field must not leak into the output."""
+
+    secret: str = "hidden"
+
+
+META = PaginationMeta(total_records=3, limit=10, current_page=1, total_pages=1)
+ITEMS = [Item(id=1, name='é "quoted"'), Item(id=2), ChildItem(id=3, name="c")]
+
+
+async def agen(items):
+    for item in items:
+        yield item
+
+
+def collect_async(stream) -> bytes:
+    async def run():
+        return b"".join([chunk async for chunk in stream])
+
+    return asyncio.run(run())
+
+
+class TestStreamPaginatedJson:
+    """Tests for streaming PaginatedResponse JSON."""
+
+    @pytest.mark.parametrize("items", [ITEMS, []])
+    @pytest.mark.parametrize("chunk_size", [1, 16, 65536])
+    def test_matches_model_dump_json(self, items, chunk_size):
+        """Joined chunks should equal the non-streaming output byte for byte."""
+        expected = PaginatedResponse[Item](
+            records=items, pagination=META
+        ).model_dump_json()
+        chunks = list(stream_paginated_json(Item, iter(items), META, chunk_size))
+        assert b"".join(chunks) == expected.encode()
+
+    def test_chunks_are_bounded(self):
+        """No chunk should grow far beyond chunk_size."""
+        items = (Item(id=i, name="x" * 50) for i in range(1000))
+        chunks = list(stream_paginated_json(Item, items, META, chunk_size=1024))
+        assert len(chunks) > 10
+        assert max(len(chunk) for chunk in chunks) < 1024 + 100
+
+    @pytest.mark.parametrize("source", [agen, iter])
+    def test_async_matches_model_dump_json(self, source):
+        """The async variant should accept sync and async iterables."""
+        expected = PaginatedResponse[Item](
+            records=ITEMS, pagination=META
+        ).model_dump_json()
+        stream = astream_paginated_json(Item, source(ITEMS), META, chunk_size=8)
+        assert collect_async(stream) == expected.encode()
+
+
+class TestStreamGenericResponseJson:
+    """Tests for streaming GenericResponseModel JSON."""
+
+    def test_matches_model_dump_json(self):
+        """Joined chunks should equal GenericResponseModel[List[T]] output."""
+        expected = GenericResponseModel[List[Item]](
+            message="ok ✓", data=ITEMS
+        ).model_dump_json()
+        chunks = stream_generic_response_json(Item, "ok ✓", iter(ITEMS), 4)
+        assert b"".join(chunks) == expected.encode()
+
+    def test_async_matches_model_dump_json(self):
+        """The async variant should produce the same bytes."""
+        expected = GenericResponseModel[List[Item]](message="ok", data=ITEMS)
+        stream = astream_generic_response_json(Item, "ok", agen(ITEMS))
+        assert collect_async(stream) == expected.model_dump_json().encode()
+
+
+class TestStreamNdjson:
+    """Tests for newline-delimited JSON streaming."""
+
+    def test_one_record_per_line(self):
+        """Each record should be a standalone JSON line."""
+        lines = b"".join(stream_ndjson(Item, ITEMS)).decode().splitlines()
+        assert [Item.model_validate_json(line) for line in lines] == [
+            Item(id=1, name='é "quoted"'),
+            Item(id=2),
+            Item(id=3, name="c"),
+        ]
+
+    def test_pagination_header_line(self):
+        """Pagination metadata should be emitted as the first line."""
+        output = b"".join(stream_ndjson(Item, ITEMS, META, chunk_size=5))
+        first, *records = output.decode().splitlines()
+        assert json.loads(first) == {"pagination": META.model_dump()}
+        assert len(records) == len(ITEMS)
+        assert output.endswith(b"\n")
+
+    def test_async_matches_sync(self):
+        """The async variant should produce the same bytes as the sync one."""
+        expected = b"".join(stream_ndjson(Item, ITEMS, META))
+        assert collect_async(astream_ndjson(Item, agen(ITEMS), META)) == expected
+
+    def test_empty_without_pagination(self):
+        """An empty stream without metadata should produce no content."""
+        assert b"".join(stream_ndjson(Item, [])) == b""
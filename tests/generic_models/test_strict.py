@@ -0,0 +1,126 @@
+import pickle
+from typing import Annotated, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from sverse_generic_models.generic_pagination import PaginatedResponse
+from sverse_generic_models.generic_response import GenericResponseModel
+from sverse_generic_models.strict import strict_model
+
+
+class Tag(BaseModel):
+    """Nested model of the item."""
+
+    label: str
+    weight: int = 1
+
+
+class Item(BaseModel):
+    """Model with nested, list, mapping and constrained fields."""
+
+    id: Annotated[int, Field(ge=1)]
+    active: bool = False
+    tag: Optional[Tag] = Field(None, description="Primary tag")
+    tags: List[Tag] = []
+    by_name: Dict[str, Tag] = {}
+
+    @field_validator("tags")
+    @classmethod
+    def sort_tags(cls, value: List[Tag]) -> List[Tag]:
+        """Keep tags ordered by label."""
+        return sorted(value, key=lambda tag: tag.label)
+
+
+ITEM_JSON = (
+    '{"id":1,"active":true,"tag":{"label":"a","weight":2},'
+    '"tags":[{"label":"b","weight":1}],"by_name":{"c":{"label":"c","weight":3}}}'
+)
+
+
+class TestStrictModel:
+    """Tests for strict model variants."""
+
+    def test_same_json_shape(self):
+        """Strict and lax models should produce identical JSON."""
+        strict = strict_model(Item).model_validate_json(ITEM_JSON)
+        assert strict.model_dump_json() == ITEM_JSON
+        assert strict.model_dump_json() == (
+            Item.model_validate_json(ITEM_JSON).model_dump_json()
+        )
+        assert isinstance(strict, Item)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            '{"id":"1"}',
+            '{"id":1,"active":"true"}',
+            '{"id":1,"tag":{"label":"a","weight":"2"}}',
+            '{"id":1,"tags":[{"label":"b","weight":1.0}]}',
+            '{"id":1,"by_name":{"c":{"label":"c","weight":"3"}}}',
+        ],
+    )
+    def test_rejects_coercion_at_every_level(self, payload):
+        """Values needing coercion should fail, including in nested models."""
+        Item.model_validate_json(payload)
+        with pytest.raises(ValidationError):
+            strict_model(Item).model_validate_json(payload)
+
+    def test_keeps_constraints_validators_and_field_info(self):
+        """Constraints, validators and field metadata should be inherited."""
+        strict = strict_model(Item)
+        with pytest.raises(ValidationError):
+            strict(id=0)
+        item = strict(id=1, tags=[{"label": "z"}, {"label": "y"}])
+        assert [tag.label for tag in item.tags] == ["y", "z"]
+        assert strict.model_fields["tag"].description == "Primary tag"
+        assert strict.model_fields["tag"].annotation == Optional[strict_model(Tag)]
+
+    def test_cached_and_idempotent(self):
+        """Variants should be built once and not be wrapped again."""
+        strict = strict_model(Item)
+        assert strict_model(Item) is strict
+        assert strict_model(strict) is strict
+        assert strict.__name__ == "StrictItem"
+
+    def test_generic_responses(self):
+        """Parametrized responses should validate their records strictly."""
+        page = strict_model(PaginatedResponse[Item])
+        payload = {
+            "records": [{"id": 1}],
+            "pagination": {
+                "total_records": 1,
+                "limit": 10,
+                "current_page": 1,
+                "total_pages": 1,
+            },
+        }
+        assert isinstance(page.model_validate(payload).records[0], strict_model(Item))
+        payload["pagination"]["limit"] = "10"
+        with pytest.raises(ValidationError):
+            page.model_validate(payload)
+        response = strict_model(GenericResponseModel[Item])
+        with pytest.raises(ValidationError):
+            response.model_validate_json('{"message":"ok","data":{"id":"1"}}')
+
+    def test_pickle_round_trip(self):
+        """Instances of variants should pickle, e.g. for process pools."""
+        item = strict_model(Item).model_validate_json(ITEM_JSON)
+        assert pickle.loads(pickle.dumps(item)) == item
+        page = strict_model(PaginatedResponse[Item]).model_validate(
+            {
+                "records": [{"id": 1}],
+                "pagination": {
+                    "total_records": 1,
+                    "limit": 10,
+                    "current_page": 1,
+                    "total_pages": 1,
+                },
+            }
+        )
+        assert pickle.loads(pickle.dumps(page)) == page
+
+    def test_unparametrized_generic_raises(self):
+        """Generic models need their parameters first."""
+        with pytest.raises(ValueError):
+            strict_model(PaginatedResponse)
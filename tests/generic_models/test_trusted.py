@@ -0,0 +1,157 @@
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
+
+from sverse_generic_models.generic_response import GenericResponseModel
+from sverse_generic_models.trusted import (
+    TrustedLoader,
+    TrustedStats,
+    construct_trusted,
+)
+
+
+class Address(BaseModel):
+    """Nested record type for trusted construction tests."""
+
+    city: str
+    country: Optional[str] = None
+
+
+class Company(BaseModel):
+    """Record type with optional and list nesting."""
+
+    id: int
+    name: str
+    address: Optional[Address] = None
+    offices: List[Address] = []
+
+    @field_validator("name")
+    @classmethod
+    def strip_name(cls, v: str) -> str:
+        """Normalize surrounding whitespace."""
+        return v.strip()
+
+
+class Tracked(BaseModel):
+    """Record type with extra fields allowed and a private attribute."""
+
+    model_config = ConfigDict(extra="allow")
+
+    id: int
+    _seen: bool = PrivateAttr(True)
+
+
+ROW = {
+    "id": 1,
+    "name": "Acme",
+    "address": {"city": "Cape Town"},
+    "offices": [{"city": "Durban", "country": "ZA"}],
+}
+
+
+class TestConstructTrusted:
+    """Tests for recursive construction without validation."""
+
+    def test_nested_models_are_constructed(self):
+        """Nested dicts should become model instances, unlike model_construct."""
+        company = construct_trusted(Company, ROW)
+        assert isinstance(company.address, Address)
+        assert isinstance(company.offices[0], Address)
+        assert company == Company.model_validate(ROW)
+
+    def test_defaults_and_fields_set(self):
+        """Missing fields should use defaults and stay out of fields_set."""
+        company = construct_trusted(Company, {"id": 2, "name": "Solo"})
+        assert company.address is None
+        assert company.offices == []
+        assert company.model_fields_set == {"id", "name"}
+        assert company.model_dump_json() == Company(id=2, name="Solo").model_dump_json()
+
+    def test_attribute_objects(self):
+        """ORM-style objects with nested attribute objects should be supported."""
+        row = SimpleNamespace(
+            id=3, name="Orm", address=SimpleNamespace(city="Paris"), offices=[]
+        )
+        company = construct_trusted(Company, row)
+        assert company.address.city == "Paris"
+        assert company.address.country is None
+
+    def test_existing_instances_are_kept(self):
+        """Already built nested models should be reused as-is."""
+        address = Address(city="Lagos")
+        company = construct_trusted(Company, {**ROW, "address": address})
+        assert company.address is address
+
+    def test_optional_lists_of_models(self):
+        """None in an Optional list of models should be kept as None."""
+        model = GenericResponseModel[List[Address]]
+        assert construct_trusted(model, {"message": "none", "data": None}).data is None
+        built = construct_trusted(model, {"message": "ok", "data": [{"city": "Lagos"}]})
+        assert built == model(message="ok", data=[Address(city="Lagos")])
+
+    def test_skips_validation(self):
+        """Validators should not run for trusted data."""
+        company = construct_trusted(Company, {**ROW, "name": "  padded  "})
+        assert company.name == "  padded  "
+
+    def test_matches_model_construct(self):
+        """Instances should carry the same pydantic state as model_construct."""
+        for model, data in ((Company, {"id": 2, "name": "Solo"}), (Tracked, {"id": 1})):
+            built = construct_trusted(model, data)
+            expected = model.model_construct(**data)
+            for attr in ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__"):
+                assert getattr(built, attr) == getattr(expected, attr)
+        assert construct_trusted(Tracked, {"id": 1})._seen is True
+
+
+class TestTrustedLoader:
+    """Tests for sampled verification of trusted construction."""
+
+    def test_no_sampling(self):
+        """A zero sample rate should never validate."""
+        mismatches = []
+        loader = TrustedLoader(Company, sample_rate=0, on_mismatch=mismatches.append)
+        loader.load_many([{**ROW, "name": " x "}] * 5)
+        assert loader.stats() == TrustedStats(5, 0, 0)
+        assert mismatches == []
+
+    def test_full_sampling_reports_differences(self):
+        """Values changed by validation should be reported and corrected."""
+        mismatches = []
+        loader = TrustedLoader(Company, sample_rate=1, on_mismatch=mismatches.append)
+        company = loader.load({**ROW, "name": " padded "})
+        assert company.name == "padded"
+        assert loader.stats() == TrustedStats(1, 1, 1)
+        assert mismatches[0].error is None
+        assert mismatches[0].constructed["name"] == " padded "
+        assert mismatches[0].validated["name"] == "padded"
+
+    def test_full_sampling_reports_validation_errors(self):
+        """Invalid trusted data should be reported and returned as constructed."""
+        mismatches = []
+        loader = TrustedLoader(Company, sample_rate=1, on_mismatch=mismatches.append)
+        company = loader.load({**ROW, "id": "not-an-int"})
+        assert company.id == "not-an-int"
+        assert mismatches[0].error is not None
+
+    def test_matching_sample_is_not_reported(self):
+        """Consistent data should pass sampling silently."""
+        mismatches = []
+        loader = TrustedLoader(Company, sample_rate=1, on_mismatch=mismatches.append)
+        assert loader.load(ROW) == Company.model_validate(ROW)
+        assert loader.stats() == TrustedStats(1, 1, 0)
+        assert mismatches == []
+
+    def test_default_reporter_logs_warning(self, caplog):
+        """Mismatches should be logged when no reporter is given."""
+        loader = TrustedLoader(Company, sample_rate=1)
+        loader.load({**ROW, "id": "bad"})
+        assert "Trusted Company data failed sampled validation" in caplog.text
+
+    @pytest.mark.parametrize("rate", [-0.1, 1.5])
+    def test_invalid_sample_rate(self, rate):
+        """Sample rates outside [0, 1] should be rejected."""
+        with pytest.raises(ValueError):
+            TrustedLoader(Company, sample_rate=rate)
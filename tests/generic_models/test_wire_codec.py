@@ -0,0 +1,345 @@
+import json
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError, field_serializer
+
+from sverse_generic_models.generic_pagination import PaginatedResponse, PaginationMeta
+from sverse_generic_models.generic_response import GenericResponseModel
+from sverse_generic_models.strict import strict_model
+from sverse_generic_models.wire_codec import (
+    WireCodec,
+    decode_wire,
+    encode_wire,
+    get_wire_codec,
+)
+
+
+class Color(str, Enum):
+    """Enum field values travel as their JSON values."""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+class Child(BaseModel):
+    """Flat model, sent as plain JSON on its own and positionally when nested."""
+
+    label: str
+    weight: float = 0.0
+
+
+class Item(BaseModel):
+    """Record covering scalar, nested and free-form fields."""
+
+    id: int
+    name: Optional[str] = None
+    active: bool = True
+    color: Color = Color.RED
+    created: Optional[datetime] = None
+    child: Optional[Child] = None
+    children: List[Child] = []
+    extra: Dict[str, Any] = {}
+
+
+class Basket(BaseModel):
+    """Small positional model holding a list of children."""
+
+    label: str
+    children: List[Child] = []
+
+
+class Single(BaseModel):
+    """Model with one field."""
+
+    value: int
+
+
+class Tree(BaseModel):
+    """Self-referencing model; recursion falls back to plain JSON objects."""
+
+    name: str
+    children: List["Tree"] = []
+
+
+class Serialized(BaseModel):
+    """Model with a custom serializer, encoded from model_dump output."""
+
+    code: int
+    ratio: float = 0.0
+
+    @field_serializer("code")
+    def pad(self, code: int) -> str:
+        """Serialize the code as zero-padded text."""
+        return f"{code:05d}"
+
+
+class SerializedBatch(BaseModel):
+    """Positional model whose records have a custom serializer."""
+
+    items: List[Serialized]
+
+
+class Aliased(BaseModel):
+    """Model whose field has an alias."""
+
+    user_name: str = Field(alias="userName")
+
+
+ITEM = Item(
+    id=-7,
+    name='é "quoted"',
+    active=False,
+    color=Color.BLUE,
+    created=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+    child=Child(label="a", weight=1.5),
+    children=[Child(label="b"), Child(label="c", weight=-2.25)],
+    extra={"n": [1, None, {"deep": True}]},
+)
+
+
+class TestRoundTrip:
+    """Tests for encoding and decoding model instances."""
+
+    @pytest.mark.parametrize("item", [ITEM, Item(id=0)])
+    def test_round_trip_matches_json(self, item):
+        """Decoded instances should equal a JSON round trip."""
+        assert decode_wire(Item, encode_wire(item)) == Item.model_validate_json(
+            item.model_dump_json()
+        )
+
+    def test_layout_is_positional(self):
+        """Field names of models should not appear in the payload."""
+        tag, body = json.loads(encode_wire(ITEM))
+        assert tag == "sv1p:" + get_wire_codec(Item).fingerprint
+        assert body[:3] == [-7, 'é "quoted"', False]
+        assert body[5:7] == [["a", 1.5], [["b", 0.0], ["c", -2.25]]]
+        assert body[7] == {"n": [1, None, {"deep": True}]}
+
+    def test_generic_wrappers(self):
+        """Paginated and generic responses should round-trip."""
+        page = PaginatedResponse[Item](
+            records=[ITEM, Item(id=2)],
+            pagination=PaginationMeta(
+                total_records=2, limit=10, current_page=1, total_pages=1
+            ),
+        )
+        wrapped = GenericResponseModel[Item](message="ok", data=ITEM)
+        empty = GenericResponseModel[Item](message="none", data=None)
+        assert len(encode_wire(page)) < len(page.model_dump_json())
+        for value in (page, wrapped, empty):
+            assert decode_wire(type(value), encode_wire(value)) == value
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            Single(value=3),
+            Tree(name="root", children=[Tree(name="leaf")]),
+            Aliased(userName="ada"),
+        ],
+    )
+    def test_edge_models(self, value):
+        """One-field, recursive and aliased models should round-trip."""
+        assert decode_wire(type(value), encode_wire(value)) == value
+
+    def test_direct_encoding_matches_dumped_values(self):
+        """Reading instances directly should write what model_dump writes."""
+        codec = get_wire_codec(Item)
+        assert codec._direct
+        dumped = ITEM.model_dump(mode="json")
+        _, body = json.loads(codec.encode(ITEM))
+        assert body[:5] == [dumped[name] for name in list(Item.model_fields)[:5]]
+
+    def test_custom_serializers_are_honoured(self):
+        """Models with serializers should be encoded from model_dump output."""
+        codec = get_wire_codec(SerializedBatch)
+        assert not codec._direct
+        value = SerializedBatch(items=[Serialized(code=42, ratio=float("nan"))])
+        assert json.loads(codec.encode(value))[1] == [[["00042", None]]]
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_decodes_buffers(self, wrap):
+        """bytes, bytearray and memoryview payloads should decode."""
+        assert decode_wire(Item, wrap(encode_wire(ITEM))) == ITEM
+
+    @pytest.mark.parametrize("value", [ITEM, Child(label="a")])
+    def test_memoryview_is_not_copied(self, value):
+        """A view over a whole buffer should hand the buffer to the parser."""
+        codec = get_wire_codec(type(value))
+        payload = bytearray(codec.encode(value))
+        assert codec._check(memoryview(payload))[0] is payload
+        framed = memoryview(b"xx" + bytes(payload))[2:]
+        assert codec.decode(framed) == value
+
+    def test_codecs_are_cached(self):
+        """wire_codec should return one codec per model."""
+        assert get_wire_codec(Item) is get_wire_codec(Item)
+
+    def test_columns_with_missing_and_empty_values(self):
+        """Optional models and empty lists should decode per record."""
+        page = PaginatedResponse[Item](
+            records=[Item(id=1), ITEM, Item(id=3, children=[Child(label="d")])],
+            pagination=PaginationMeta(
+                total_records=3, limit=10, current_page=1, total_pages=1
+            ),
+        )
+        assert decode_wire(type(page), encode_wire(page)) == page
+
+
+class TestKeyedBody:
+    """Tests for models without lists of models, sent as tagged keyed JSON."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            Child(label="a", weight=1.5),
+            Single(value=3),
+            Aliased(userName="ada"),
+            GenericResponseModel[Child](message="ok", data=Child(label="a")),
+        ],
+    )
+    def test_body_is_model_dump_json(self, value):
+        """The body should be what model_dump_json writes, behind the tag."""
+        codec = get_wire_codec(type(value))
+        assert not codec.positional
+        tag, body = json.loads(codec.encode(value))
+        assert tag == "sv1k:" + codec.fingerprint
+        assert body == json.loads(value.model_dump_json())
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_renamed_field_is_rejected(self):
+        """A receiver with a renamed field should fail instead of dropping data."""
+
+        class Person(BaseModel):
+            first_name: Optional[str] = None
+
+        payload = WireCodec(Person).encode(Person(first_name="Ada"))
+
+        class Person(BaseModel):
+            given_name: Optional[str] = None
+
+        with pytest.raises(ValueError, match="fingerprint"):
+            WireCodec(Person).decode(payload)
+
+    @pytest.mark.parametrize("payload", [b'{"label": "a"}', b'["a", 1.0]'])
+    def test_untagged_payloads_are_rejected(self, payload):
+        """Plain JSON without the tag should not be accepted."""
+        with pytest.raises(ValueError, match="Not a wire payload"):
+            decode_wire(Child, payload)
+
+    @pytest.mark.parametrize("positional", [True, False])
+    def test_receivers_accept_both_bodies(self, positional):
+        """Senders may pick the body kind; the receiver decodes either."""
+        page = PaginatedResponse[Item](
+            records=[ITEM, Item(id=2)],
+            pagination=PaginationMeta(
+                total_records=2, limit=10, current_page=1, total_pages=1
+            ),
+        )
+        for value in (page, Child(label="a", weight=2.0)):
+            payload = encode_wire(value, positional=positional)
+            assert json.loads(payload)[0].startswith("sv1p:" if positional else "sv1k:")
+            assert decode_wire(type(value), payload) == value
+            assert decode_wire(type(value), memoryview(payload)) == value
+
+    def test_models_with_lists_are_positional(self):
+        """Lists of models, directly or in nested models, use the layout."""
+        assert get_wire_codec(Item).positional
+        assert get_wire_codec(GenericResponseModel[Item]).positional
+        assert not get_wire_codec(Tree).positional
+        assert WireCodec(Child).fingerprint != WireCodec(Basket).fingerprint
+
+
+class TestVariants:
+    """Tests for strict variants on either side of the wire."""
+
+    @pytest.mark.parametrize("value", [ITEM, Child(label="a"), Item(id=2)])
+    def test_strict_receivers_accept_lax_payloads(self, value):
+        """Strict variants share the layout and validate JSON-typed values."""
+        strict = strict_model(type(value))
+        assert (
+            get_wire_codec(strict).fingerprint
+            == get_wire_codec(type(value)).fingerprint
+        )
+        decoded = decode_wire(strict, encode_wire(value))
+        assert isinstance(decoded, strict)
+        assert decoded.model_dump() == value.model_dump()
+
+    def test_strict_pages(self):
+        """Positional pages should decode into strict variants too."""
+        page = PaginatedResponse[Item](
+            records=[ITEM],
+            pagination=PaginationMeta(
+                total_records=1, limit=10, current_page=1, total_pages=1
+            ),
+        )
+        strict = strict_model(PaginatedResponse[Item])
+        decoded = decode_wire(strict, encode_wire(page))
+        assert decoded.model_dump_json() == page.model_dump_json()
+
+
+class TestRejection:
+    """Tests for payloads that must fail fast."""
+
+    def test_fingerprint_mismatch(self):
+        """A payload for another model version should be rejected."""
+
+        class Item(BaseModel):
+            id: int
+            name: Optional[int] = None
+            children: List[Child] = []
+
+        with pytest.raises(ValueError, match="fingerprint"):
+            WireCodec(Item).decode(encode_wire(ITEM))
+
+    def test_fingerprint_is_stable_per_layout(self):
+        """Equal layouts should share a fingerprint; different ones should not."""
+        assert WireCodec(Item).fingerprint == get_wire_codec(Item).fingerprint
+        assert WireCodec(Child).fingerprint != WireCodec(Item).fingerprint
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"",
+            b'{"label": "a", "children": []}',
+            b'["sv1p:' + b"0" * 8 + b'",["a",[]]]',
+            b'["sv1k:' + b"0" * 8 + b'",{"label":"a"}]',
+        ],
+    )
+    def test_foreign_payloads(self, payload):
+        """Plain JSON and other models' payloads raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_wire(Basket, payload)
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            '["a"]',
+            '["a", [], 2]',
+            '{"label": "a"}',
+            '["a", {"label": "b"}]',
+            '["a", [["b"]]]',
+            '["a", [["b", 1.0], ["c", 1.0, 2]]]',
+            '["a", [{"label": "b"}]]',
+            "[",
+        ],
+    )
+    def test_malformed_bodies(self, body):
+        """Wrong arity, shape or truncated JSON raise ValueError."""
+        codec = get_wire_codec(Basket)
+        payload = codec._positional_prefix + body.encode() + b"]"
+        with pytest.raises(ValueError, match="Malformed"):
+            codec.decode(payload)
+
+    def test_values_are_validated(self):
+        """Decoded data is validated like JSON input."""
+        codec = get_wire_codec(Basket)
+        payload = codec._positional_prefix + b'["a",[["b","heavy"]]]]'
+        assert codec.decode_data(payload) == {
+            "label": "a",
+            "children": [{"label": "b", "weight": "heavy"}],
+        }
+        with pytest.raises(ValidationError):
+            codec.decode(payload)
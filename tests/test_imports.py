@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import sverse_generic_models
+import sverse_validators
+import userverse_models
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def modules_loaded_after(statement: str) -> set:
+    """Run ``statement`` in a fresh interpreter and return sys.modules keys."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyExports:
+    """Tests for lazily exported package attributes."""
+
+    @pytest.mark.parametrize(
+        "package", [userverse_models, sverse_generic_models, sverse_validators]
+    )
+    def test_all_exports_resolve(self, package):
+        """Every name in __all__ should resolve to the submodule attribute."""
+        for name in package.__all__:
+            value = getattr(package, name)
+            module = sys.modules[f"{package.__name__}{package._EXPORTS[name]}"]
+            assert value is getattr(module, name)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(AttributeError):
+            userverse_models.DoesNotExist
+
+    def test_dir_lists_exports(self):
+        """dir() should include the lazy exports."""
+        assert "UserReadModel" in dir(userverse_models)
+
+    def test_legacy_validator_shim_imports(self):
+        """The userverse_models.validators shim should re-export the validator."""
+        from sverse_validators.phone_number import validate_phone_number_format
+        from userverse_models.validators import phone_number
+
+        assert phone_number.validate_phone_number_format is validate_phone_number_format
+
+
+class TestDeferredImports:
+    """Tests that heavy dependencies are only loaded when needed."""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import userverse_models, sverse_generic_models, sverse_validators",
+            "from sverse_generic_models import PaginationParams",
+            "from userverse_models import UserCreateModel, CompanyCreateModel",
+            "from userverse_models import CompanyUserAddModel, PasswordResetRequest",
+        ],
+    )
+    def test_heavy_dependencies_not_imported(self, statement):
+        """Importing models should not load phonenumbers or email_validator."""
+        loaded = modules_loaded_after(statement)
+        assert "phonenumbers" not in loaded
+        assert "email_validator" not in loaded
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import userverse_models.company.roles",
+            "import sverse_generic_models.filtering",
+        ],
+    )
+    def test_query_params_stay_light(self, statement):
+        """Query params using projections should not load the codec modules."""
+        loaded = modules_loaded_after(statement)
+        for module in ("wire_codec", "patch", "schema_registry", "decoding"):
+            assert f"sverse_generic_models.{module}" not in loaded
+
+    def test_package_root_does_not_build_models(self):
+        """Importing a package root should not import its model modules."""
+        loaded = modules_loaded_after("import userverse_models")
+        assert "userverse_models.user.user" not in loaded
+        assert "pydantic" not in loaded
+
+    def test_validation_loads_dependencies(self):
+        """Running the validators should import their dependencies on demand."""
+        loaded = modules_loaded_after(
+            "from userverse_models import UserReadModel\n"
+            "UserReadModel(id=1, email='user@example.com')\n"
+            "from sverse_validators import validate_phone_number_format\n"
+            "validate_phone_number_format('+12025550123')"
+        )
+        assert "phonenumbers" in loaded
+        assert "email_validator" in loaded
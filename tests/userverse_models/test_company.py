@@ -1,6 +1,16 @@
+import pickle
+
 import pytest
 from pydantic import ValidationError
 
+from sverse_generic_models.cursor_pagination import CursorPaginationParams
+from sverse_generic_models.decoding import decode_records
+from sverse_generic_models.generic_pagination import PaginatedResponse, PaginationMeta
+from sverse_generic_models.patch import compute_changeset
+from sverse_generic_models.trusted import construct_trusted
+from sverse_generic_models.wire_codec import decode_wire, encode_wire
+from sverse_validators.interning import InternTable
+
 from userverse_models.company.address import CompanyAddressModel
 from userverse_models.company.company import (
     CompanyCreateModel,
@@ -9,6 +19,10 @@ from userverse_models.company.company import (
     CompanyUpdateModel,
 )
 from userverse_models.company.user import CompanyUserAddModel, CompanyUserReadModel
+from userverse_models.interned import (
+    InternedCompanyReadModel,
+    InternedCompanyUserReadModel,
+)
 
 
 class TestCompanyAddressModel:
@@ -49,6 +63,14 @@ class TestCompanyModels:
         )
         assert company.phone_number == "+12025550123"
 
+    def test_company_create_uses_phone_region_context(self):
+        """A phone_region in the validation context should allow local numbers."""
+        company = CompanyCreateModel.model_validate(
+            {"phone_number": "021 555 1234", "email": "info@example.com"},
+            context={"phone_region": "ZA"},
+        )
+        assert company.phone_number == "+27215551234"
+
     def test_company_update_rejects_invalid_phone(self):
         """Invalid phone numbers should raise ValidationError."""
         with pytest.raises(ValidationError):
@@ -65,6 +87,13 @@ class TestCompanyModels:
         assert params.limit == 10
         assert params.offset() == 20
 
+    def test_accepts_cursor_pagination(self):
+        """Query params should also accept a keyset cursor."""
+        params = CompanyQueryParamsModel(limit=5, cursor="abc.def")
+        assert isinstance(params, CursorPaginationParams)
+        assert params.cursor == "abc.def"
+        assert params.limit == 5
+
 
 class TestCompanyUserModels:
     """Tests for company user models."""
@@ -78,3 +107,155 @@ class TestCompanyUserModels:
         """CompanyUserReadModel should require role_name."""
         with pytest.raises(ValidationError):
             CompanyUserReadModel(id=1, email="user@example.com")
+
+
+class TestTrustedCompanyConstruction:
+    """Trusted construction of company read models."""
+
+    def test_company_read_nested_address(self):
+        """CompanyReadModel should get a real CompanyAddressModel."""
+        data = {
+            "id": 1,
+            "email": "info@example.com",
+            "address": {"city": "Cape Town", "country": "South Africa"},
+        }
+        company = construct_trusted(CompanyReadModel, data)
+        assert isinstance(company.address, CompanyAddressModel)
+        assert company.model_dump_json() == (
+            CompanyReadModel.model_validate(data).model_dump_json()
+        )
+
+
+class TestInterning:
+    """Opt-in interning of low-cardinality company fields."""
+
+    def test_decode_records_interns_repeated_values(self):
+        """Decoding with the intern context should share repeated strings."""
+        table = InternTable()
+        rows = [
+            {
+                "id": i,
+                "email": f"user{i}@example.com",
+                "role_name": "".join(["View", "er"]),
+                "status": "".join(["act", "ive"]),
+            }
+            for i in range(3)
+        ]
+        users = decode_records(
+            InternedCompanyUserReadModel, rows, context={"intern_strings": table}
+        )
+        assert isinstance(users[0], CompanyUserReadModel)
+        assert users[0].role_name is users[2].role_name
+        assert users[0].status is users[1].status
+        assert table.info().hits == 4
+
+    def test_address_fields_interned(self):
+        """Company address city, state and country should be interned."""
+        table = InternTable()
+        data = {
+            "id": 1,
+            "email": "info@example.com",
+            "industry": "Software",
+            "address": {"city": "Durban", "state": "KZN", "country": "South Africa"},
+        }
+        InternedCompanyReadModel.model_validate(data, context={"intern_strings": table})
+        assert table.info().currsize == 4
+
+    def test_plain_models_do_not_intern(self):
+        """The plain Read models should ignore the intern context."""
+        table = InternTable()
+        CompanyReadModel.model_validate(
+            {
+                "id": 1,
+                "email": "info@example.com",
+                "industry": "Software",
+                "address": {"city": "Durban"},
+            },
+            context={"intern_strings": table},
+        )
+        assert table.info().currsize == 0
+
+    def test_interned_records_pickle(self):
+        """Interned variants should survive pickling, e.g. for process pools."""
+        company = InternedCompanyReadModel(
+            id=1,
+            email="info@example.com",
+            address={"city": "Durban", "country": "South Africa"},
+        )
+        assert pickle.loads(pickle.dumps(company)) == company
+
+
+class TestWireCodec:
+    """Positional wire transport of company models between services."""
+
+    def test_paginated_company_users_round_trip(self):
+        """A page of company users should survive a wire round trip."""
+        page = PaginatedResponse[CompanyUserReadModel](
+            records=[
+                CompanyUserReadModel(
+                    id=i, email=f"user{i}@example.com", role_name="Viewer"
+                )
+                for i in range(3)
+            ],
+            pagination=PaginationMeta(
+                total_records=3, limit=10, current_page=1, total_pages=1
+            ),
+        )
+        payload = encode_wire(page)
+        assert len(payload) < len(page.model_dump_json())
+        assert decode_wire(type(page), payload) == page
+
+    def test_company_with_address_round_trip(self):
+        """The nested address should be laid out and decoded positionally."""
+        company = CompanyReadModel(
+            id=1,
+            email="info@example.com",
+            phone_number="+27215551234",
+            address=CompanyAddressModel(city="Cape Town", country="South Africa"),
+        )
+        assert decode_wire(CompanyReadModel, encode_wire(company)) == company
+
+
+class TestCompanyChangeset:
+    """Minimal changesets for company updates."""
+
+    def test_nested_address_fields(self):
+        """Only the changed address fields should be written."""
+        current = CompanyReadModel(
+            id=1,
+            email="info@example.com",
+            name="Acme",
+            address=CompanyAddressModel(city="Cape Town", country="South Africa"),
+        )
+        update = CompanyUpdateModel(
+            name="Acme",
+            address=CompanyAddressModel(city="Durban", country="South Africa"),
+        )
+        changeset = compute_changeset(current, update)
+        assert changeset.changes == {"address.city": "Durban"}
+        assert changeset.columns() == {"address_city": "Durban"}
+        changeset.apply(current)
+        assert current.address.city == "Durban"
+        assert current.address.country == "South Africa"
+
+
+class TestCompanyProjection:
+    """Sparse fieldsets for company listings."""
+
+    def test_id_name_and_city(self):
+        """Mobile clients should get only the requested company fields."""
+        company = CompanyReadModel(
+            id=1,
+            name="Acme",
+            email="info@example.com",
+            address=CompanyAddressModel(city="Cape Town", country="South Africa"),
+        )
+        query = CompanyQueryParamsModel(fields="id,name,address.city")
+        assert query.projection().dump_json(company) == (
+            b'{"id":1,"name":"Acme","address":{"city":"Cape Town"}}'
+        )
+
+    def test_rejects_unknown_field(self):
+        """Fields are validated against CompanyReadModel."""
+        with pytest.raises(ValidationError):
+            CompanyQueryParamsModel(fields="id,address.planet")
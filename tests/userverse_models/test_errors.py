@@ -0,0 +1,29 @@
+import pytest
+
+from sverse_generic_models.app_error import AppErrorResponseModel, error_catalog
+from userverse_models.company.roles import CompanyDefaultRoles, RoleDeleteModel
+from userverse_models.errors import (
+    DEFAULT_ROLE_DELETE,
+    INVALID_CREDENTIALS,
+    ROLE_NOT_FOUND,
+)
+
+
+class TestUserverseErrors:
+    """Tests for the errors registered by the Userverse models."""
+
+    def test_registered_in_shared_catalog(self):
+        """Errors should be looked up by code in the process-wide catalog."""
+        assert error_catalog.get("invalid_credentials") is INVALID_CREDENTIALS
+        assert INVALID_CREDENTIALS.status_code == 401
+        body = error_catalog.render("role_not_found", role_name="Ops")
+        assert body == ROLE_NOT_FOUND.model(role_name="Ops").model_dump_json().encode()
+
+    def test_default_role_message_matches_validator(self):
+        """The catalog message should match the RoleDeleteModel validator."""
+        role = CompanyDefaultRoles.VIEWER.name_value
+        with pytest.raises(ValueError) as info:
+            RoleDeleteModel(replacement_role_name="Ops", role_name_to_delete=role)
+        body = DEFAULT_ROLE_DELETE.render(role_name=role)
+        message = AppErrorResponseModel.model_validate_json(body).detail.message
+        assert message in str(info.value)
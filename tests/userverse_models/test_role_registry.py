@@ -0,0 +1,123 @@
+import pytest
+
+from userverse_models.company.role_registry import (
+    CompiledRole,
+    Permission,
+    RoleRegistry,
+    compile_permissions,
+)
+from userverse_models.company.roles import (
+    DEFAULT_ROLE_NAMES,
+    CompanyDefaultRoles,
+    RoleCreateModel,
+    RoleReadModel,
+)
+from userverse_models.company.user import CompanyUserReadModel
+
+
+def company_user(role_name: str) -> CompanyUserReadModel:
+    return CompanyUserReadModel(id=1, email="user@example.com", role_name=role_name)
+
+
+class TestCompilePermissions:
+    """Tests for permission bitmask compilation."""
+
+    def test_accepts_flags_names_and_ints(self):
+        """Flags, names and int masks should compile to the same bitmask."""
+        expected = Permission.VIEW_USERS | Permission.MANAGE_USERS
+        assert compile_permissions(expected) == expected
+        assert compile_permissions(["view_users", "MANAGE_USERS"]) == expected
+        assert compile_permissions(int(expected)) == expected
+        assert compile_permissions("view_users") == Permission.VIEW_USERS
+
+    def test_rejects_unknown_permissions(self):
+        """Unknown names and bits should raise ValueError."""
+        with pytest.raises(ValueError):
+            compile_permissions(["fly"])
+        with pytest.raises(ValueError):
+            compile_permissions(1 << 20)
+
+
+class TestRoleRegistry:
+    """Tests for role resolution and permission checks."""
+
+    def test_default_roles_are_precompiled(self):
+        """Default roles should resolve without registration."""
+        registry = RoleRegistry()
+        admin = registry.get("Administrator")
+        assert admin == CompiledRole(
+            "Administrator",
+            CompanyDefaultRoles.ADMINISTRATOR.description,
+            Permission.ALL,
+            True,
+        )
+        assert registry.default_role("Viewer") is CompanyDefaultRoles.VIEWER
+        assert all(registry.is_default(name) for name in DEFAULT_ROLE_NAMES)
+        assert not registry.is_default("Manager")
+
+    def test_can_checks_company_user_role(self):
+        """Administrators manage users; viewers only view them."""
+        registry = RoleRegistry()
+        assert registry.can(company_user("Administrator"), Permission.MANAGE_USERS)
+        assert registry.can(company_user("Viewer"), Permission.VIEW_USERS)
+        assert not registry.can(company_user("Viewer"), Permission.MANAGE_USERS)
+        assert not registry.can(
+            company_user("Viewer"), Permission.VIEW_USERS | Permission.MANAGE_USERS
+        )
+
+    def test_unknown_role_has_no_permissions(self):
+        """Unknown roles should resolve to an empty mask."""
+        registry = RoleRegistry()
+        assert registry.get("Ghost") is None
+        assert registry.permissions("Ghost") == 0
+        assert not registry.can(company_user("Ghost"), Permission.VIEW_COMPANY)
+
+    def test_custom_roles_are_scoped_per_company(self):
+        """Company roles should only apply to their company."""
+        registry = RoleRegistry()
+        registry.register_model(
+            RoleCreateModel(name="Manager", description="Manages users"),
+            ["view_users", "manage_users"],
+            company_id=7,
+        )
+        manager = company_user("Manager")
+        assert registry.can(manager, Permission.MANAGE_USERS, company_id=7)
+        assert not registry.can(manager, Permission.MANAGE_USERS, company_id=8)
+        assert registry.get("Manager", 7).description == "Manages users"
+
+    def test_company_role_overrides_global_role(self):
+        """A company's own definition should win over a global one."""
+        registry = RoleRegistry()
+        registry.register("Auditor", Permission.VIEW_DATA)
+        registry.register_model(
+            RoleReadModel(name="Auditor", description=None),
+            Permission.VIEW_DATA | Permission.VIEW_USERS,
+            company_id=3,
+        )
+        assert registry.has_permission("Auditor", Permission.VIEW_USERS, 3)
+        assert not registry.has_permission("Auditor", Permission.VIEW_USERS, 4)
+        registry.unregister("Auditor", 3)
+        assert not registry.has_permission("Auditor", Permission.VIEW_USERS, 3)
+
+    def test_global_changes_reach_existing_companies(self):
+        """Global roles registered or removed later should apply to every company."""
+        registry = RoleRegistry()
+        registry.register("Manager", Permission.MANAGE_USERS, company_id=5)
+        registry.register("Auditor", Permission.VIEW_DATA)
+        assert registry.permissions("Auditor", 5) == int(Permission.VIEW_DATA)
+        assert registry.permissions("Manager", 5) == int(Permission.MANAGE_USERS)
+        registry.unregister("Auditor")
+        assert registry.get("Auditor", 5) is None
+        assert registry.get("Viewer", 5).is_default
+
+    def test_default_roles_cannot_be_redefined(self):
+        """Registering a default role name should raise ValueError."""
+        with pytest.raises(ValueError):
+            RoleRegistry().register("Viewer", Permission.ALL, company_id=1)
+
+    def test_role_model_requires_name(self):
+        """A role model without a name cannot be registered."""
+        with pytest.raises(ValueError):
+            RoleRegistry().register_model(
+                RoleReadModel(name=None, description=None), Permission.VIEW_DATA
+            )
@@ -1,6 +1,12 @@
 import pytest
 from pydantic import ValidationError
 
+from sverse_generic_models.cursor_pagination import CursorPaginationParams
+from sverse_validators.instrumentation import (
+    disable_instrumentation,
+    enable_instrumentation,
+)
+
 from userverse_models.company.roles import (
     CompanyDefaultRoles,
     RoleCreateModel,
@@ -52,9 +58,40 @@ class TestRoleModels:
                 role_name_to_delete=CompanyDefaultRoles.ADMINISTRATOR.name_value,
             )
 
+    def test_role_delete_validator_is_instrumented(self):
+        """The default-role check should report its latency and failures."""
+        sink = enable_instrumentation()
+        try:
+            RoleDeleteModel(replacement_role_name="Viewer", role_name_to_delete="Ops")
+            with pytest.raises(ValidationError):
+                RoleDeleteModel(
+                    replacement_role_name="Viewer",
+                    role_name_to_delete=CompanyDefaultRoles.VIEWER.name_value,
+                )
+        finally:
+            disable_instrumentation()
+        series = sink.snapshot()[("validator", "validate_not_default_role")]
+        assert series.successes == 1
+        assert series.failures == {"ValueError": 1}
+
     def test_role_query_params_inherit_pagination(self):
         """Query params should inherit pagination defaults."""
         params = RoleQueryParamsModel(page=2, name="Admin")
         assert params.limit == 10
         assert params.offset() == 10
         assert params.name == "Admin"
+
+    def test_fields_projection(self):
+        """Query params should project RoleReadModel fields."""
+        params = RoleQueryParamsModel(fields="name")
+        role = RoleReadModel(name="Viewer", description="Read-only")
+        assert params.projection().dump(role) == {"name": "Viewer"}
+        with pytest.raises(ValidationError):
+            RoleQueryParamsModel(fields="permissions")
+
+    def test_accepts_cursor_pagination(self):
+        """Query params should also accept a keyset cursor."""
+        params = RoleQueryParamsModel(limit=5, cursor="abc.def")
+        assert isinstance(params, CursorPaginationParams)
+        assert params.cursor == "abc.def"
+        assert params.limit == 5
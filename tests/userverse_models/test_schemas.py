@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from userverse_models.schemas import (
+    READ_MODELS,
+    default_registry,
+    default_specializations,
+    shipped_models,
+)
+from userverse_models.user.user import UserReadModel
+from sverse_generic_models.generic_pagination import PaginatedResponse
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def run_fresh(*args: str) -> str:
+    """Run ``python *args`` in a new interpreter and return its output."""
+    result = subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestDefaultRegistry:
+    """Tests for the registry of shipped models."""
+
+    def test_covers_read_model_specializations(self):
+        """Generic wrappers of the Read models should be registered."""
+        assert PaginatedResponse[UserReadModel] in shipped_models()
+        assert UserReadModel in default_registry().models
+
+    def test_artifact_contains_every_model(self, tmp_path):
+        """The build artifact should hold both modes for every model."""
+        registry = default_registry()
+        path = tmp_path / "schemas.json"
+        registry.write_artifact(str(path))
+        artifact = registry.to_artifact()
+        assert len(artifact["schemas"]) == len(shipped_models())
+        assert registry.load_artifact(str(path)) is True
+        assert registry.schema(UserReadModel) == UserReadModel.model_json_schema()
+
+    def test_build_artifact_loads_at_startup(self, tmp_path):
+        """The CLI artifact should be accepted by another process.
+
+        Interned fields carry validator functions, whose reprs differ per
+        process, so this only holds with a stable fingerprint.
+        """
+        path = str(tmp_path / "schemas.json")
+        run_fresh("-m", "userverse_models.schemas", "--output", path)
+        loaded = run_fresh(
+            "-c",
+            "from userverse_models.schemas import default_registry\n"
+            f"print(default_registry().load_artifact({path!r}))",
+        )
+        assert loaded == "True"
+        assert default_registry().load_artifact(path) is True
+
+
+class TestDefaultSpecializations:
+    """Tests for warming the generic wrappers of the shipped Read models."""
+
+    def test_warm_covers_read_models(self):
+        """Every Read model should be specialized by every default wrapper."""
+        cache = default_specializations()
+        cache.warm()
+        assert cache.models == READ_MODELS
+        assert cache.warm() == []
+        assert cache.get(PaginatedResponse, UserReadModel) is (
+            PaginatedResponse[UserReadModel]
+        )
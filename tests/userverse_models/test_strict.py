@@ -0,0 +1,100 @@
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from sverse_generic_models.generic_pagination import PaginatedResponse
+from sverse_generic_models.strict import strict_model
+from userverse_models.company.company import CompanyReadModel
+from userverse_models.company.roles import RoleReadModel
+from userverse_models.company.user import CompanyUserReadModel
+from userverse_models.strict import (
+    StrictCompanyAddressModel,
+    StrictCompanyReadModel,
+    StrictCompanyUserReadModel,
+    StrictRoleReadModel,
+    StrictUserReadModel,
+)
+from userverse_models.user.user import UserReadModel
+
+USER = {
+    "id": 1,
+    "first_name": "Ada",
+    "last_name": "Lovelace",
+    "email": "ada@example.com",
+    "phone_number": "+12025550123",
+    "status": "active",
+    "is_superuser": False,
+}
+COMPANY = {
+    "id": 2,
+    "name": "Acme",
+    "description": None,
+    "industry": "Software",
+    "phone_number": None,
+    "email": "info@acme.com",
+    "address": {
+        "street": "1 Main St",
+        "city": "Cape Town",
+        "state": None,
+        "postal_code": "8000",
+        "country": "South Africa",
+    },
+}
+CASES = [
+    (UserReadModel, StrictUserReadModel, USER),
+    (CompanyUserReadModel, StrictCompanyUserReadModel, {**USER, "role_name": "Viewer"}),
+    (CompanyReadModel, StrictCompanyReadModel, COMPANY),
+    (RoleReadModel, StrictRoleReadModel, {"name": "Viewer", "description": None}),
+]
+
+
+class TestStrictReadModels:
+    """Tests for the strict Read model variants."""
+
+    @pytest.mark.parametrize("model,strict,payload", CASES)
+    def test_round_trip_matches_lax(self, model, strict, payload):
+        """Strict variants should accept well-typed JSON and emit the same JSON."""
+        body = json.dumps(payload)
+        assert strict is strict_model(model)
+        assert (
+            strict.model_validate_json(body).model_dump_json()
+            == model.model_validate_json(body).model_dump_json()
+        )
+
+    def test_rejects_coerced_values(self):
+        """Strings standing in for ints or bools should be rejected."""
+        for change in ({"id": "1"}, {"is_superuser": "false"}, {"is_superuser": 0}):
+            UserReadModel.model_validate_json(json.dumps({**USER, **change}))
+            with pytest.raises(ValidationError):
+                StrictUserReadModel.model_validate_json(json.dumps({**USER, **change}))
+
+    @pytest.mark.parametrize("model,strict,payload", CASES)
+    def test_pickle_round_trip(self, model, strict, payload):
+        """Strict instances should survive pickling for process pools."""
+        instance = strict.model_validate_json(json.dumps(payload))
+        restored = pickle.loads(pickle.dumps(instance))
+        assert type(restored) is strict
+        assert restored == instance
+
+    def test_email_still_validated(self):
+        """Strictness should not skip the email validator."""
+        with pytest.raises(ValidationError):
+            StrictUserReadModel.model_validate({**USER, "email": "not-an-email"})
+
+    def test_company_page(self):
+        """A strict company page should use the strict nested address."""
+        page = strict_model(PaginatedResponse[CompanyReadModel]).model_validate(
+            {
+                "records": [COMPANY],
+                "pagination": {
+                    "total_records": 1,
+                    "limit": 10,
+                    "current_page": 1,
+                    "total_pages": 1,
+                },
+            }
+        )
+        assert isinstance(page.records[0], StrictCompanyReadModel)
+        assert isinstance(page.records[0].address, StrictCompanyAddressModel)
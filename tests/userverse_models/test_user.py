@@ -1,6 +1,10 @@
 import pytest
 from pydantic import ValidationError
 
+from sverse_generic_models.cursor_pagination import CursorPaginationParams
+from sverse_generic_models.filtering import compile_filter
+from sverse_generic_models.patch import Changeset, compute_changeset
+
 from userverse_models.user.password import OTPValidationRequest, PasswordResetRequest
 from userverse_models.user.user import (
     TokenResponseModel,
@@ -29,6 +33,31 @@ class TestUserCreateModel:
         user = UserCreateModel(phone_number="+12025550123")
         assert user.phone_number == "+12025550123"
 
+    def test_phone_region_from_validation_context(self):
+        """A phone_region in the validation context should allow local numbers."""
+        user = UserCreateModel.model_validate(
+            {"phone_number": "082 123 4567"}, context={"phone_region": "ZA"}
+        )
+        assert user.phone_number == "+27821234567"
+
+    def test_non_mapping_context_is_ignored(self):
+        """Contexts that are not mappings should not break validation."""
+        user = UserCreateModel.model_validate(
+            {"phone_number": "+12025550123"}, context=["x"]
+        )
+        assert user.phone_number == "+12025550123"
+
+    def test_phone_region_class_default(self):
+        """Subclasses can set a default region for local numbers."""
+
+        class LocalUserCreateModel(UserCreateModel):
+            phone_region = "ZA"
+
+        user = LocalUserCreateModel(phone_number="082 123 4567")
+        assert user.phone_number == "+27821234567"
+        with pytest.raises(ValidationError):
+            UserCreateModel(phone_number="082 123 4567")
+
 
 class TestUserUpdateModel:
     """Tests for user update model."""
@@ -38,6 +67,38 @@ class TestUserUpdateModel:
         with pytest.raises(ValidationError):
             UserUpdateModel(phone_number="123")
 
+    def test_changeset_skips_unchanged_and_unsent_fields(self):
+        """Only sent fields that differ from the stored user should change."""
+        current = UserReadModel(
+            id=1,
+            email="user@example.com",
+            first_name="Ada",
+            last_name="Lovelace",
+            phone_number="+12025550123",
+        )
+        update = UserUpdateModel(
+            first_name="Ada", phone_number="+1 202-555-0199", password="secret"
+        )
+        changeset = compute_changeset(current, update)
+        assert changeset.changes == {
+            "phone_number": "+12025550199",
+            "password": "secret",
+        }
+        assert compute_changeset(current, UserUpdateModel(first_name="Ada")) == (
+            Changeset()
+        )
+
+    def test_changeset_applies_to_read_model(self):
+        """Applying should update the user and leave the password to the caller."""
+        current = UserReadModel(
+            id=1, email="user@example.com", first_name="Ada", last_name="Lovelace"
+        )
+        update = UserUpdateModel(first_name="B", password="secret")
+        changeset = compute_changeset(current, update)
+        assert changeset.apply(current) is current
+        assert current.first_name == "B"
+        assert changeset.write_only == {"password": "secret"}
+
 
 class TestUserReadModel:
     """Tests for user read model."""
@@ -72,6 +133,37 @@ class TestUserQueryParams:
         assert params.limit == 10
         assert params.offset() == 10
 
+    def test_accepts_cursor_pagination(self):
+        """Query params should also accept a keyset cursor."""
+        params = UserQueryParams(limit=5, cursor="abc.def")
+        assert isinstance(params, CursorPaginationParams)
+        assert params.cursor == "abc.def"
+        assert params.limit == 5
+
+    def test_compiles_to_filter(self):
+        """Populated filters should compile to a predicate and SQL fragment."""
+        params = UserQueryParams(first_name="jo", email="example.com", page=2)
+        compiled = compile_filter(params)
+        assert compiled.plan.fields == ("first_name", "email")
+        users = [
+            UserReadModel(id=1, first_name="John", email="john@example.com"),
+            UserReadModel(id=2, first_name="Jo", email="jo@test.org"),
+        ]
+        assert [user.id for user in compiled.filter(users)] == [1]
+        assert compiled.where().params == {
+            "first_name": "%jo%",
+            "email": "%example.com%",
+        }
+
+    def test_fields_projection(self):
+        """fields should project UserReadModel and not act as a filter."""
+        params = UserQueryParams(fields="id,first_name,email", first_name="jo")
+        assert compile_filter(params).plan.fields == ("first_name",)
+        user = UserReadModel(id=1, first_name="Jo", email="jo@example.com")
+        assert params.projection().dump_json(user) == (
+            b'{"id":1,"first_name":"Jo","email":"jo@example.com"}'
+        )
+
 
 class TestPasswordModels:
     """Tests for password reset models."""
@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pydantic import BaseModel, ValidationError
+
+from sverse_validators.batch import (
+    BatchItemResult,
+    validate_emails,
+    validate_phone_numbers,
+)
+from sverse_validators.email_address import EmailStr
+from sverse_validators.phone_number import validate_phone_number_format
+
+SAMPLE = [
+    "+12025550123",
+    "123",
+    None,
+    "",
+    "not-a-number",
+    "+1 202-555-0123",
+    "+442079460958",
+    "+12025550123",
+]
+
+
+def expected(phone):
+    try:
+        return BatchItemResult(validate_phone_number_format(phone))
+    except ValueError as exc:
+        return BatchItemResult(None, str(exc))
+
+
+class TestValidatePhoneNumbers:
+    """Tests for bulk phone number validation."""
+
+    def test_results_match_single_item_function(self):
+        """Every result should match validate_phone_number_format."""
+        results = validate_phone_numbers(SAMPLE)
+        assert results == [expected(phone) for phone in SAMPLE]
+
+    def test_results_preserve_input_order_and_length(self):
+        """Duplicates should be fanned back out in input order."""
+        results = validate_phone_numbers(["+12025550123", "123", "+12025550123"])
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[0] is results[2]
+
+    def test_accepts_generators(self):
+        """Any iterable of raw numbers should be accepted."""
+        results = validate_phone_numbers(p for p in ["+12025550123"])
+        assert results == [BatchItemResult("+12025550123")]
+
+    def test_external_executor_is_used(self):
+        """A caller-provided executor should produce identical results."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = validate_phone_numbers(
+                SAMPLE, executor=executor, chunk_size=2, parallel_threshold=1
+            )
+        assert results == [expected(phone) for phone in SAMPLE]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_process_pool_matches_sequential(self, workers):
+        """Process-pool execution should match the in-process results."""
+        results = validate_phone_numbers(
+            SAMPLE, workers=workers, chunk_size=3, parallel_threshold=1
+        )
+        assert results == validate_phone_numbers(SAMPLE)
+
+
+class EmailModel(BaseModel):
+    """Model used to compare batch email results with EmailStr."""
+
+    email: EmailStr
+
+
+EMAILS = [
+    "user@example.com",
+    "User.Name@Example.COM",
+    "John Doe <john@example.com>",
+    "not-an-email",
+    None,
+    "user@example.com",
+]
+
+
+def expected_email(email):
+    if email is None:
+        return BatchItemResult(None)
+    try:
+        return BatchItemResult(EmailModel(email=email).email)
+    except ValidationError as exc:
+        return BatchItemResult(None, exc.errors()[0]["msg"])
+
+
+class TestValidateEmails:
+    """Tests for bulk email validation."""
+
+    def test_results_match_email_str(self):
+        """Every result should match EmailStr's value or error message."""
+        assert validate_emails(EMAILS) == [expected_email(e) for e in EMAILS]
+
+    def test_process_pool_matches_sequential(self):
+        """Process-pool execution should match the in-process results."""
+        results = validate_emails(EMAILS, workers=2, chunk_size=2, parallel_threshold=1)
+        assert results == validate_emails(EMAILS)
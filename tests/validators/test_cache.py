@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from sverse_validators.cache import BoundedCache
+
+
+class TestBoundedCache:
+    """Tests for the bounded LRU/TTL cache."""
+
+    def test_get_miss_returns_default(self):
+        """Missing keys should return the default and count as a miss."""
+        cache = BoundedCache(maxsize=2)
+        assert cache.get("a", "default") == "default"
+        assert cache.info().misses == 1
+
+    def test_hit_is_counted(self):
+        """Stored keys should be returned and count as a hit."""
+        cache = BoundedCache(maxsize=2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.info().hits == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The oldest unused entry should be evicted when full."""
+        cache = BoundedCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        info = cache.info()
+        assert info.evictions == 1
+        assert info.currsize == 2
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        """Entries older than the TTL should be treated as misses."""
+        now = [100.0]
+        monkeypatch.setattr("sverse_validators.cache.time.monotonic", lambda: now[0])
+        cache = BoundedCache(maxsize=2, ttl=10)
+        cache.put("a", 1)
+        now[0] += 11
+        assert cache.get("a") is None
+        info = cache.info()
+        assert info.expirations == 1
+        assert info.currsize == 0
+
+    def test_zero_maxsize_disables_caching(self):
+        """A maxsize of 0 should never store entries."""
+        cache = BoundedCache(maxsize=0)
+        cache.put("a", 1)
+        assert len(cache) == 0
+
+    def test_configure_shrinks_and_evicts(self):
+        """Shrinking the cache should evict overflow entries immediately."""
+        cache = BoundedCache(maxsize=3)
+        for key in "abc":
+            cache.put(key, key)
+        cache.configure(maxsize=1)
+        assert cache.maxsize == 1
+        assert cache.get("c") == "c"
+        assert cache.info().evictions == 2
+
+    def test_configure_keeps_ttl_when_omitted(self):
+        """Omitting ttl should leave the current TTL untouched."""
+        cache = BoundedCache(maxsize=3, ttl=5)
+        cache.configure(maxsize=10)
+        assert cache.ttl == 5
+        cache.configure(ttl=None)
+        assert cache.ttl is None
+
+    @pytest.mark.parametrize("maxsize,ttl", [(-1, None), (1, 0)])
+    def test_invalid_config_raises(self, maxsize, ttl):
+        """Negative sizes and non-positive TTLs should be rejected."""
+        with pytest.raises(ValueError):
+            BoundedCache(maxsize=maxsize, ttl=ttl)
+
+    def test_clear_resets_entries_and_counters(self):
+        """clear() should drop entries and reset counters."""
+        cache = BoundedCache(maxsize=2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+    def test_concurrent_access_respects_maxsize(self):
+        """Concurrent writers should never push the cache past maxsize."""
+        cache = BoundedCache(maxsize=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.put(offset + i, i)
+                cache.get(offset + i)
+
+        threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        assert info.currsize == 50
+        assert info.hits + info.misses == 8 * 500
@@ -0,0 +1,94 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+from pydantic import EmailStr as PydanticEmailStr
+
+from sverse_validators.email_address import (
+    MAX_CACHEABLE_LENGTH,
+    EmailStr,
+    email_cache,
+    validate_email_address,
+)
+
+
+class LazyModel(BaseModel):
+    email: EmailStr
+
+
+class PydanticModel(BaseModel):
+    email: PydanticEmailStr
+
+
+def outcome(model, value):
+    try:
+        return model(email=value).email
+    except ValidationError as exc:
+        return [(e["type"], e["msg"]) for e in exc.errors()]
+
+
+class TestEmailStr:
+    """Tests for the lazily imported EmailStr type."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "user@example.com",
+            "User.Name@Example.COM",
+            "John Doe <john@example.com>",
+            "not-an-email",
+            "a" * 300 + "@example.com",
+            "",
+            123,
+        ],
+    )
+    def test_matches_pydantic_email_str(self, value):
+        """Values and errors should match pydantic.EmailStr, cached or not."""
+        expected = outcome(PydanticModel, value)
+        assert outcome(LazyModel, value) == expected
+        assert outcome(LazyModel, value) == expected
+
+    def test_json_schema_matches_pydantic_email_str(self):
+        """The JSON schema should declare an email-formatted string."""
+        lazy = LazyModel.model_json_schema()["properties"]["email"]
+        expected = PydanticModel.model_json_schema()["properties"]["email"]
+        assert lazy == expected
+
+
+class TestEmailCache:
+    """Tests for memoization of email validation."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        email_cache.clear()
+        yield
+        email_cache.configure(maxsize=4096, ttl=None)
+        email_cache.clear()
+
+    def test_repeated_valid_email_hits_cache(self):
+        """A second validation should be served from the cache."""
+        assert validate_email_address("User@Example.COM") == "User@example.com"
+        assert validate_email_address("User@Example.COM") == "User@example.com"
+        info = email_cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_invalid_email_is_cached_with_same_error(self, monkeypatch):
+        """Rejected inputs should be cached and raise an equal error."""
+        with pytest.raises(ValueError) as first:
+            validate_email_address("not-an-email")
+        monkeypatch.setattr("pydantic.networks.validate_email", None)
+        with pytest.raises(ValueError) as second:
+            validate_email_address("not-an-email")
+        assert str(second.value) == str(first.value)
+        assert second.value is not first.value
+        assert email_cache.info().hits == 1
+
+    def test_oversized_input_is_not_cached(self):
+        """Inputs over the cacheable length should bypass the cache."""
+        with pytest.raises(ValueError):
+            validate_email_address("a" * MAX_CACHEABLE_LENGTH + "@example.com")
+        assert len(email_cache) == 0
+
+    def test_disabled_cache_still_validates(self):
+        """A cache with maxsize 0 should not change results."""
+        email_cache.configure(maxsize=0)
+        assert LazyModel(email="user@example.com").email == "user@example.com"
+        assert len(email_cache) == 0
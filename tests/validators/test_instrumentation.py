@@ -0,0 +1,139 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from sverse_validators.email_address import EmailStr
+from sverse_validators.instrumentation import (
+    InMemorySink,
+    InstrumentationSink,
+    LatencyHistogram,
+    active_sink,
+    disable_instrumentation,
+    enable_instrumentation,
+)
+from sverse_validators.phone_number import validate_phone_number_format
+
+
+class Contact(BaseModel):
+    """Model using the instrumented validators."""
+
+    email: EmailStr
+    phone: Optional[str] = None
+
+    @field_validator("phone")
+    @classmethod
+    def check_phone(cls, value: Optional[str]) -> Optional[str]:
+        return validate_phone_number_format(value)
+
+
+class Priority(Contact):
+    """Subclass, covered through its instrumented base."""
+
+
+class RecordingSink(InstrumentationSink):
+    """Sink collecting raw events."""
+
+    def __init__(self):
+        self.events = []
+
+    def record(self, kind, name, ns, error):
+        self.events.append((kind, name, error))
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    """Make sure every test leaves instrumentation off."""
+    yield
+    disable_instrumentation()
+
+
+class TestLatencyHistogram:
+    """Tests for the log-linear latency histogram."""
+
+    def test_percentiles_within_bucket_precision(self):
+        """Percentiles should land within ~20% below the true value."""
+        histogram = LatencyHistogram()
+        for ns in range(1, 10_001):
+            histogram.record(ns * 100)
+        stats = histogram.stats()
+        assert stats.count == 10_000
+        assert stats.max == pytest.approx(1e-3)
+        assert stats.mean == pytest.approx(500_050e-9)
+        for fraction, value in ((0.5, 500e-6), (0.9, 900e-6), (0.99, 990e-6)):
+            assert 0.8 * value <= histogram.percentile(fraction) <= value
+
+    def test_small_and_empty(self):
+        """Tiny durations are exact and an empty histogram reports zeros."""
+        histogram = LatencyHistogram()
+        assert histogram.stats().p50 == 0.0
+        histogram.record(3)
+        assert histogram.percentile(0.5) == 3e-9
+
+
+class TestInstrumentation:
+    """Tests for enabling sinks on validators and models."""
+
+    def test_disabled_by_default_records_nothing(self):
+        """Validators should work and report nothing while disabled."""
+        sink = RecordingSink()
+        assert active_sink() is None
+        Contact(email="a@example.com", phone="+27821234567")
+        assert sink.events == []
+        assert not hasattr(Contact.model_validate, "_sv_instrumented")
+
+    def test_validator_latency_and_error_types(self):
+        """Decorated validators should record successes and typed failures."""
+        sink = enable_instrumentation(RecordingSink())
+        validate_phone_number_format("+27821234567")
+        with pytest.raises(ValueError):
+            validate_phone_number_format("not a phone")
+        with pytest.raises(ValidationError):
+            Contact(email="not-an-email")
+        assert sink.events == [
+            ("validator", "validate_phone_number_format", None),
+            ("validator", "validate_phone_number_format", "ValueError"),
+            ("validator", "validate_email_address", "value_error"),
+        ]
+
+    def test_models_record_validate_and_serialize(self):
+        """Instrumented models should time validation and dumping per class."""
+        sink = enable_instrumentation(models=[Contact])
+        assert isinstance(sink, InMemorySink)
+        contact = Priority.model_validate({"email": "a@example.com"})
+        contact.model_dump_json()
+        Contact.model_validate_json('{"email": "b@example.com"}')
+        with pytest.raises(ValidationError):
+            Contact()
+
+        snapshot = sink.snapshot()
+        assert snapshot[("validate", "Priority")].successes == 1
+        assert snapshot[("serialize", "Priority")].latency.count == 1
+        validate = snapshot[("validate", "Contact")]
+        assert (validate.successes, validate.failures) == (1, {"missing": 1})
+        assert snapshot[("validator", "validate_email_address")].successes == 2
+        assert "Priority" in sink.report()
+
+    def test_disable_restores_models(self):
+        """Disabling should remove the wrappers from patched classes."""
+        original = Contact.__dict__.get("model_dump")
+        enable_instrumentation(RecordingSink(), models=[Contact])
+        assert Contact.__dict__["model_dump"] is not original
+        disable_instrumentation()
+        assert Contact.__dict__.get("model_dump") is original
+        assert "__init__" not in Contact.__dict__
+        assert Contact(email="a@example.com").model_dump()["phone"] is None
+
+    def test_rejects_non_models(self):
+        """Only pydantic model classes can be instrumented."""
+        with pytest.raises(ValueError):
+            enable_instrumentation(models=[dict])
+
+    def test_sinks_must_implement_record(self):
+        """A sink without record should fail when created, not when called."""
+
+        class Incomplete(InstrumentationSink):
+            pass
+
+        with pytest.raises(TypeError, match="record"):
+            Incomplete()
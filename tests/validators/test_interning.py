@@ -0,0 +1,155 @@
+import pickle
+import threading
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from sverse_validators.interning import (
+    MAX_INTERNABLE_LENGTH,
+    InternedStr,
+    InternTable,
+    interned_model,
+    string_intern_table,
+    table_from_context,
+)
+
+
+class Labelled(BaseModel):
+    """Model with an interned field, used by interning tests."""
+
+    label: InternedStr
+
+
+class Group(BaseModel):
+    """Model nesting interned models in a list and an Optional field."""
+
+    name: Optional[InternedStr] = None
+    members: List[Labelled] = []
+    owner: Optional[Labelled] = None
+
+
+def fresh(text: str) -> str:
+    """Return a new string object equal to ``text``."""
+    return "".join(list(text))
+
+
+class TestInternTable:
+    """Tests for the bounded intern table."""
+
+    def test_equal_strings_share_one_object(self):
+        """Interning equal strings should return the first object."""
+        table = InternTable()
+        first = table.intern(fresh("active"))
+        second = fresh("active")
+        assert second is not first
+        assert table.intern(second) is first
+        assert table.info().hits == 1
+        assert table.info().misses == 1
+        assert table.info().hit_rate == 0.5
+
+    def test_full_table_passes_new_values_through(self):
+        """A full table should keep its entries and not store new ones."""
+        table = InternTable(maxsize=1)
+        kept = table.intern(fresh("a"))
+        other = fresh("b")
+        assert table.intern(other) is other
+        assert table.intern(fresh("a")) is kept
+        info = table.info()
+        assert info.currsize == 1
+        assert info.rejected == 1
+
+    def test_long_values_are_not_stored(self):
+        """Values over the length limit should never be stored."""
+        table = InternTable()
+        table.intern("x" * (MAX_INTERNABLE_LENGTH + 1))
+        assert len(table) == 0
+        assert table.info().rejected == 1
+
+    def test_configure_and_clear(self):
+        """Shrinking below the size should clear; clear() resets counters."""
+        table = InternTable(maxsize=4)
+        for text in "abc":
+            table.intern(text)
+        table.configure(maxsize=2)
+        assert len(table) == 0
+        table.intern("a")
+        table.clear()
+        assert table.info() == (0, 0, 0, 0, 2)
+        with pytest.raises(ValueError):
+            table.configure(maxsize=-1)
+
+    def test_concurrent_interning(self):
+        """Concurrent callers should all receive the same object."""
+        table = InternTable()
+        results = []
+
+        def worker():
+            results.extend(table.intern(fresh("shared")) for _ in range(200))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(result) for result in results}) == 1
+        assert table.info().hits + table.info().misses == 800
+
+
+class TestInternedStr:
+    """Tests for the InternedStr annotated type."""
+
+    def test_plain_models_do_not_intern(self):
+        """Models using InternedStr directly should validate a plain str."""
+        first = Labelled.model_validate({"label": fresh("plain")})
+        second = Labelled.model_validate(
+            {"label": fresh("plain")}, context={"intern_strings": True}
+        )
+        assert first.label is not second.label
+        assert "function-after" not in repr(Labelled.__pydantic_core_schema__)
+
+    def test_context_selects_table(self):
+        """The context may request the default table or a specific one."""
+        table = InternTable()
+        context = {"intern_strings": table}
+        model = interned_model(Labelled)
+        first = model.model_validate({"label": fresh("pending")}, context=context)
+        second = model.model_validate({"label": fresh("pending")}, context=context)
+        assert first.label is second.label
+        assert table.info().hits == 1
+        assert table_from_context({"intern_strings": True}) is string_intern_table
+        assert table_from_context({"intern_strings": False}) is None
+        assert table_from_context(["intern_strings"]) is None
+
+    def test_variant_defaults_to_shared_table(self):
+        """Without a table in the context the default table is used."""
+        model = interned_model(Labelled)
+        first = model(label=fresh("shared-default"))
+        second = model.model_validate({"label": fresh("shared-default")}, context=[1])
+        assert first.label is second.label
+        assert isinstance(first, Labelled)
+        assert first.model_dump_json() == '{"label":"shared-default"}'
+
+    def test_nested_and_optional_fields(self):
+        """Nested models, lists and Optional fields should be interned too."""
+        model = interned_model(Group)
+        group = model.model_validate(
+            {
+                "name": fresh("team"),
+                "members": [{"label": fresh("lead")}, {"label": fresh("lead")}],
+                "owner": {"label": fresh("lead")},
+            }
+        )
+        assert group.members[0].label is group.members[1].label
+        assert group.owner.label is group.members[0].label
+        assert group.name is model(name=fresh("team")).name
+
+    def test_variants_are_cached_and_picklable(self):
+        """Variants should be built once and pickle like their base model."""
+        model = interned_model(Labelled)
+        assert interned_model(Labelled) is model
+        assert interned_model(model) is model
+        value = model(label="x")
+        restored = pickle.loads(pickle.dumps(value))
+        assert type(restored) is model
+        assert restored == value
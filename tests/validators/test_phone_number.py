@@ -1,6 +1,14 @@
+import phonenumbers
 import pytest
 
-from sverse_validators.phone_number import validate_phone_number_format
+from sverse_validators.phone_number import (
+    MAX_CACHEABLE_LENGTH,
+    PHONE_REGION_CONTEXT_KEY,
+    normalize_phone_number,
+    phone_number_cache,
+    region_from_context,
+    validate_phone_number_format,
+)
 
 
 class TestValidatePhoneNumberFormat:
@@ -27,3 +35,104 @@ class TestValidatePhoneNumberFormat:
         """Non-numeric strings should raise ValueError."""
         with pytest.raises(ValueError):
             validate_phone_number_format("not-a-number")
+
+
+class TestPhoneNumberCache:
+    """Tests for memoization of phone number validation."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        phone_number_cache.clear()
+        yield
+        phone_number_cache.configure(maxsize=4096, ttl=None)
+        phone_number_cache.clear()
+
+    def test_repeated_valid_number_hits_cache(self):
+        """Repeated valid numbers should be served from the cache."""
+        validate_phone_number_format("+12025550123")
+        assert validate_phone_number_format("+12025550123") == "+12025550123"
+        info = phone_number_cache.info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_invalid_number_is_cached_with_same_error(self):
+        """Cached rejections should raise the same ValueError message."""
+        with pytest.raises(ValueError) as first:
+            validate_phone_number_format("123")
+        with pytest.raises(ValueError) as second:
+            validate_phone_number_format("123")
+        assert str(first.value) == str(second.value)
+        assert phone_number_cache.info().hits == 1
+
+    def test_unparseable_number_is_cached_with_same_error(self):
+        """Cached parse failures should keep the format error message."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid phone number format."):
+                validate_phone_number_format("not-a-number")
+        assert phone_number_cache.info().hits == 1
+
+    def test_oversized_input_is_not_cached(self):
+        """Inputs longer than the cacheable limit should bypass the cache."""
+        with pytest.raises(ValueError):
+            validate_phone_number_format("1" * (MAX_CACHEABLE_LENGTH + 1))
+        assert phone_number_cache.info().currsize == 0
+
+    def test_disabled_cache_still_validates(self):
+        """A zero-size cache should still validate every call."""
+        phone_number_cache.configure(maxsize=0)
+        assert validate_phone_number_format("+12025550123") == "+12025550123"
+        assert phone_number_cache.info().currsize == 0
+
+
+class TestTieredValidation:
+    """Tests for the lexical screen, canonical fast path and region hints."""
+
+    @pytest.mark.parametrize("phone", ["not-a-number", "123", "x" * 300, "(abc)"])
+    def test_lexical_screen_rejects_without_parsing(self, phone, monkeypatch):
+        """Junk input should be rejected before phonenumbers.parse runs."""
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("parse should not be called")
+
+        monkeypatch.setattr(phonenumbers, "parse", fail_parse)
+        with pytest.raises(ValueError, match="Invalid phone number format."):
+            normalize_phone_number(phone)
+
+    def test_canonical_input_skips_parse(self, monkeypatch):
+        """Canonical E.164 input should be validated without parsing."""
+        monkeypatch.setattr(phonenumbers, "parse", None)
+        assert normalize_phone_number("+12025550123") == "+12025550123"
+        with pytest.raises(ValueError, match="Invalid phone number."):
+            normalize_phone_number("+12025550000000")
+
+    @pytest.mark.parametrize(
+        "phone,expected",
+        [
+            ("+1 202-555-0123", "+12025550123"),
+            ("+4402079460958", "+442079460958"),
+            ("tel:+1-202-555-0123", "+12025550123"),
+            ("2025550123;phone-context=+1", "+12025550123"),
+        ],
+    )
+    def test_non_canonical_input_uses_full_parser(self, phone, expected):
+        """Formatted or prefixed input should still normalize to E.164."""
+        assert normalize_phone_number(phone) == expected
+
+    def test_region_hint_accepts_local_format(self):
+        """A default region should let local-format numbers validate."""
+        assert normalize_phone_number("082 123 4567", region="ZA") == "+27821234567"
+        with pytest.raises(ValueError):
+            normalize_phone_number("082 123 4567")
+
+    def test_region_hint_is_part_of_cache_key(self):
+        """Cached results for one region should not leak into another."""
+        phone_number_cache.clear()
+        with pytest.raises(ValueError):
+            validate_phone_number_format("0821234567")
+        assert validate_phone_number_format("0821234567", "ZA") == "+27821234567"
+
+    def test_region_from_context(self):
+        """Context values should override the default region."""
+        assert region_from_context(None, "ZA") == "ZA"
+        assert region_from_context({}, "ZA") == "ZA"
+        assert region_from_context({PHONE_REGION_CONTEXT_KEY: "GB"}, "ZA") == "GB"
+        assert region_from_context(["GB"], "ZA") == "ZA"